@@ -9,20 +9,24 @@ import click
 import sys
 from pathlib import Path
 import subprocess
+from dataclasses import asdict
 from typing import Optional
 
 from rich.console import Console
 from rich.panel import Panel
+from rich.table import Table
 from rich.tree import Tree
 from rich.text import Text
 from rich import print as rprint
 
 from generators import init
+from generators.main import prepare_project_dir, print_summary, resolve_create_config
 from generators.helpers import (
     get_project_name,
     validate_flutter_project,
     generate_page_file,
     update_router,
+    ensure_deferred_page,
     create_feature_layers,
     create_presentation_feature_layers,
     create_domain_entity_layers,
@@ -45,6 +49,18 @@ from generators.helpers import (
     validate_field_name,
     validate_field_type,
     parse_fields_string,
+    parse_fields_with_modifiers,
+    split_field_modifiers,
+    TypeResolutionContext,
+    # Post-processing
+    apply_const_fixes,
+    # Size audit
+    ANALYZE_SIZE_TARGETS,
+    # Profiling
+    FsProfile,
+    # Generated-file manifest
+    close_manifests,
+    manifest_at,
     pascal_case_to_snake_case,
     to_pascal_case_preserve,
     pascal_case_to_camel_case,
@@ -55,7 +71,9 @@ from generators.helpers import (
     create_default_config,
     show_config,
     PROJECT_CONFIG_FILE,
+    LOG_LEVELS,
 )
+from generators.helpers.data_source import MOCK_FORMATS
 from generators.helpers.utils import to_camel_case
 
 # Version
@@ -112,6 +130,31 @@ def print_dry_run_tree(base_path: str, structure: list[tuple[str, list[str]]]) -
     console.print(tree)
 
 
+def print_profile(fs_profile: FsProfile) -> None:
+    """Print the --profile summary."""
+    table = Table(title="⏱  Profile", show_header=False, title_justify="left")
+    table.add_column("Metric", style="cyan")
+    table.add_column("Value", justify="right")
+    table.add_row("Wall time", f"{fs_profile.elapsed:.3f} s")
+    table.add_row("stat / lstat calls", str(fs_profile.stat_calls))
+    table.add_row("scandir / listdir calls", str(fs_profile.listing_calls))
+    table.add_row("Files opened", str(fs_profile.counts["open"]))
+    console.print()
+    console.print(table)
+
+
+def print_manifest_report() -> None:
+    """Save the generated-file manifests and report skipped and backed-up files."""
+    for manifest in close_manifests():
+        if manifest.skipped:
+            print_info(f"{manifest.skipped} generated file{'s' if manifest.skipped != 1 else ''} already up to date (skipped)")
+        if manifest.backed_up:
+            backup_dir = Path(".flutterator") / "backups" / manifest.session
+            print_warning(f"{len(manifest.backed_up)} generated file{'s' if len(manifest.backed_up) != 1 else ''} had local edits; previous versions saved to {backup_dir}/:")
+            for rel in manifest.backed_up:
+                console.print(f"   [dim]{rel}[/dim]")
+
+
 def print_dry_run_footer() -> None:
     """Print dry-run mode footer"""
     console.print()
@@ -197,8 +240,12 @@ def prompt_select_form_model_fields(all_fields: list[dict]) -> list[dict]:
         return selected
 
 
-def run_flutter_commands(project_path: Path) -> None:
-    """Run flutter pub get and build_runner build after project modifications"""
+def run_flutter_commands(project_path: Path, fix_targets: Optional[list[Path]] = None) -> None:
+    """Run flutter pub get and build_runner build after project modifications.
+    
+    ``fix_targets`` are the generated files/folders that get the const
+    ``dart fix`` pass afterwards (skipped when ``defaults.dart_fix`` is off).
+    """
     try:
         print_step("Running flutter pub get...")
         subprocess.run(["flutter", "pub", "get"], cwd=project_path, check=True, capture_output=True)
@@ -210,15 +257,44 @@ def run_flutter_commands(project_path: Path) -> None:
         except subprocess.CalledProcessError:
             print_warning("build_runner not available or failed. You may need to add it as a dev dependency.")
         
+        # After build_runner, so the analyzer sees generated parts
+        if fix_targets and load_config(project_path).dart_fix:
+            run_const_fix(project_path, fix_targets)
+        
         print_success("Dependencies updated!")
     except subprocess.CalledProcessError as e:
         print_warning(f"Could not run flutter commands: {e}")
         print_info("You may need to run 'flutter pub get' manually.")
 
 
+def run_const_fix(project_path: Path, targets: Optional[list[Path]] = None, dry_run: bool = False) -> None:
+    """Run the const ``dart fix`` pass on ``targets`` and print what changed."""
+    print_step("Checking const-correctness (dart fix)..." if dry_run else "Applying const fixes (dart fix)...")
+    try:
+        results = apply_const_fixes(project_path, targets, dry_run=dry_run)
+    except FileNotFoundError:
+        print_warning("dart not found in PATH; const fixes skipped.")
+        return
+    except subprocess.CalledProcessError as e:
+        print_warning(f"dart fix failed: {(e.stderr or '').strip() or e}")
+        return
+    
+    if not results:
+        print_info("No const fixes needed.")
+        return
+    total = sum(sum(fixes.values()) for fixes in results.values())
+    verb = "Would apply" if dry_run else "Applied"
+    print_info(f"{verb} {total} const fix{'es' if total != 1 else ''} in {len(results)} file{'s' if len(results) != 1 else ''}:")
+    for file_name, fixes in sorted(results.items()):
+        details = ", ".join(f"{code} ×{count}" for code, count in sorted(fixes.items()))
+        console.print(f"   [dim]{file_name}[/dim] {details}")
+
+
 @click.group()
 @click.version_option(version=VERSION, prog_name="Flutterator", message="%(prog)s %(version)s")
-def cli():
+@click.option('--profile', is_flag=True, help='Print wall time and filesystem calls (stat, scandir, open) after the command')
+@click.pass_context
+def cli(ctx, profile):
     """
     🚀 Flutterator - CLI to create and manage Flutter projects with DDD architecture.
     
@@ -236,7 +312,12 @@ def cli():
       add-domain          Add a domain entity (model + infrastructure only)
       add-enum            Add a Dart enum to the domain
       add-component       Add a reusable component (form, list, or single)
+      upgrade-storage     Regenerate lib/storage/ with cached SharedPreferences
+      add-instrumentation Add core/performance/ (jank, route and API latency)
+      fix                 Apply const fixes (dart fix) and report changes
+      audit-size          Flag unused dependencies, attribute app size
       list                List pages and domain models
+      manifest            List generated files and whether they were edited
       config              Manage configuration
     
     \b
@@ -244,10 +325,17 @@ def cli():
       • Use --dry-run to preview changes before creating files
       • Use --no-build to skip flutter pub get
       • Create flutterator.yaml for project-specific defaults
+      • Use flutterator --profile <command> to time a command and count filesystem calls
     
     Created by Lorenzo Busi @ GetAutomation
     """
-    pass
+    # Each command starts from the manifests on disk
+    close_manifests()
+    if profile:
+        fs_profile = FsProfile().start()
+        ctx.call_on_close(lambda: print_profile(fs_profile.stop()))
+    # Registered last so it runs before the profile summary
+    ctx.call_on_close(print_manifest_report)
 
 
 @cli.command()
@@ -318,7 +406,45 @@ def config(project_path, init_config, show):
     default=False,
     help='Skip generating .cursor/ rules, agents, skills, and docs/architecture.',
 )
-def create(name, login, no_cursor):
+@click.option(
+    '--http-cache/--no-http-cache',
+    default=None,
+    help='Generate the HTTP cache/dedup interceptor (default from api.http_cache in config).',
+)
+@click.option(
+    '--release-log-level',
+    type=click.Choice(LOG_LEVELS),
+    default=None,
+    help='Minimum Logger level compiled into release builds (default from logging.release_min_level).',
+)
+@click.option(
+    '--api-logger-in-release/--no-api-logger-in-release',
+    default=None,
+    help='Keep ApiLogger in the Dio chain of release builds (default from logging.api_logger_in_release).',
+)
+@click.option(
+    '--fast-startup/--no-fast-startup',
+    default=None,
+    help='Parallel bootstrap, lazy singletons and Timeline spans in main.dart (default from startup.fast_startup).',
+)
+@click.option(
+    '--perf/--no-perf',
+    default=None,
+    help='Generate core/performance/ (frame timings, route build times, API latency) wired to Logger (default from performance.instrumentation).',
+)
+@click.option(
+    '--minimal',
+    is_flag=True,
+    default=False,
+    help='Add only the dependencies the generated code imports (no font_awesome_flutter, collection, ...).',
+)
+@click.option(
+    '--skeleton-cache',
+    is_flag=True,
+    default=False,
+    help='Copy a cached, fully built skeleton for these options instead of running flutter create, pub add and build_runner (built on first use).',
+)
+def create(name, login, no_cursor, http_cache, release_log_level, api_logger_in_release, fast_startup, perf, minimal, skeleton_cache):
     """
     Create a new Flutter project with DDD architecture.
     
@@ -339,6 +465,21 @@ def create(name, login, no_cursor):
       
       # Non-interactive mode
       flutterator create --name my_app --no-login
+      
+      # Cache GET responses (ETag / Cache-Control) and dedup in-flight requests
+      flutterator create --name my_app --http-cache
+      
+      # Parallel bootstrap with a startup timeline trace
+      flutterator create --name my_app --fast-startup
+      
+      # Report jank, route build times and API latency from the field
+      flutterator create --name my_app --perf
+      
+      # Smallest dependency set (check it later with audit-size)
+      flutterator create --name my_app --minimal
+      
+      # Seconds instead of minutes after the first project with the same options
+      flutterator create --name my_app --skeleton-cache
     """
     if name is None:
         name = click.prompt('Project name')
@@ -358,10 +499,20 @@ def create(name, login, no_cursor):
         border_style="cyan"
     ))
 
-    init(flutter_name, login, cursor_setup=not no_cursor)
-    
-    # Run flutter commands after project creation
-    run_flutter_commands(Path(flutter_name))
+    overrides = dict(
+        http_cache=http_cache,
+        release_log_level=release_log_level,
+        api_logger_in_release=api_logger_in_release,
+        fast_startup=fast_startup,
+        perf=perf,
+    )
+    if skeleton_cache:
+        _create_from_skeleton(flutter_name, login, cursor_setup=not no_cursor, minimal=minimal, overrides=overrides)
+    else:
+        init(flutter_name, login, cursor_setup=not no_cursor, minimal=minimal, **overrides)
+        
+        # Run flutter commands after project creation
+        run_flutter_commands(Path(flutter_name), fix_targets=[Path("lib")])
     
     console.print()
     print_success(f"Project '{flutter_name}' created successfully!")
@@ -371,12 +522,71 @@ def create(name, login, no_cursor):
     console.print(f"   [cyan]flutter run[/cyan]")
 
 
+def _create_from_skeleton(flutter_name: str, login: bool, cursor_setup: bool, minimal: bool, overrides: dict) -> None:
+    """create --skeleton-cache: copy the cached skeleton for these options (built on first use) and rename it."""
+    from generators.cursor import copy_cursor_ecosystem
+    from generators.helpers.skeleton import (
+        SKELETON_NAME,
+        find_skeleton,
+        flutter_sdk_version,
+        materialize_skeleton,
+        skeleton_build,
+        skeleton_key,
+    )
+    
+    try:
+        flutter_version = flutter_sdk_version()
+    except (FileNotFoundError, subprocess.CalledProcessError):
+        print_error("Flutter not found in PATH")
+        sys.exit(1)
+    
+    prepare_project_dir(flutter_name)
+    project_path = Path(flutter_name)
+    cfg = resolve_create_config(project_path, **overrides)
+    options = {key: value for key, value in asdict(cfg).items() if key != "_source"}
+    key = skeleton_key(VERSION, flutter_version, {"login": login, "minimal": minimal, "config": options})
+    
+    skeleton = find_skeleton(key)
+    if skeleton is None:
+        print_step(f"Building project skeleton {key} (first create with these options, Flutter {flutter_version})...")
+        with skeleton_build(key):
+            init(SKELETON_NAME, login, cursor_setup=False, minimal=minimal, summary=False, **overrides)
+            run_flutter_commands(Path(SKELETON_NAME), fix_targets=[Path("lib")])
+        skeleton = find_skeleton(key)
+    else:
+        print_info(f"Using cached project skeleton {key}")
+    
+    print_step("Copying skeleton...")
+    rewritten = materialize_skeleton(skeleton, project_path, flutter_name)
+    print_info(f"Renamed the project in {rewritten} files")
+    if cursor_setup:
+        copy_cursor_ecosystem(project_path, login, flutter_name)
+    
+    print_step("Running flutter pub get --offline...")
+    offline = subprocess.run(["flutter", "pub", "get", "--offline"], cwd=project_path, capture_output=True)
+    if offline.returncode != 0:
+        print_warning("Offline resolution failed, running flutter pub get...")
+        try:
+            subprocess.run(["flutter", "pub", "get"], cwd=project_path, check=True, capture_output=True, text=True)
+        except subprocess.CalledProcessError as e:
+            print_error(f"flutter pub get failed: {(e.stderr or '').strip() or e}")
+            print_info(f"The project was created in {project_path}; fix the error and run 'flutter pub get' there.")
+            sys.exit(1)
+    
+    print_summary(flutter_name, login, cfg, cursor_setup=cursor_setup, minimal=minimal)
+
+
 @cli.command()
 @click.option('--name', prompt='Page name', help='Page name (e.g., profile, settings, about)')
 @click.option('--project-path', default='.', help='Path to Flutter project')
 @click.option('--dry-run', is_flag=True, help='Preview without creating files')
 @click.option('--no-build', is_flag=True, help='Skip flutter pub get')
-def add_page(name, project_path, dry_run, no_build):
+@click.option(
+    '--deferred/--eager',
+    default=None,
+    help='Load the page with a deferred import (default from router.deferred_pages in config).',
+)
+def add_page(name, project_path, dry_run, no_build, deferred):
     """
     Add a simple page to an existing Flutter project.
     
@@ -399,12 +609,16 @@ def add_page(name, project_path, dry_run, no_build):
       
       # Skip flutter pub get
       flutterator add-page --name about --no-build
+      
+      # Load the page code on first navigation (smaller initial bundle)
+      flutterator add-page --name reports --deferred
     """
     project_dir = Path(project_path)
     lib_path, project_name = validate_flutter_project(project_dir)
     
     # Load configuration
     cfg = load_config(project_dir)
+    cfg = apply_cli_overrides(cfg, deferred=deferred)
     
     # Convert name to appropriate format
     page_name = name.lower().replace(' ', '_')
@@ -427,6 +641,8 @@ def add_page(name, project_path, dry_run, no_build):
         ])
         console.print()
         console.print("[bold]📝 Would update:[/bold] [cyan]lib/router.dart[/cyan]")
+        if cfg.deferred_pages:
+            console.print("   [dim]Route loads the page with a deferred import (DeferredPage)[/dim]")
         print_dry_run_footer()
         return
     
@@ -444,17 +660,29 @@ def add_page(name, project_path, dry_run, no_build):
     # Generate page file directly in page directory (no presentation folder)
     generate_page_file(page_name, page_dir, project_name)
     
+    updated_files = ["lib/router.dart"]
+    if cfg.deferred_pages:
+        if not (lib_path / "core" / "presentation" / "deferred_page.dart").exists():
+            updated_files.append("lib/core/presentation/deferred_page.dart")
+        ensure_deferred_page(project_name, lib_path)
+    
     # Update router with feature folder (from config)
-    update_router(project_dir, page_name, project_name, folder=feature_folder if feature_folder else None)
+    update_router(
+        project_dir,
+        page_name,
+        project_name,
+        folder=feature_folder if feature_folder else None,
+        deferred=cfg.deferred_pages,
+    )
     
     # Show created structure
     print_created_structure(page_name, [
         ("", [f"{page_name}_page.dart"])
-    ], ["lib/router.dart"])
+    ], updated_files)
     
     # Run flutter commands (respecting --no-build and config)
     if not no_build and cfg.auto_run_build_runner:
-        run_flutter_commands(project_dir)
+        run_flutter_commands(project_dir, fix_targets=[page_dir])
     elif no_build:
         print_info("Skipping flutter pub get and build_runner (--no-build)")
     
@@ -468,6 +696,7 @@ def add_page(name, project_path, dry_run, no_build):
     help=(
         'Fields as name:type,name:type (e.g., "title:string,done:bool"). '
         'Nullable: string?, String?, int?, List<T>?, Map<K,V>?. '
+        'Append @indexed to a scalar or enum field to generate findBy<Field> (e.g., "status:Status@indexed"). '
         'In zsh, quote the value if types contain ? (otherwise the shell reports "no matches found").'
     ),
 )
@@ -485,7 +714,55 @@ def add_page(name, project_path, dry_run, no_build):
     is_flag=True,
     help='Skip repository interface, Retrofit service, and repository (DTO + mapper only)',
 )
-def add_domain(name, fields, folder, project_path, dry_run, no_build, non_interactive, no_repo):
+@click.option(
+    '--bulk',
+    is_flag=True,
+    help='Add createMany/updateMany/deleteMany batch endpoints to services and repository',
+)
+@click.option(
+    '--batch-size',
+    type=click.IntRange(min=1),
+    default=None,
+    help='Items per bulk request (default from api.bulk_batch_size)',
+)
+@click.option(
+    '--local',
+    is_flag=True,
+    help='Add a SQLite DAO and local-first service (DataSource.local) synced with the remote API',
+)
+@click.option(
+    '--index',
+    'index_fields',
+    help='Comma-separated scalar fields stored as indexed SQLite columns (with --local)',
+)
+@click.option(
+    '--reactive',
+    is_flag=True,
+    help='Add watchAll() streams (mock/local push changes, remote is polled); list components subscribe to them',
+)
+@click.option(
+    '--mock-format',
+    type=click.Choice(MOCK_FORMATS),
+    default=None,
+    help='Seed asset format: json (indented), compact (one line) or ndjson (one item per line) (default from mock.format)',
+)
+@click.option(
+    '--mock-items',
+    type=click.IntRange(min=0),
+    default=None,
+    help='Sample items in the seed asset, written one at a time (default from mock.items)',
+)
+@click.option(
+    '--mock-gzip/--no-mock-gzip',
+    default=None,
+    help='Gzip the seed asset (.json.gz / .ndjson.gz); the mock service decodes it with dart:io, so not on web (default from mock.gzip)',
+)
+@click.option(
+    '--rebuild',
+    is_flag=True,
+    help='Regenerate error_localizer.dart and data_source_config.dart from a full domain scan instead of adding only this entity',
+)
+def add_domain(name, fields, folder, project_path, dry_run, no_build, non_interactive, no_repo, bulk, batch_size, local, index_fields, reactive, mock_format, mock_items, mock_gzip, rebuild):
     """
     Add a domain entity (model + infrastructure only).
     
@@ -514,12 +791,38 @@ def add_domain(name, fields, folder, project_path, dry_run, no_build, non_intera
       
       # Nested/deserialization-only entity (no API repository)
       flutterator add-domain --name address --fields "street:string,city:string" --no-repo
+      
+      # Batch endpoints, 50 items per request
+      flutterator add-domain --name reading --fields "value:double" --bulk --batch-size 50
+      
+      # Offline-first entity stored in SQLite, indexed on done
+      flutterator add-domain --name todo --fields "title:string,done:bool" --local --index done
+      
+      # 10,000 seed items, one per line, gzipped
+      flutterator add-domain --name reading --fields "value:double" --mock-items 10000 --mock-format ndjson --mock-gzip
     """
     project_dir = Path(project_path)
     lib_path, project_name = validate_flutter_project(project_dir)
     
     # Load configuration
     cfg = load_config(project_dir)
+    cfg = apply_cli_overrides(cfg, batch_size=batch_size, mock_format=mock_format, mock_items=mock_items, mock_gzip=mock_gzip)
+    
+    if bulk and no_repo:
+        print_error("--bulk requires the repository layer (remove --no-repo)")
+        sys.exit(1)
+    if local and no_repo:
+        print_error("--local requires the repository layer (remove --no-repo)")
+        sys.exit(1)
+    if index_fields and not local:
+        print_error("--index is only used with --local")
+        sys.exit(1)
+    if reactive and no_repo:
+        print_error("--reactive requires the repository layer (remove --no-repo)")
+        sys.exit(1)
+    if cfg.mock_format not in MOCK_FORMATS:
+        print_error(f"Invalid mock.format '{cfg.mock_format}' in config (expected one of: {', '.join(MOCK_FORMATS)})")
+        sys.exit(1)
     
     # Interactive mode - ask for missing parameters (skip if dry-run)
     if not name:
@@ -550,12 +853,13 @@ def add_domain(name, fields, folder, project_path, dry_run, no_build, non_intera
     if folder is None:
         folder = cfg.domain_folder if cfg.domain_folder else "domain"
     
-    # Parse and validate fields
+    # Parse and validate fields (enums/models are scanned once for all fields)
+    type_context = TypeResolutionContext(lib_path, folder)
     field_list = []
     if fields:
         try:
-            parsed_fields = parse_fields_string(fields)
-            for field_name, field_type in parsed_fields:
+            parsed_fields = parse_fields_with_modifiers(fields)
+            for field_name, field_type, modifiers in parsed_fields:
                 # Validate field name
                 is_valid_name, name_error = validate_field_name(field_name)
                 if not is_valid_name:
@@ -563,12 +867,15 @@ def add_domain(name, fields, folder, project_path, dry_run, no_build, non_intera
                     sys.exit(1)
                 
                 # Validate field type
-                is_valid_type, type_error, normalized_type = validate_field_type(field_type, lib_path, folder)
+                is_valid_type, type_error, normalized_type = validate_field_type(field_type, lib_path, folder, context=type_context)
                 if not is_valid_type:
                     print_error(f"Invalid field type '{field_type}' for field '{field_name}': {type_error}")
                     sys.exit(1)
                 
-                field_list.append({"name": field_name, "type": normalized_type})
+                field = {"name": field_name, "type": normalized_type}
+                if 'indexed' in modifiers:
+                    field["indexed"] = True
+                field_list.append(field)
         except ValueError as e:
             print_error(str(e))
             sys.exit(1)
@@ -590,21 +897,49 @@ def add_domain(name, fields, folder, project_path, dry_run, no_build, non_intera
                 print_error(f"Invalid field name: {name_error}")
                 continue
             
-            field_type = click.prompt("Field type (e.g., string, int, String?, List<ModelName>)", default="string")
+            field_type = click.prompt("Field type (e.g., string, int, String?, List<ModelName>, string@indexed)", default="string")
+            try:
+                field_type, modifiers = split_field_modifiers(field_type)
+            except ValueError as e:
+                print_error(str(e))
+                continue
             
             # Validate field type
-            is_valid_type, type_error, normalized_type = validate_field_type(field_type, lib_path, folder)
+            is_valid_type, type_error, normalized_type = validate_field_type(field_type, lib_path, folder, context=type_context)
             if not is_valid_type:
                 print_error(f"Invalid field type: {type_error}")
                 continue
             
-            field_list.append({"name": field_name, "type": normalized_type})
+            field = {"name": field_name, "type": normalized_type}
+            if 'indexed' in modifiers:
+                field["indexed"] = True
+            field_list.append(field)
     
     # Ensure id field exists (add if not present)
     has_id = any(field['name'] == 'id' for field in field_list)
     if not has_id:
         field_list.insert(0, {"name": "id", "type": "string"})
     
+    if any(field.get("indexed") for field in field_list):
+        if no_repo:
+            print_error("@indexed fields require the repository layer (remove --no-repo)")
+            sys.exit(1)
+        from generators.helpers.domain import indexed_query_fields
+        try:
+            indexed_query_fields(field_list, type_context.enums_info)
+        except ValueError as e:
+            print_error(str(e))
+            sys.exit(1)
+    
+    indexed_fields = [f.strip() for f in index_fields.split(',') if f.strip()] if index_fields else []
+    if local:
+        from generators.helpers.data_source import local_index_columns
+        try:
+            local_index_columns(field_list, indexed_fields, known_enums=type_context.enums_info)
+        except ValueError as e:
+            print_error(str(e))
+            sys.exit(1)
+    
     # Build base path for display (use folder name for paths)
     base_path = f"lib/{folder}/{entity_folder_name}"
 
@@ -629,6 +964,13 @@ def add_domain(name, fields, folder, project_path, dry_run, no_build, non_intera
             f"{entity_folder_name}_service_module.dart",
         ]
         infra_files.append(f"{entity_folder_name}_repository.dart")
+    if local:
+        infra_files[-1:-1] = [
+            f"{entity_folder_name}_dao.dart",
+            f"local_{entity_folder_name}_service.dart",
+        ]
+    if reactive:
+        infra_files.insert(-1, f"polling_{entity_folder_name}_service.dart")
     
     # Dry-run mode: show what would be created
     if dry_run:
@@ -638,8 +980,15 @@ def add_domain(name, fields, folder, project_path, dry_run, no_build, non_intera
         console.print(f"   [dim]Class name:[/dim] [blue]{entity_class_name}[/blue]")
         console.print(f"   [dim]Folder name:[/dim] [blue]{entity_folder_name}[/blue]")
         if field_list:
-            fields_str = ', '.join([f"[green]{field['name']}[/green]:[magenta]{field['type']}[/magenta]" for field in field_list])
+            fields_str = ', '.join([f"[green]{field['name']}[/green]:[magenta]{field['type']}[/magenta]{'[dim]@indexed[/dim]' if field.get('indexed') else ''}" for field in field_list])
             console.print(f"   [dim]Fields:[/dim] {fields_str}")
+        if bulk:
+            console.print(f"   [dim]Bulk:[/dim] createMany/updateMany/deleteMany, {cfg.bulk_batch_size} items per request")
+        if local:
+            indexed_str = ', '.join(indexed_fields) if indexed_fields else 'id only'
+            console.print(f"   [dim]Local:[/dim] SQLite DAO (indexes: {indexed_str}), DataSource.local")
+        if reactive:
+            console.print("   [dim]Reactive:[/dim] watchAll() streams (remote polled by a wrapper service)")
         console.print()
         
         print_dry_run_tree(base_path, [
@@ -654,7 +1003,7 @@ def add_domain(name, fields, folder, project_path, dry_run, no_build, non_intera
     console.print(f"   [dim]Class name:[/dim] [blue]{entity_class_name}[/blue]")
     console.print(f"   [dim]Folder name:[/dim] [blue]{entity_folder_name}[/blue]")
     if field_list:
-        fields_str = ', '.join([f"[green]{field['name']}[/green]:[magenta]{field['type']}[/magenta]" for field in field_list])
+        fields_str = ', '.join([f"[green]{field['name']}[/green]:[magenta]{field['type']}[/magenta]{'[dim]@indexed[/dim]' if field.get('indexed') else ''}" for field in field_list])
         console.print(f"   [dim]Fields:[/dim] {fields_str}")
     
     # Create domain directory structure (use folder name for directory)
@@ -671,35 +1020,61 @@ def add_domain(name, fields, folder, project_path, dry_run, no_build, non_intera
         project_name,
         folder,
         no_repo=no_repo,
+        bulk=bulk,
+        batch_size=cfg.bulk_batch_size,
+        local=local,
+        indexed_fields=indexed_fields,
+        reactive=reactive,
+        mock_format=cfg.mock_format,
+        mock_gzip=cfg.mock_gzip,
+        type_context=type_context,
     )
 
-    from generators.templates._core.core_generator import generate_error_localizer, infer_has_login
+    from generators.templates._core.core_generator import infer_has_login, update_error_localizer
+
+    has_login = infer_has_login(lib_path)
 
     if not no_repo:
-        from generators.helpers.data_source import generate_mock_json, regenerate_data_source_config
-        from generators.helpers.feature import find_enums_with_info
+        from generators.helpers.data_source import generate_mock_json, update_data_source_config
 
-        enums_info = find_enums_with_info(lib_path, folder) if lib_path.exists() else {}
         generate_mock_json(
             project_dir,
             entity_folder_name,
             field_list,
-            known_enums=enums_info,
+            known_enums=type_context.enums_info,
+            item_count=cfg.mock_items,
+            mock_format=cfg.mock_format,
+            compress=cfg.mock_gzip,
         )
-        regenerate_data_source_config(
+        update_data_source_config(
             project_name,
             lib_path,
+            entity_folder_name,
             domain_folder=folder,
-            has_login=infer_has_login(lib_path),
+            has_login=has_login,
+            rebuild=rebuild,
         )
     
-    # Regenerate error_localizer with the newly added domain failure
-
-    generate_error_localizer(
+    if local:
+        from generators.config.pubspec import add_multiple_dependencies
+        from generators.helpers.data_source import missing_local_dependencies
+        
+        missing = missing_local_dependencies(project_dir)
+        if missing and not no_build:
+            add_multiple_dependencies(project_dir, missing)
+            print_step(f"Added dependencies: {', '.join(missing)}")
+        elif missing:
+            print_info(f"Run: flutter pub add {' '.join(missing)}")
+    
+    # Add the new domain failure to error_localizer (full regeneration with --rebuild)
+    update_error_localizer(
         project_name,
         lib_path,
+        entity_folder_name,
+        entity_class_name,
         domain_folder=folder,
-        has_login=infer_has_login(lib_path),
+        has_login=has_login,
+        rebuild=rebuild,
     )
     
     # Show created structure
@@ -710,7 +1085,7 @@ def add_domain(name, fields, folder, project_path, dry_run, no_build, non_intera
     
     # Run Flutter commands (respecting --no-build and config)
     if not no_build and cfg.auto_run_build_runner:
-        run_flutter_commands(project_dir)
+        run_flutter_commands(project_dir, fix_targets=[domain_dir])
     elif no_build:
         print_info("Skipping flutter pub get and build_runner (--no-build)")
     
@@ -1006,7 +1381,7 @@ def add_bottom_nav_item(name, project_path, dry_run, no_build):
     
     # Run Flutter commands (respecting --no-build and config)
     if not no_build and cfg.auto_run_build_runner:
-        run_flutter_commands(project_dir)
+        run_flutter_commands(project_dir, fix_targets=[home_dir, lib_path / "core" / "presentation" / "bottom_nav_bar.dart"])
     elif no_build:
         print_info("Skipping flutter pub get and build_runner (--no-build)")
     
@@ -1252,13 +1627,14 @@ def add_component(
     elif component_type == 'form' and fields:
         try:
             parsed_fields = parse_fields_string(fields)
+            type_context = TypeResolutionContext(lib_path, domain_folder_for_field_types)
             for field_name, field_type in parsed_fields:
                 is_valid_name, name_error = validate_field_name(field_name)
                 if not is_valid_name:
                     print_error(f"Invalid field name '{field_name}': {name_error}")
                     sys.exit(1)
                 is_valid_type, type_error, normalized_type = validate_field_type(
-                    field_type, lib_path, domain_folder_for_field_types
+                    field_type, lib_path, domain_folder_for_field_types, context=type_context
                 )
                 if not is_valid_type:
                     print_error(f"Invalid field type '{field_type}' for field '{field_name}': {type_error}")
@@ -1365,15 +1741,336 @@ def add_component(
             ("presentation", [f"{component_name}_component.dart"])
         ])
 
+    # Projects created with --minimal get rxdart only once a form needs it
+    from generators.config.pubspec import FORM_DEPENDENCIES, add_multiple_dependencies, missing_dependencies
+    from generators.helpers.size_audit import scan_package_imports
+    
+    missing = missing_dependencies(project_dir, [pkg for pkg in scan_package_imports(component_dir) if pkg in FORM_DEPENDENCIES])
+    if missing and not no_build:
+        add_multiple_dependencies(project_dir, missing)
+        print_step(f"Added dependencies: {', '.join(missing)}")
+    elif missing:
+        print_info(f"Run: flutter pub add {' '.join(missing)}")
+    
     # Run Flutter commands (respecting --no-build and config)
     if not no_build and cfg.auto_run_build_runner:
-        run_flutter_commands(project_dir)
+        run_flutter_commands(project_dir, fix_targets=[component_dir])
     elif no_build:
         print_info("Skipping flutter pub get and build_runner (--no-build)")
     
     print_success(f"Component '{component_name}' added successfully!")
 
 
+@cli.command()
+@click.option('--project-path', default='.', help='Path to Flutter project')
+@click.option('--dry-run', is_flag=True, help='Preview without creating files')
+@click.option('--force', is_flag=True, help='Overwrite existing storage files without prompting')
+@click.option('--no-build', is_flag=True, help='Skip flutter pub get')
+def upgrade_storage(project_path, dry_run, force, no_build):
+    """
+    Upgrade lib/storage/ to the preloaded SharedPreferences repository.
+    
+    \b
+    Regenerates:
+      storage/storage_repository.dart        (cached tokens, no getInstance() per call)
+      storage/storage_injectable_module.dart (@preResolve SharedPreferences)
+    
+    \b
+    Examples:
+      flutterator upgrade-storage --dry-run
+      
+      flutterator upgrade-storage --force
+    """
+    from generators.templates.storage.storage_generator import STORAGE_FILES, generate_files as generate_storage_files
+
+    project_dir = Path(project_path)
+    lib_path, project_name = validate_flutter_project(project_dir)
+    
+    # Load configuration
+    cfg = load_config(project_dir)
+    
+    if dry_run:
+        print_dry_run_header()
+        console.print("[bold]💾 Would regenerate storage layer[/bold]")
+        console.print()
+        print_dry_run_tree("lib", [
+            ("storage", [Path(rel).name for rel in STORAGE_FILES])
+        ])
+        print_dry_run_footer()
+        return
+    
+    repository_path = lib_path / STORAGE_FILES[0]
+    if repository_path.exists() and not force:
+        if not click.confirm(f"⚠️  lib/{STORAGE_FILES[0]} will be overwritten. Continue?"):
+            print_info("Aborted.")
+            return
+    
+    generate_storage_files(project_name, lib_path, config=cfg)
+    for rel in STORAGE_FILES:
+        print_step(f"Regenerated lib/{rel}")
+    
+    # StorageRepository now needs SharedPreferences from DI: manual constructions must be updated
+    for dart_file in lib_path.rglob("*.dart"):
+        if "StorageRepository()" in dart_file.read_text(encoding="utf-8"):
+            print_warning(
+                f"{dart_file.relative_to(project_dir)} constructs StorageRepository() directly; "
+                "resolve it with getIt<StorageRepository>() instead."
+            )
+    
+    # Run Flutter commands (respecting --no-build and config)
+    if not no_build and cfg.auto_run_build_runner:
+        run_flutter_commands(project_dir, fix_targets=[lib_path / "storage"])
+    elif no_build:
+        print_info("Skipping flutter pub get and build_runner (--no-build)")
+        print_info("Run build_runner to register the new StorageInjectableModule.")
+    
+    print_success("Storage layer upgraded!")
+
+
+@cli.command()
+@click.option('--project-path', default='.', help='Path to Flutter project')
+@click.option('--dry-run', is_flag=True, help='Preview without creating files')
+@click.option('--force', is_flag=True, help='Overwrite existing core/performance/ files without prompting')
+@click.option('--no-build', is_flag=True, help='Skip flutter pub get')
+def add_instrumentation(project_path, dry_run, force, no_build):
+    """
+    Add field performance instrumentation to an existing project.
+    
+    \b
+    Creates lib/core/performance/:
+      performance_monitor.dart         (aggregates, reports through Logger)
+      frame_timing_collector.dart      (SchedulerBinding.addTimingsCallback, jank)
+      latency_histogram.dart           (fixed-bucket p50/p95 per endpoint)
+      performance_route_observer.dart  (time to first frame per route)
+      api_latency_interceptor.dart     (Dio interceptor)
+    
+    \b
+    Wires it into:
+      router.dart                      (GoRouter observers)
+      main.dart                        (PerformanceMonitor.start() before runApp)
+      apis/core/api_injectable_module.dart (first Dio interceptor)
+    
+    Thresholds come from performance: in flutterator.yaml. New projects can
+    use `flutterator create --perf` instead.
+    
+    \b
+    Examples:
+      flutterator add-instrumentation --dry-run
+      
+      flutterator add-instrumentation --force
+    """
+    from generators.helpers.instrumentation import MANUAL, MANUAL_HINTS, WIRED, wire_instrumentation
+    from generators.templates.performance.performance_generator import PERFORMANCE_FILES, generate_files as generate_performance_files, report_level
+
+    project_dir = Path(project_path)
+    lib_path, project_name = validate_flutter_project(project_dir)
+    
+    # Load configuration
+    cfg = load_config(project_dir)
+    
+    if dry_run:
+        print_dry_run_header()
+        console.print("[bold]📈 Would add performance instrumentation[/bold]")
+        console.print()
+        print_dry_run_tree("lib", [
+            ("core/performance", [Path(rel).name for rel in PERFORMANCE_FILES])
+        ])
+        console.print()
+        console.print("[bold]Would update:[/bold]")
+        for rel in MANUAL_HINTS:
+            console.print(f"   [dim]lib/{rel}[/dim]")
+        print_dry_run_footer()
+        return
+    
+    monitor_path = lib_path / PERFORMANCE_FILES[0]
+    if monitor_path.exists() and not force:
+        if not click.confirm(f"⚠️  lib/core/performance/ already exists and will be overwritten. Continue?"):
+            print_info("Aborted.")
+            return
+    
+    generate_performance_files(project_name, lib_path, config=cfg)
+    for rel in PERFORMANCE_FILES:
+        print_step(f"Created lib/{rel}")
+    
+    for rel, status in wire_instrumentation(lib_path, project_name).items():
+        if status == WIRED:
+            print_step(f"Updated lib/{rel}")
+        elif status == MANUAL:
+            print_warning(f"Could not update lib/{rel} automatically; add: {MANUAL_HINTS[rel]}")
+    
+    # Run Flutter commands (respecting --no-build and config)
+    if not no_build and cfg.auto_run_build_runner:
+        run_flutter_commands(project_dir, fix_targets=[lib_path / "core" / "performance"])
+    elif no_build:
+        print_info("Skipping flutter pub get and build_runner (--no-build)")
+        print_info("Run build_runner to register PerformanceMonitor and its collectors.")
+    
+    print_success("Performance instrumentation added!")
+    level = report_level(cfg)
+    if cfg.log_release_min_level in LOG_LEVELS and LOG_LEVELS.index(cfg.log_release_min_level) > LOG_LEVELS.index(level):
+        print_info(
+            f"Reports are logged at {level} level; release builds drop it (logging.release_min_level: "
+            f"{cfg.log_release_min_level}). Raise performance.report_level to get reports from the field."
+        )
+
+
+@cli.command(name='fix')
+@click.option('--project-path', default='.', help='Path to Flutter project')
+@click.option(
+    '--path',
+    'paths',
+    multiple=True,
+    help='File or folder to fix, relative to the project (repeatable; default: lib)',
+)
+@click.option('--dry-run', is_flag=True, help='Only report the const fixes that would be applied')
+def fix_const(project_path, paths, dry_run):
+    """
+    Apply const fixes (dart fix) to the project and report what changed.
+    
+    Runs automatically on generated files after build_runner unless
+    defaults.dart_fix is false in flutterator.yaml.
+    
+    \b
+    Examples:
+      flutterator fix --dry-run
+      
+      flutterator fix --path lib/features/components
+    """
+    project_dir = Path(project_path)
+    validate_flutter_project(project_dir)
+    run_const_fix(project_dir, [Path(p) for p in paths] or None, dry_run=dry_run)
+
+
+@cli.command()
+@click.option('--project-path', default='.', help='Path to Flutter project')
+@click.option(
+    '--analyze-size',
+    is_flag=True,
+    help='Also run flutter build --analyze-size and attribute the Dart code size',
+)
+@click.option(
+    '--target',
+    type=click.Choice(ANALYZE_SIZE_TARGETS),
+    default='apk',
+    show_default=True,
+    help='Build target for --analyze-size',
+)
+@click.option('--analysis-file', type=click.Path(exists=True, dir_okay=False), default=None, help='Use an existing *-code-size-analysis_*.json instead of building')
+@click.option('--top', default=15, show_default=True, help='Number of size entries to show')
+def audit_size(project_path, analyze_size, target, analysis_file, top):
+    """
+    Audit dependencies and code size of the project.
+    
+    Cross-references the package: imports under lib/ with pubspec.yaml and
+    flags dependencies nothing imports. With --analyze-size (or
+    --analysis-file) the Dart AOT size is attributed to packages and to the
+    top-level folders of the app (core, features, domain, ...).
+    
+    \b
+    Examples:
+      flutterator audit-size
+      
+      flutterator audit-size --analyze-size --target apk
+    """
+    from generators.helpers.size_audit import attribute_size, audit_dependencies, load_size_analysis, run_size_analysis
+
+    project_dir = Path(project_path)
+    _, project_name = validate_flutter_project(project_dir)
+    
+    audit = audit_dependencies(project_dir, project_name)
+    
+    table = Table(show_header=True, header_style="bold cyan")
+    table.add_column("Dependency")
+    table.add_column("Status")
+    table.add_column("Imported by", style="dim")
+    for package, files in sorted(audit["used"].items()):
+        table.add_row(package, "[green]used[/green]", f"{len(files)} file{'s' if len(files) != 1 else ''}")
+    for package, reason in sorted(audit["implicit"].items()):
+        table.add_row(package, "[blue]implicit[/blue]", reason)
+    for package in audit["unused"]:
+        table.add_row(package, "[yellow]unused[/yellow]", "-")
+    console.print(Panel(table, title="📦 Dependencies (pubspec.yaml vs lib/ imports)", border_style="blue"))
+    
+    if audit["unused"]:
+        print_warning(f"{len(audit['unused'])} unused dependencies: flutter pub remove {' '.join(audit['unused'])}")
+    else:
+        print_success("Every dependency is imported by lib/")
+    if audit["undeclared"]:
+        print_error(f"Imported but not declared in dependencies: {', '.join(audit['undeclared'])}")
+    
+    if not (analyze_size or analysis_file):
+        return
+    
+    if analysis_file is None:
+        print_step(f"Running flutter build {target} --analyze-size...")
+        try:
+            analysis_file = run_size_analysis(project_dir, target)
+        except FileNotFoundError:
+            print_error("Flutter not found in PATH")
+            sys.exit(1)
+        except subprocess.CalledProcessError as e:
+            print_error(f"flutter build failed: {e.stderr or e}")
+            sys.exit(1)
+        except RuntimeError as e:
+            print_error(str(e))
+            sys.exit(1)
+    
+    sizes = attribute_size(load_size_analysis(analysis_file), project_name)
+    total = sum(sizes.values()) or 1
+    size_table = Table(show_header=True, header_style="bold cyan")
+    size_table.add_column("Owner")
+    size_table.add_column("Size", justify="right")
+    size_table.add_column("Share", justify="right")
+    for owner, size in sorted(sizes.items(), key=lambda item: item[1], reverse=True)[:top]:
+        style = "bold" if owner.startswith(f"{project_name}/") else ""
+        size_table.add_row(f"[{style}]{owner}[/{style}]" if style else owner, f"{size / 1024:.1f} KB", f"{size * 100 / total:.1f}%")
+    console.print(Panel(size_table, title=f"📏 Dart code size ({Path(analysis_file).name})", border_style="blue"))
+    print_info("Open the analysis in DevTools (App Size tool) for the full tree.")
+
+
+@cli.command(name='manifest')
+@click.option('--project-path', default='.', help='Path to Flutter project')
+@click.option('--modified', 'modified_only', is_flag=True, help='Only show files edited or deleted since they were generated')
+def show_manifest(project_path, modified_only):
+    """
+    List generated files from .flutterator/manifest.json.
+    
+    Every file rendered from a template is recorded with its template, a hash
+    of the template and of its inputs, and a hash of the output. The status
+    column tells whether the file was edited (modified) or deleted (missing)
+    since Flutterator wrote it; regenerating a modified file backs it up to
+    .flutterator/backups/ first.
+    
+    \b
+    Examples:
+      flutterator manifest
+      
+      flutterator manifest --modified
+    """
+    project_dir = Path(project_path)
+    validate_flutter_project(project_dir)
+    
+    manifest = manifest_at(project_dir)
+    if manifest is None or not manifest.entries:
+        print_info("No generated files recorded yet (.flutterator/manifest.json is created by the next generation)")
+        return
+    
+    statuses = {rel: manifest.file_status(rel) for rel in sorted(manifest.entries)}
+    counts = {status: list(statuses.values()).count(status) for status in ("unchanged", "modified", "missing")}
+    styles = {"unchanged": "green", "modified": "yellow", "missing": "red"}
+    
+    table = Table(show_header=True, header_style="bold cyan")
+    table.add_column("File", overflow="fold")
+    table.add_column("Template", style="dim", overflow="fold")
+    table.add_column("Status")
+    for rel, status in statuses.items():
+        if modified_only and status == "unchanged":
+            continue
+        table.add_row(rel, manifest.entries[rel]["template"], f"[{styles[status]}]{status}[/{styles[status]}]")
+    console.print(Panel(table, title=f"🧾 Generated files ({len(statuses)})", border_style="blue"))
+    print_info(f"{counts['unchanged']} unchanged, {counts['modified']} modified, {counts['missing']} missing")
+
+
 @cli.command(name='list')
 @click.option('--project-path', default='.', help='Path to Flutter project')
 def list_resources(project_path):
@@ -1427,15 +2124,17 @@ def _list_pages_from_router(project_dir: Path, project_name: str) -> None:
         # Extract imports for pages
         # Pattern: import 'package:{project_name}/features/{name}/{name}_page.dart';
         # Pattern: import 'package:{project_name}/features/{name}/{name}_screen.dart';
-        import_pattern = rf"import\s+['\"]package:{re.escape(project_name)}/features/(\w+)/(\w+)_(?:page|screen)\.dart['\"];"
+        # Pattern: import '...{name}_page.dart' deferred as {name}_page;   (add-page --deferred)
+        import_pattern = rf"import\s+['\"]package:{re.escape(project_name)}/features/(\w+)/(\w+)_(page|screen)\.dart['\"](?:\s+deferred\s+as\s+(\w+))?\s*;"
         
         import_matches = re.finditer(import_pattern, content)
         page_classes = {}  # class_name -> {page_name, file_path}
+        deferred_prefixes = {}  # deferred import prefix -> class_name
         
         for match in import_matches:
             page_folder = match.group(1)
             page_file = match.group(2)
-            file_type = 'screen' if 'screen' in match.group(0) else 'page'
+            file_type = match.group(3)
             
             # Determine class name from file name
             # home_page.dart -> HomePage, settings_page.dart -> SettingsPage
@@ -1444,8 +2143,11 @@ def _list_pages_from_router(project_dir: Path, project_name: str) -> None:
             page_classes[class_name] = {
                 'page_name': page_folder,
                 'file_path': f"lib/features/{page_folder}/{page_file}_{file_type}.dart",
-                'file_type': file_type
+                'file_type': file_type,
+                'deferred': match.group(4) is not None,
             }
+            if match.group(4):
+                deferred_prefixes[match.group(4)] = class_name
         
         # Extract routes from GoRoute
         # Pattern: GoRoute(path: HomePage.routeName, builder: ... => const HomePage(),)
@@ -1475,10 +2177,17 @@ def _list_pages_from_router(project_dir: Path, project_name: str) -> None:
                 
                 # Extract class name from builder
                 class_match = re.search(builder_pattern, block_content, re.DOTALL)
-                if not class_match:
-                    continue
-                
-                class_name = class_match.group(1)
+                if class_match:
+                    class_name = class_match.group(1)
+                else:
+                    # Deferred builder: DeferredPage(..., builder: (...) => prefix.ClassName())
+                    class_name = None
+                    for prefix_match in re.finditer(r"\b(\w+)\.(\w+)\s*\(", block_content):
+                        if prefix_match.group(1) in deferred_prefixes and prefix_match.group(2) != 'loadLibrary':
+                            class_name = deferred_prefixes[prefix_match.group(1)]
+                            break
+                    if not class_name:
+                        continue
                 
                 if class_name not in page_classes:
                     continue
@@ -1525,7 +2234,8 @@ def _list_pages_from_router(project_dir: Path, project_name: str) -> None:
                     'name': page_info['page_name'],
                     'path': path,
                     'class': class_name,
-                    'file_path': page_info['file_path']
+                    'file_path': page_info['file_path'],
+                    'deferred': page_info['deferred'],
                 })
         
     except Exception as e:
@@ -1536,7 +2246,8 @@ def _list_pages_from_router(project_dir: Path, project_name: str) -> None:
         console.print()
         console.print("[bold blue]📄 Pages:[/bold blue]")
         for page in sorted(pages, key=lambda x: x['path']):
-            console.print(f"   [green]{page['path']:<20}[/green] → [cyan]{page['class']:<20}[/cyan] [dim]({page['file_path']})[/dim]")
+            deferred_tag = " [yellow](deferred)[/yellow]" if page['deferred'] else ""
+            console.print(f"   [green]{page['path']:<20}[/green] → [cyan]{page['class']:<20}[/cyan] [dim]({page['file_path']})[/dim]{deferred_tag}")
     else:
         console.print()
         console.print("[dim]📄 No pages found in router.dart[/dim]")
@@ -1,13 +1,20 @@
-
 # move assets folder with his contents to lib/assets 
-import os
-import shutil
+from concurrent.futures import Executor, Future
+from functools import partial
 from pathlib import Path
+from typing import List, Optional
+
+from generators.helpers.file_copy import copy_file, submit_all
 
 BASE_DIR = Path(__file__).parent 
 STATIC_DIR = BASE_DIR.parent / "static"
 
-def move_assets_to_lib(project_name):
+def move_assets_to_lib(project_name, executor: Optional[Executor] = None) -> List[Future]:
+    """Copy generators/static/assets/ into <project>/assets/, one job per file.
+
+    With an ``executor`` the copies run on it and their futures are returned;
+    otherwise they are done before returning.
+    """
     flutter_name = project_name.lower().replace(" ", "_")
     project_path = Path(flutter_name)
     assets_src = STATIC_DIR / "assets"
@@ -15,16 +22,15 @@ def move_assets_to_lib(project_name):
     
     if not assets_src.exists():
         print(f"Source assets folder {assets_src} does not exist.")
-        return
+        return []
     
     # Create destination directory if it doesn't exist
     assets_dst.mkdir(parents=True, exist_ok=True)
     
-    # Move all files from assets_src to assets_dst
-    for item in assets_src.iterdir():
-        dest = assets_dst / item.name
-        if item.is_dir():
-            shutil.copytree(item, dest, dirs_exist_ok=True)
-        else:
-            shutil.copy2(item, dest)
-    
\ No newline at end of file
+    # Copy every file, keeping the folder layout (svgs/, mock/, ...)
+    jobs = [
+        partial(copy_file, item, assets_dst / item.relative_to(assets_src))
+        for item in sorted(assets_src.rglob("*"))
+        if item.is_file()
+    ]
+    return submit_all(jobs, executor)
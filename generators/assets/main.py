@@ -1,4 +1,4 @@
 from .assets import move_assets_to_lib
 
-def copy_assets(project_name):
-    move_assets_to_lib(project_name)
+def copy_assets(project_name, executor=None):
+    return move_assets_to_lib(project_name, executor=executor)
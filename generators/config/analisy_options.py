@@ -13,7 +13,10 @@ linter:
     - always_use_package_imports
     - avoid_relative_lib_imports
     - prefer_const_constructors
+    - prefer_const_constructors_in_immutables
     - prefer_const_declarations
+    - prefer_const_literals_to_create_immutables
+    - unnecessary_const
     - always_declare_return_types
     - always_specify_types
 
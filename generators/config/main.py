@@ -1,11 +1,11 @@
 # import click
 
-from .pubspec import update_pubspec
+from .pubspec import optional_dependencies, update_pubspec
 from .analisy_options import update_analysis_options
 
-def generate_config_files(lib_path, has_login, project_name):
+def generate_config_files(lib_path, has_login, project_name, config=None, minimal=False):
     # Create pubspec.yaml
-    update_pubspec(project_name, has_login)
+    update_pubspec(project_name, has_login, extra_dependencies=optional_dependencies(config), minimal=minimal)
 
     # Create analysis_options.yaml
     update_analysis_options(project_name)
@@ -1,35 +1,68 @@
+import re
 import subprocess
 import sys
 from pathlib import Path
 
-def update_pubspec(flutter_name, has_login):
+def optional_dependencies(config) -> list:
+    """Packages required only by opt-in generated features (see flutterator.yaml)."""
+    packages = []
+    if config is not None and config.http_cache and config.http_cache_disk:
+        packages.append("path_provider")
+    return packages
+
+
+# Packages imported by the code every project gets from `create` (or by later
+# add-domain / add-component output); `create --minimal` installs only these
+CORE_DEPENDENCIES = [
+    "dartz",
+    "freezed_annotation",
+    "flutter_bloc",
+    "provider",
+    "injectable",
+    "get_it",
+    "bloc",
+    "caravaggio_ui",
+    "uuid",
+    "shared_preferences",
+    "dio",
+    "retrofit",
+    "go_router",
+    "json_annotation",
+    "intl",
+    "meta",
+]
+
+# Imported only by the sign-in form (`create --login`)
+LOGIN_DEPENDENCIES = ["another_flushbar", "flutter_svg"]
+
+# Imported only by form components with debounced fields (add-component adds it on demand)
+FORM_DEPENDENCIES = ["rxdart"]
+
+# Not imported by any generated file; kept in the full preset for hand-written code
+CONVENIENCE_DEPENDENCIES = ["flutter_lints", "font_awesome_flutter", "collection"]
+
+
+def main_dependencies_for(has_login: bool, minimal: bool = False) -> list:
+    """Runtime packages added by `create`: everything, or with ``minimal`` only what the chosen features import."""
+    if not minimal:
+        return CORE_DEPENDENCIES + LOGIN_DEPENDENCIES + FORM_DEPENDENCIES + CONVENIENCE_DEPENDENCIES
+    return CORE_DEPENDENCIES + (LOGIN_DEPENDENCIES if has_login else [])
+
+
+def missing_dependencies(project_path: Path, packages: list) -> list:
+    """Return the ``packages`` not yet declared in pubspec.yaml."""
+    pubspec = Path(project_path) / "pubspec.yaml"
+    content = pubspec.read_text(encoding="utf-8") if pubspec.is_file() else ""
+    return [pkg for pkg in packages if not re.search(rf"^\s+{pkg}:", content, re.MULTILINE)]
+
+
+def update_pubspec(flutter_name, has_login, extra_dependencies=None, minimal=False):
     """Aggiunge dipendenze al pubspec.yaml usando flutter pub add"""
     project_path = Path(flutter_name)
     
     # Main dependencies required
-    main_dependencies = [
-        "dartz",
-        "freezed_annotation", 
-        "flutter_bloc",
-        "provider",
-        "injectable",
-        "get_it",
-        "bloc",
-        "another_flushbar",
-        "flutter_lints",
-        "caravaggio_ui",
-        "font_awesome_flutter",
-        "uuid",
-        "collection", 
-        "rxdart",
-        "flutter_svg",
-        "shared_preferences",
-        "dio",
-        "retrofit",
-        "go_router",
-        "json_annotation",
-        "intl",
-    ]
+    main_dependencies = main_dependencies_for(has_login, minimal=minimal)
+    main_dependencies += [pkg for pkg in (extra_dependencies or []) if pkg not in main_dependencies]
     
     # Dipendenze di sviluppo
     dev_dependencies = [
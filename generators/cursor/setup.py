@@ -2,47 +2,60 @@
 
 from __future__ import annotations
 
-import shutil
+from concurrent.futures import Executor, Future
+from functools import lru_cache, partial
 from pathlib import Path
+from typing import Callable, Optional
 
 from jinja2 import Template
 
+from generators.helpers.file_copy import copy_file, submit_all
+
 CURSOR_STATIC_DIR = Path(__file__).resolve().parent.parent / "static" / "cursor"
 
 JINJA_KWARGS = {"variable_start_string": "[[", "variable_end_string": "]]"}
 
 
-def _render_template_text(content: str, context: dict) -> str:
-    template = Template(content, **JINJA_KWARGS)
-    return template.render(**context)
+@lru_cache(maxsize=None)
+def _load_template(src: Path) -> Template:
+    """Compiled template of ``src``, once per process."""
+    return Template(src.read_text(encoding="utf-8"), **JINJA_KWARGS)
 
 
 def _render_file(src: Path, dest: Path, context: dict) -> None:
     dest.parent.mkdir(parents=True, exist_ok=True)
-    rendered = _render_template_text(src.read_text(encoding="utf-8"), context)
+    rendered = _load_template(src).render(**context)
     dest.write_text(rendered, encoding="utf-8")
 
 
-def _copy_static_file(src: Path, dest: Path) -> None:
-    dest.parent.mkdir(parents=True, exist_ok=True)
-    shutil.copy2(src, dest)
-
-
-def _copy_skill(skill_src: Path, skill_dest: Path, context: dict) -> None:
-    """Copy or render a single skill directory into the project."""
-    for src in skill_src.rglob("*"):
+def _skill_jobs(skill_src: Path, skill_dest: Path, context: dict) -> list[Callable[[], None]]:
+    """Copy or render jobs for a single skill directory."""
+    jobs = []
+    for src in sorted(skill_src.rglob("*")):
         if src.is_dir():
             continue
         rel = src.relative_to(skill_src)
         dest = skill_dest / rel
         if src.suffix == ".jinja":
-            _render_file(src, dest.with_suffix(""), context)
+            jobs.append(partial(_render_file, src, dest.with_suffix(""), context))
         else:
-            _copy_static_file(src, dest)
-
-
-def copy_cursor_ecosystem(project_path: Path, login: bool, project_name: str) -> None:
-    """Render Cursor rules, agents, skills, docs, and AGENTS.md into the project."""
+            jobs.append(partial(copy_file, src, dest))
+    return jobs
+
+
+def copy_cursor_ecosystem(
+    project_path: Path,
+    login: bool,
+    project_name: str,
+    *,
+    executor: Optional[Executor] = None,
+) -> list[Future]:
+    """Render Cursor rules, agents, skills, docs, and AGENTS.md into the project.
+
+    With an ``executor`` each file is copied or rendered as a separate job and
+    the futures are returned for the caller to wait on; otherwise everything is
+    done before returning (and the list is empty).
+    """
     if not CURSOR_STATIC_DIR.is_dir():
         raise FileNotFoundError(f"Cursor templates not found: {CURSOR_STATIC_DIR}")
 
@@ -52,36 +65,35 @@ def copy_cursor_ecosystem(project_path: Path, login: bool, project_name: str) ->
         "has_login": login,
     }
     root = project_path.resolve()
+    jobs: list[Callable[[], None]] = []
 
     rules_src = CURSOR_STATIC_DIR / "rules"
     for src in sorted(rules_src.glob("*.mdc.jinja")):
         if src.name == "login-context.mdc.jinja" and not login:
             continue
         dest_name = src.name.replace(".jinja", "")
-        _render_file(src, root / ".cursor" / "rules" / dest_name, context)
+        jobs.append(partial(_render_file, src, root / ".cursor" / "rules" / dest_name, context))
 
     agents_src = CURSOR_STATIC_DIR / "agents"
     for src in sorted(agents_src.glob("*.md")):
-        _copy_static_file(src, root / ".cursor" / "agents" / src.name)
+        jobs.append(partial(copy_file, src, root / ".cursor" / "agents" / src.name))
 
     skills_src = CURSOR_STATIC_DIR / "skills"
     for skill_dir in sorted(skills_src.iterdir()):
         if not skill_dir.is_dir():
             continue
-        _copy_skill(skill_dir, root / ".cursor" / "skills" / skill_dir.name, context)
+        jobs.extend(_skill_jobs(skill_dir, root / ".cursor" / "skills" / skill_dir.name, context))
 
     arch_src = CURSOR_STATIC_DIR / "docs" / "architecture"
     for src in sorted(arch_src.glob("*.md.jinja")):
         dest_name = src.name.replace(".jinja", "")
-        _render_file(src, root / "docs" / "architecture" / dest_name, context)
+        jobs.append(partial(_render_file, src, root / "docs" / "architecture" / dest_name, context))
 
-    _render_file(
-        CURSOR_STATIC_DIR / "AGENTS.md.jinja",
-        root / "AGENTS.md",
-        context,
-    )
+    jobs.append(partial(_render_file, CURSOR_STATIC_DIR / "AGENTS.md.jinja", root / "AGENTS.md", context))
 
     for rel in ("lib/domain/AGENTS.md", "lib/features/AGENTS.md", "lib/widgets/AGENTS.md"):
-        _copy_static_file(CURSOR_STATIC_DIR / rel, root / rel)
+        jobs.append(partial(copy_file, CURSOR_STATIC_DIR / rel, root / rel))
+
+    jobs.append(partial(copy_file, CURSOR_STATIC_DIR / "docs" / "epics" / "README.md", root / "docs" / "epics" / "README.md"))
 
-    _copy_static_file(CURSOR_STATIC_DIR / "docs" / "epics" / "README.md", root / "docs" / "epics" / "README.md")
+    return submit_all(jobs, executor)
@@ -6,8 +6,12 @@ from .validation import (
     validate_field_type,
     validate_entity_name,
     parse_fields_string,
+    parse_fields_with_modifiers,
+    split_field_modifiers,
     parse_field_type,
 )
+from .dart_type import DartType, parse_dart_type
+from .type_context import TypeResolutionContext
 from .feature import (
     create_feature_layers,
     create_presentation_feature_layers,
@@ -43,14 +47,25 @@ from .navigation import (
     update_home_page_with_bottom_nav,
     create_bottom_nav_widget,
 )
-from .page import generate_page_file, update_router
+from .page import generate_page_file, update_router, ensure_deferred_page
+from .dart_fix import apply_const_fixes, parse_dart_fix_output, CONST_FIX_CODES
+from .instrumentation import wire_instrumentation
+from .size_audit import audit_dependencies, attribute_size, scan_package_imports, ANALYZE_SIZE_TARGETS
+from .discovery import DomainScan
+from .profiling import FsProfile
+from .manifest import Manifest, manifest_at, manifest_for, flush_manifests, close_manifests
 from .config import (
     FlutteratorConfig,
     load_config,
+    load_config_file,
+    clear_config_cache,
+    validate_config_data,
     apply_cli_overrides,
     create_default_config,
     show_config,
     PROJECT_CONFIG_FILE,
     GLOBAL_CONFIG_FILE,
+    LOG_LEVELS,
+    CONFIG_SCHEMA,
 )
 
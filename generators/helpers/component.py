@@ -6,6 +6,10 @@ from typing import Optional, List, Dict
 from generators.templates.copier import generate_file
 from generators.templates._core.core_generator import ensure_common_widgets
 from .utils import to_pascal_case, to_pascal_case_preserve, map_field_type, get_form_field_metadata, PRIMITIVE_TYPES
+from .dart_type import parse_dart_type
+
+# Delay before a typed form field builds/validates its value object
+FORM_VALIDATION_DEBOUNCE_MS = 300
 
 
 def infer_lib_path(component_dir: Path) -> Path:
@@ -74,6 +78,10 @@ def get_repository_info(lib_path: Path, domain_folder: str, model_name: str, mod
         'create': r'\bcreate\s*\(',
         'update': r'\bupdate\s*\(',
         'delete': r'\bdelete\s*\(',
+        'createMany': r'\bcreateMany\s*\(',
+        'updateMany': r'\bupdateMany\s*\(',
+        'deleteMany': r'\bdeleteMany\s*\(',
+        'watchAll': r'\bwatchAll\s*\(',
         'getByAuthId': r'\bgetByAuthId\s*\(',
         'createOrUpdate': r'\bcreateOrUpdate\s*\(',
         'getCurrentUserProfile': r'\bgetCurrentUserProfile\s*\(',
@@ -592,10 +600,18 @@ def generate_form_bloc_from_template(
 
         processed_field_list.append(field_dict)
 
+    # Typed inputs (text / number) rebuild their value object on every keystroke: debounce them
+    debounced_fields = [
+        f['name'] for f in processed_field_list
+        if f['name'] != 'id' and f['control_type'] in ('text', 'number') and f['has_value_object']
+    ]
+
     generate_file(project_name, app_dir, "component/component_form_bloc_template.jinja", f"{component_name}_form_bloc.dart", {
         "component_name": component_name,
         "pascal_name": pascal_name,
         "field_list": processed_field_list,
+        "debounced_fields": debounced_fields,
+        "validation_debounce_ms": FORM_VALIDATION_DEBOUNCE_MS,
         "domain_value_objects_import": domain_value_objects_import,
         "extra_imports": "\n".join(extra_imports),
     })
@@ -649,18 +665,20 @@ def _resolve_entity_field_type(
         3. Known ValueObject – map via *vo_type_map* to underlying primitive
         4. Known enum – keep class name as-is
         5. Dart primitive – lowercase
-        6. Generic collection (``List<T>``, etc.) – returned as-is
-        7. Fallback – ``'string'``
+        6. Generic collection (``List<T>``, etc.) – returned in canonical spelling
+        7. Fallback (including unparseable types) – ``'string'``
     """
-    if raw_type.endswith('?'):
-        base = raw_type[:-1].strip()
-        inner = _resolve_entity_field_type(base, vo_type_map, known_enums)
+    try:
+        parsed = parse_dart_type(raw_type)
+    except ValueError:
+        return 'string'
+
+    if parsed.nullable:
+        inner = _resolve_entity_field_type(str(parsed.non_null), vo_type_map, known_enums)
         return inner if inner.endswith('?') else inner + '?'
 
-    option_match = re.match(r'^Option\s*<\s*(.+)\s*>$', raw_type)
-    if option_match:
-        inner = option_match.group(1).strip()
-        resolved = _resolve_entity_field_type(inner, vo_type_map, known_enums)
+    if parsed.name == 'Option' and len(parsed.args) == 1:
+        resolved = _resolve_entity_field_type(str(parsed.args[0]), vo_type_map, known_enums)
         return resolved if resolved.endswith('?') else resolved + '?'
 
     if raw_type in vo_type_map:
@@ -679,8 +697,8 @@ def _resolve_entity_field_type(
     if raw_type in primitive_map:
         return primitive_map[raw_type]
 
-    if '<' in raw_type and '>' in raw_type:
-        return raw_type
+    if parsed.args:
+        return str(parsed)
 
     return 'string'
 
@@ -876,6 +894,8 @@ def create_component_list_layers(component_dir: Path, component_name: str, proje
     has_create = 'create' in available_methods
     has_update = 'update' in available_methods
     has_delete = 'delete' in available_methods
+    # Reactive repositories (add-domain --reactive): the bloc subscribes instead of refetching
+    has_watch_all = has_get_all and 'watchAll' in available_methods
     
     freezed_mixin_event = "_$" + component_pascal + "Event"
     freezed_mixin_state = "_$" + component_pascal + "State"
@@ -903,13 +923,21 @@ abstract class {component_pascal}Event with {freezed_mixin_event} {{
     (app_dir / f"{component_name}_event.dart").write_text(event_content)
     
     # Create state file
+    # Loaded keeps items indexed by id (insertion-ordered map) so the bloc finds, replaces and
+    # removes an item without scanning the list; each emitted state still costs an O(n)
+    # unmodifiable snapshot of the map, but no getAll() refetch.
     state_content = f"""part of '{component_name}_bloc.dart';
 
 @freezed
 abstract class {component_pascal}State with {freezed_mixin_state} {{
   const factory {component_pascal}State.initial() = Initial;
   const factory {component_pascal}State.loading() = Loading;
-  const factory {component_pascal}State.loaded(List<{domain_model_pascal}> items, {{@Default(false) bool isReloading}}) = Loaded;
+  const factory {component_pascal}State.loaded(
+    Map<String, {domain_model_pascal}> itemsById, {{
+    @Default(0) int revision,
+    @Default(false) bool isReloading,
+    {failure_class}? mutationFailure,
+  }}) = Loaded;
   const factory {component_pascal}State.error({failure_class} failure) = Error;
 }}
 """
@@ -917,15 +945,36 @@ abstract class {component_pascal}State with {freezed_mixin_state} {{
     
     # Build BLoC handlers dynamically
     reload_snippet = f"""final Either<{failure_class}, List<{domain_model_pascal}>> itemsResult = await _repository.getAll();
-        itemsResult.fold(
-          ({failure_class} failure) => emit({component_pascal}State.error(failure)),
-          (List<{domain_model_pascal}> items) => emit({component_pascal}State.loaded(items)),
-        );"""
+          itemsResult.fold(
+            ({failure_class} failure) => emit({component_pascal}State.error(failure)),
+            (List<{domain_model_pascal}> items) => _emitLoaded(emit, replaceWith: items),
+          );"""
     
     on_registrations = []
     handler_methods = []
     
-    if has_get_all:
+    if has_watch_all:
+        on_registrations.append("    on<LoadRequested>(_onLoadRequested);")
+        on_registrations.append("    on<ReloadRequested>(_onReloadRequested);")
+        handler_methods.append(f"""  /// Subscribes to [I{domain_model_pascal}Repository.watchAll] for the bloc's lifetime:
+  /// every list pushed by the data source replaces the items, without refetching.
+  Future<void> _onLoadRequested(LoadRequested event, Emitter<{component_pascal}State> emit) async {{
+    if (_watching) return;
+    _watching = true;
+    emit(const {component_pascal}State.loading());
+    try {{
+      await emit.forEach<Either<{failure_class}, List<{domain_model_pascal}>>>(
+        _repository.watchAll(),
+        onData: (Either<{failure_class}, List<{domain_model_pascal}>> result) => result.fold(
+          ({failure_class} failure) => state is Loaded ? _loaded(mutationFailure: failure) : {component_pascal}State.error(failure),
+          (List<{domain_model_pascal}> items) => _loaded(replaceWith: items),
+        ),
+      );
+    }} finally {{
+      _watching = false;
+    }}
+  }}""")
+    elif has_get_all:
         on_registrations.append("    on<LoadRequested>(_onLoadRequested);")
         on_registrations.append("    on<ReloadRequested>(_onReloadRequested);")
         handler_methods.append(f"""  Future<void> _onLoadRequested(LoadRequested event, Emitter<{component_pascal}State> emit) async {{
@@ -933,59 +982,146 @@ abstract class {component_pascal}State with {freezed_mixin_state} {{
     final Either<{failure_class}, List<{domain_model_pascal}>> result = await _repository.getAll();
     result.fold(
       ({failure_class} failure) => emit({component_pascal}State.error(failure)),
-      (List<{domain_model_pascal}> items) => emit({component_pascal}State.loaded(items)),
+      (List<{domain_model_pascal}> items) => _emitLoaded(emit, replaceWith: items),
     );
   }}""")
+    if has_get_all:
         handler_methods.append(f"""  Future<void> _onReloadRequested(ReloadRequested event, Emitter<{component_pascal}State> emit) async {{
     if (state is! Loaded) return;
-    final Loaded current = state as Loaded;
-    emit(current.copyWith(isReloading: true));
+    _emitLoaded(emit, isReloading: true);
     final Either<{failure_class}, List<{domain_model_pascal}>> result = await _repository.getAll();
     result.fold(
-      ({failure_class} failure) => emit(current.copyWith(isReloading: false)),
-      (List<{domain_model_pascal}> items) => emit({component_pascal}State.loaded(items)),
+      ({failure_class} failure) => _emitLoaded(emit),
+      (List<{domain_model_pascal}> items) => _emitLoaded(emit, replaceWith: items),
     );
   }}""")
     
     if has_create:
         on_registrations.append("    on<CreateRequested>(_onCreateRequested);")
-        handler_methods.append(f"""  Future<void> _onCreateRequested(CreateRequested event, Emitter<{component_pascal}State> emit) async {{
-    emit(const {component_pascal}State.loading());
+        handler_methods.append(f"""  /// Optimistic insert: the item is shown immediately and removed again if the call fails.
+  Future<void> _onCreateRequested(CreateRequested event, Emitter<{component_pascal}State> emit) async {{
+    if (state is! Loaded) {{
+      emit(const {component_pascal}State.loading());
+      final Either<{failure_class}, Unit> result = await _repository.create(event.item);
+      await result.fold(
+        ({failure_class} failure) async => emit({component_pascal}State.error(failure)),
+        (Unit _) async {{
+          {reload_snippet}
+        }},
+      );
+      return;
+    }}
+    final String id = event.item.id.getOrCrash();
+    final {domain_model_pascal}? previous = _itemsById[id];
+    _itemsById[id] = event.item;
+    _emitLoaded(emit);
     final Either<{failure_class}, Unit> result = await _repository.create(event.item);
     result.fold(
-      ({failure_class} failure) => emit({component_pascal}State.error(failure)),
-      (Unit _) async {{
-        {reload_snippet}
+      ({failure_class} failure) {{
+        if (previous != null) {{
+          _itemsById[id] = previous;
+        }} else {{
+          _itemsById.remove(id);
+        }}
+        _emitLoaded(emit, mutationFailure: failure);
       }},
+      (Unit _) {{}},
     );
   }}""")
     
     if has_update:
         on_registrations.append("    on<UpdateRequested>(_onUpdateRequested);")
-        handler_methods.append(f"""  Future<void> _onUpdateRequested(UpdateRequested event, Emitter<{component_pascal}State> emit) async {{
-    emit(const {component_pascal}State.loading());
+        handler_methods.append(f"""  /// Optimistic replace: the previous value is restored if the call fails.
+  Future<void> _onUpdateRequested(UpdateRequested event, Emitter<{component_pascal}State> emit) async {{
+    if (state is! Loaded) {{
+      emit(const {component_pascal}State.loading());
+      final Either<{failure_class}, Unit> result = await _repository.update(event.item);
+      await result.fold(
+        ({failure_class} failure) async => emit({component_pascal}State.error(failure)),
+        (Unit _) async {{
+          {reload_snippet}
+        }},
+      );
+      return;
+    }}
+    final String id = event.item.id.getOrCrash();
+    final {domain_model_pascal}? previous = _itemsById[id];
+    _itemsById[id] = event.item;
+    _emitLoaded(emit);
     final Either<{failure_class}, Unit> result = await _repository.update(event.item);
     result.fold(
-      ({failure_class} failure) => emit({component_pascal}State.error(failure)),
-      (Unit _) async {{
-        {reload_snippet}
+      ({failure_class} failure) {{
+        if (previous != null) {{
+          _itemsById[id] = previous;
+        }} else {{
+          _itemsById.remove(id);
+        }}
+        _emitLoaded(emit, mutationFailure: failure);
       }},
+      (Unit _) {{}},
     );
   }}""")
     
     if has_delete:
         on_registrations.append("    on<DeleteRequested>(_onDeleteRequested);")
-        handler_methods.append(f"""  Future<void> _onDeleteRequested(DeleteRequested event, Emitter<{component_pascal}State> emit) async {{
-    emit(const {component_pascal}State.loading());
+        handler_methods.append(f"""  /// Optimistic remove: the item is restored (at the end of the list) if the call fails.
+  Future<void> _onDeleteRequested(DeleteRequested event, Emitter<{component_pascal}State> emit) async {{
+    if (state is! Loaded) {{
+      emit(const {component_pascal}State.loading());
+      final Either<{failure_class}, Unit> result = await _repository.delete(event.id);
+      await result.fold(
+        ({failure_class} failure) async => emit({component_pascal}State.error(failure)),
+        (Unit _) async {{
+          {reload_snippet}
+        }},
+      );
+      return;
+    }}
+    final {domain_model_pascal}? removed = _itemsById.remove(event.id);
+    _emitLoaded(emit);
     final Either<{failure_class}, Unit> result = await _repository.delete(event.id);
     result.fold(
-      ({failure_class} failure) => emit({component_pascal}State.error(failure)),
-      (Unit _) async {{
-        {reload_snippet}
+      ({failure_class} failure) {{
+        if (removed != null) {{
+          _itemsById[event.id] = removed;
+        }}
+        _emitLoaded(emit, mutationFailure: failure);
       }},
+      (Unit _) {{}},
+    );
+  }}""")
+    
+    handler_methods.append(f"""  /// Emits [Loaded] over the bloc-owned map; [replaceWith] resets its content (load / reload).
+  void _emitLoaded(
+    Emitter<{component_pascal}State> emit, {{
+    List<{domain_model_pascal}>? replaceWith,
+    bool isReloading = false,
+    {failure_class}? mutationFailure,
+  }}) {{
+    emit(_loaded(replaceWith: replaceWith, isReloading: isReloading, mutationFailure: mutationFailure));
+  }}""")
+    handler_methods.append(f"""  {component_pascal}State _loaded({{
+    List<{domain_model_pascal}>? replaceWith,
+    bool isReloading = false,
+    {failure_class}? mutationFailure,
+  }}) {{
+    if (replaceWith != null) {{
+      _itemsById
+        ..clear()
+        ..addEntries(
+          replaceWith.map(({domain_model_pascal} item) => MapEntry<String, {domain_model_pascal}>(item.id.getOrCrash(), item)),
+        );
+    }}
+    // Each state holds its own snapshot: later in-place mutations must not leak into emitted states
+    return {component_pascal}State.loaded(
+      Map<String, {domain_model_pascal}>.unmodifiable(_itemsById),
+      revision: ++_revision,
+      isReloading: isReloading,
+      mutationFailure: mutationFailure,
     );
   }}""")
     
+    watching_field = "\n  bool _watching = false;" if has_watch_all else ""
     on_registrations_str = "\n".join(on_registrations)
     handler_methods_str = "\n\n".join(handler_methods)
     
@@ -1003,6 +1139,10 @@ part '{component_name}_state.dart';
 class {component_pascal}Bloc extends Bloc<{component_pascal}Event, {component_pascal}State> {{
   final I{domain_model_pascal}Repository _repository;
 
+  /// Items by id, mutated in place; each [Loaded.itemsById] is an unmodifiable copy of it.
+  final Map<String, {domain_model_pascal}> _itemsById = <String, {domain_model_pascal}>{{}};
+  int _revision = 0;{watching_field}
+
   {component_pascal}Bloc(this._repository) : super(const {component_pascal}State.initial()) {{
 {on_registrations_str}
   }}
@@ -9,7 +9,7 @@ Supports configuration from multiple sources with priority:
 
 import os
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Dict, Optional, Tuple
 from dataclasses import dataclass, field
 
 import yaml
@@ -23,8 +23,95 @@ DEFAULTS = {
     "domain_folder": "domain",  # Domain entities folder
     "component_folder": "features/components",  # Default components folder
     "auto_run_build_runner": True,
+    "dart_fix": True,
     "primary_color": "#2196F3",
     "secondary_color": "#FF9800",
+    "http_cache": False,
+    "http_cache_max_age": 0,
+    "http_cache_max_entries": 200,
+    "http_cache_disk": True,
+    "http_retries": 2,
+    "http_retry_delay_ms": 300,
+    "http_max_retry_after": 5,
+    "bulk_batch_size": 100,
+    "log_debug_min_level": "verbose",
+    "log_release_min_level": "warning",
+    "api_logger_in_release": False,
+    "deferred_pages": False,
+    "fast_startup": False,
+    "perf_instrumentation": False,
+    "perf_jank_threshold_ms": 16,
+    "perf_report_interval_seconds": 60,
+    "perf_report_level": "warning",
+    "mock_format": "json",
+    "mock_items": 3,
+    "mock_gzip": False,
+}
+
+# Levels accepted by the generated Logger (LoggerLevel names, by severity)
+LOG_LEVELS = ["verbose", "apiReq", "info", "warning", "error", "fatal"]
+
+# Seed asset formats written by add-domain (see data_source.write_mock_items)
+MOCK_FORMATS = ("json", "compact", "ndjson")
+
+# libyaml-backed loader when PyYAML was built with it (same results, several times faster)
+YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Schema of flutterator.yaml / ~/.flutteratorrc: section -> {key: (attribute, type, allowed values)}.
+# Integers are non-negative (counts, sizes and durations).
+_DEFAULTS_SCHEMA = {
+    "feature_folder": ("feature_folder", str, None),
+    "domain_folder": ("domain_folder", str, None),
+    "component_folder": ("component_folder", str, None),
+    "auto_run_build_runner": ("auto_run_build_runner", bool, None),
+    "dart_fix": ("dart_fix", bool, None),
+}
+_STYLING_SCHEMA = {
+    "primary_color": ("primary_color", str, None),
+    "secondary_color": ("secondary_color", str, None),
+}
+CONFIG_SCHEMA = {
+    "defaults": _DEFAULTS_SCHEMA,
+    "styling": _STYLING_SCHEMA,
+    "api": {
+        "http_cache": ("http_cache", bool, None),
+        "http_cache_max_age": ("http_cache_max_age", int, None),
+        "http_cache_max_entries": ("http_cache_max_entries", int, None),
+        "http_cache_disk": ("http_cache_disk", bool, None),
+        "http_retries": ("http_retries", int, None),
+        "http_retry_delay_ms": ("http_retry_delay_ms", int, None),
+        "http_max_retry_after": ("http_max_retry_after", int, None),
+        "bulk_batch_size": ("bulk_batch_size", int, None),
+    },
+    "logging": {
+        "debug_min_level": ("log_debug_min_level", str, LOG_LEVELS),
+        "release_min_level": ("log_release_min_level", str, LOG_LEVELS),
+        "api_logger_in_release": ("api_logger_in_release", bool, None),
+    },
+    "router": {
+        "deferred_pages": ("deferred_pages", bool, None),
+    },
+    "startup": {
+        "fast_startup": ("fast_startup", bool, None),
+    },
+    "performance": {
+        "instrumentation": ("perf_instrumentation", bool, None),
+        "jank_threshold_ms": ("perf_jank_threshold_ms", int, None),
+        "report_interval_seconds": ("perf_report_interval_seconds", int, None),
+        "report_level": ("perf_report_level", str, LOG_LEVELS),
+    },
+    "mock": {
+        "format": ("mock_format", str, MOCK_FORMATS),
+        "items": ("mock_items", int, None),
+        "gzip": ("mock_gzip", bool, None),
+    },
+}
+# Top-level keys: whole-value sections, plus the flat form of the folder/automation/styling keys
+CONFIG_TOP_LEVEL_SCHEMA = {
+    "templates": ("custom_templates", dict, None),
+    "dependencies": ("extra_dependencies", list, None),
+    **_DEFAULTS_SCHEMA,
+    **_STYLING_SCHEMA,
 }
 
 # Config file names
@@ -43,11 +130,48 @@ class FlutteratorConfig:
     
     # Automation
     auto_run_build_runner: bool = True
+    dart_fix: bool = True  # const `dart fix` pass on generated files after build_runner
     
     # UI/Styling
     primary_color: str = "#2196F3"
     secondary_color: str = "#FF9800"
     
+    # Generated API layer (HTTP cache interceptor)
+    http_cache: bool = False
+    http_cache_max_age: int = 0  # seconds, used when the server sends no max-age
+    http_cache_max_entries: int = 200
+    http_cache_disk: bool = True
+    
+    # Generated API layer (AuthInterceptor retry/backoff for idempotent requests)
+    http_retries: int = 2
+    http_retry_delay_ms: int = 300  # first backoff, doubled on every attempt
+    http_max_retry_after: int = 5  # seconds; no retry when Retry-After asks for longer
+    
+    # add-domain --bulk: items per createMany/updateMany/deleteMany request
+    bulk_batch_size: int = 100
+    
+    # Generated logging (compile-time minimum levels)
+    log_debug_min_level: str = "verbose"
+    log_release_min_level: str = "warning"
+    api_logger_in_release: bool = False
+    
+    # Router: add-page imports pages with `deferred as`
+    deferred_pages: bool = False
+    
+    # Startup: parallel bootstrap, lazy singletons, timeline spans in main.dart
+    fast_startup: bool = False
+    
+    # Performance instrumentation: core/performance/ (frame timings, route build times, API latency)
+    perf_instrumentation: bool = False
+    perf_jank_threshold_ms: int = 16  # build or raster phase above this is a janky frame
+    perf_report_interval_seconds: int = 60
+    perf_report_level: str = "warning"  # Logger level of the periodic reports (kept by the default release minimum)
+    
+    # add-domain seed assets (assets/mock/<entity>.json) read by the mock services
+    mock_format: str = "json"  # json | compact | ndjson
+    mock_items: int = 3
+    mock_gzip: bool = False
+    
     # Custom templates (optional paths)
     custom_templates: dict = field(default_factory=dict)
     
@@ -59,49 +183,18 @@ class FlutteratorConfig:
     
     @classmethod
     def from_dict(cls, data: dict, source: str = "unknown") -> "FlutteratorConfig":
-        """Create config from dictionary."""
+        """Create config from a parsed config file (see ``validate_config_data``)."""
         config = cls()
-        
-        # Map nested 'defaults' section
-        if "defaults" in data:
-            defaults = data["defaults"]
-            if "feature_folder" in defaults:
-                config.feature_folder = defaults["feature_folder"]
-            if "domain_folder" in defaults:
-                config.domain_folder = defaults["domain_folder"]
-            if "component_folder" in defaults:
-                config.component_folder = defaults["component_folder"]
-            if "auto_run_build_runner" in defaults:
-                config.auto_run_build_runner = defaults["auto_run_build_runner"]
-        
-        # Map 'styling' section
-        if "styling" in data:
-            styling = data["styling"]
-            if "primary_color" in styling:
-                config.primary_color = styling["primary_color"]
-            if "secondary_color" in styling:
-                config.secondary_color = styling["secondary_color"]
-        
-        # Map 'templates' section
-        if "templates" in data:
-            config.custom_templates = data["templates"]
-        
-        # Map 'dependencies' section
-        if "dependencies" in data:
-            config.extra_dependencies = data["dependencies"]
-        
-        # Also support flat structure (for simple configs)
-        for key in ["feature_folder", "domain_folder", "component_folder", 
-                    "auto_run_build_runner",
-                    "primary_color", "secondary_color"]:
-            if key in data:
-                setattr(config, key, data[key])
-        
+        for attribute, value in validate_config_data(data, source).items():
+            setattr(config, attribute, value)
         config._source = source
         return config
     
     def merge_with(self, other: "FlutteratorConfig") -> "FlutteratorConfig":
-        """Merge this config with another, other takes precedence for non-default values."""
+        """Merge this config with another, other takes precedence for non-default values.
+
+        Both sides come from ``from_dict`` (or the defaults), so values are already validated.
+        """
         result = FlutteratorConfig()
         
         # Feature folder: use other's if set (default is "features")
@@ -119,6 +212,16 @@ class FlutteratorConfig:
         for key in ["primary_color", "secondary_color"]:
             setattr(result, key, getattr(other, key))
         
+        # Post-processing, API, logging, router, startup, performance and mock options: use other's value when it differs from the default
+        for key in ["dart_fix", "http_cache", "http_cache_max_age", "http_cache_max_entries", "http_cache_disk",
+                    "http_retries", "http_retry_delay_ms", "http_max_retry_after", "bulk_batch_size",
+                    "log_debug_min_level", "log_release_min_level", "api_logger_in_release",
+                    "deferred_pages", "fast_startup",
+                    "perf_instrumentation", "perf_jank_threshold_ms", "perf_report_interval_seconds", "perf_report_level",
+                    "mock_format", "mock_items", "mock_gzip"]:
+            other_value = getattr(other, key)
+            setattr(result, key, other_value if other_value != DEFAULTS[key] else getattr(self, key))
+        
         # Merge dictionaries and lists
         result.custom_templates = {**self.custom_templates, **other.custom_templates}
         result.extra_dependencies = self.extra_dependencies + other.extra_dependencies
@@ -127,22 +230,111 @@ class FlutteratorConfig:
         return result
 
 
+def _warn(message: str) -> None:
+    console.print(f"[yellow]⚠️  Warning: {message}[/yellow]")
+
+
+def _check_value(value: Any, expected: type, choices) -> Optional[str]:
+    """Why ``value`` does not match the schema entry, or None when it does."""
+    # bool is a subclass of int: `items: true` is not a number
+    if not isinstance(value, expected) or (expected is int and isinstance(value, bool)):
+        return f"expected {expected.__name__}, got {type(value).__name__}"
+    if expected is int and value < 0:
+        return "expected a non-negative integer"
+    if choices is not None and value not in choices:
+        return f"expected one of {', '.join(choices)}"
+    return None
+
+
+def validate_config_data(data: Any, source: str = "unknown") -> Dict[str, Any]:
+    """Validate a parsed config file against ``CONFIG_SCHEMA``; return ``{attribute: value}``.
+
+    Unknown keys and invalid values are reported and ignored, so the config keeps
+    its default for them. Flat top-level keys win over their section form.
+    """
+    if not isinstance(data, dict):
+        _warn(f"{source} must be a mapping, ignored")
+        return {}
+    
+    values: Dict[str, Any] = {}
+    
+    def check(path: str, value: Any, entry: tuple) -> None:
+        attribute, expected, choices = entry
+        problem = _check_value(value, expected, choices)
+        if problem:
+            _warn(f"{source}: {path} ignored ({problem})")
+        else:
+            values[attribute] = value
+    
+    for section, schema in CONFIG_SCHEMA.items():
+        if section not in data:
+            continue
+        section_data = data[section] or {}
+        if not isinstance(section_data, dict):
+            _warn(f"{source}: {section} ignored (expected a mapping)")
+            continue
+        for key, value in section_data.items():
+            if key in schema:
+                check(f"{section}.{key}", value, schema[key])
+            else:
+                _warn(f"{source}: unknown key {section}.{key}")
+    
+    for key, value in data.items():
+        if key in CONFIG_TOP_LEVEL_SCHEMA:
+            check(key, value, CONFIG_TOP_LEVEL_SCHEMA[key])
+        elif key not in CONFIG_SCHEMA:
+            _warn(f"{source}: unknown key {key}")
+    
+    return values
+
+
 def load_yaml_file(path: Path) -> Optional[dict]:
     """Load a YAML file, return None if not found or invalid."""
     if not path.exists():
         return None
     
     try:
-        with open(path, 'r') as f:
-            return yaml.safe_load(f) or {}
+        with open(path, 'rb') as f:
+            return yaml.load(f, Loader=YamlLoader) or {}
     except yaml.YAMLError as e:
-        console.print(f"[yellow]⚠️  Warning: Invalid YAML in {path}: {e}[/yellow]")
+        _warn(f"Invalid YAML in {path}: {e}")
         return None
     except Exception as e:
-        console.print(f"[yellow]⚠️  Warning: Could not read {path}: {e}[/yellow]")
+        _warn(f"Could not read {path}: {e}")
         return None
 
 
+# Parsed and validated config files: resolved path -> ((mtime_ns, size), config or None)
+_config_file_cache: Dict[Path, Tuple[Tuple[int, int], Optional[FlutteratorConfig]]] = {}
+
+
+def load_config_file(path: Path, source: str) -> Optional[FlutteratorConfig]:
+    """Validated config of one file, or None if missing/empty/invalid.
+
+    Memoized by (mtime, size): commands that load the configuration several
+    times parse each file once, and an edited file is read again.
+    """
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    key = path.resolve()
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    cached = _config_file_cache.get(key)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    
+    data = load_yaml_file(path)
+    config = FlutteratorConfig.from_dict(data, source) if data else None
+    _config_file_cache[key] = (stamp, config)
+    return config
+
+
+def clear_config_cache() -> None:
+    """Forget memoized config files (they are re-read on the next ``load_config``)."""
+    _config_file_cache.clear()
+
+
 def get_global_config_path() -> Path:
     """Get path to global config file."""
     return Path.home() / GLOBAL_CONFIG_FILE
@@ -162,23 +354,22 @@ def load_config(project_dir: Optional[Path] = None) -> FlutteratorConfig:
     2. Project-level flutterator.yaml
     3. Global ~/.flutteratorrc
     4. Default values
+    
+    Files are parsed and validated once per process (see ``load_config_file``);
+    the returned config is a new object, so callers may apply CLI overrides to it.
     """
     # Start with defaults
     config = FlutteratorConfig(_source="defaults")
     
     # Load global config
-    global_path = get_global_config_path()
-    global_data = load_yaml_file(global_path)
-    if global_data:
-        global_config = FlutteratorConfig.from_dict(global_data, f"~/{GLOBAL_CONFIG_FILE}")
+    global_config = load_config_file(get_global_config_path(), f"~/{GLOBAL_CONFIG_FILE}")
+    if global_config:
         config = config.merge_with(global_config)
     
     # Load project config (if project_dir provided)
     if project_dir:
-        project_path = get_project_config_path(project_dir)
-        project_data = load_yaml_file(project_path)
-        if project_data:
-            project_config = FlutteratorConfig.from_dict(project_data, PROJECT_CONFIG_FILE)
+        project_config = load_config_file(get_project_config_path(project_dir), PROJECT_CONFIG_FILE)
+        if project_config:
             config = config.merge_with(project_config)
     
     return config
@@ -196,6 +387,39 @@ def apply_cli_overrides(config: FlutteratorConfig, **cli_args) -> FlutteratorCon
     if cli_args.get("no_build") is True:
         config.auto_run_build_runner = False
     
+    if cli_args.get("dart_fix") is not None:
+        config.dart_fix = cli_args["dart_fix"]
+    
+    if cli_args.get("http_cache") is not None:
+        config.http_cache = cli_args["http_cache"]
+    
+    if cli_args.get("release_log_level"):
+        config.log_release_min_level = cli_args["release_log_level"]
+    
+    if cli_args.get("api_logger_in_release") is not None:
+        config.api_logger_in_release = cli_args["api_logger_in_release"]
+    
+    if cli_args.get("batch_size"):
+        config.bulk_batch_size = cli_args["batch_size"]
+    
+    if cli_args.get("deferred") is not None:
+        config.deferred_pages = cli_args["deferred"]
+    
+    if cli_args.get("fast_startup") is not None:
+        config.fast_startup = cli_args["fast_startup"]
+    
+    if cli_args.get("perf") is not None:
+        config.perf_instrumentation = cli_args["perf"]
+    
+    if cli_args.get("mock_format"):
+        config.mock_format = cli_args["mock_format"]
+    
+    if cli_args.get("mock_items") is not None:
+        config.mock_items = cli_args["mock_items"]
+    
+    if cli_args.get("mock_gzip") is not None:
+        config.mock_gzip = cli_args["mock_gzip"]
+    
     return config
 
 
@@ -213,12 +437,51 @@ defaults:
   domain_folder: "domain"           # Domain entities folder (shared entities)
   component_folder: "features/components"  # Components folder
   auto_run_build_runner: true       # Run build_runner after generation
+  dart_fix: true                    # Apply const fixes (dart fix) to generated files after build_runner
 
 # UI/Styling configuration
 styling:
   primary_color: "#2196F3"
   secondary_color: "#FF9800"
 
+# Generated API layer (read by `flutterator create`)
+api:
+  http_cache: false                 # ETag / Cache-Control cache + in-flight GET dedup
+  http_cache_max_age: 0             # Seconds of freshness when the server sends no max-age (0 = always revalidate)
+  http_cache_max_entries: 200       # LRU size of the in-memory cache
+  http_cache_disk: true             # Persist cached responses in the app cache directory
+  http_retries: 2                   # AuthInterceptor retries of idempotent requests on transient errors (0 = off)
+  http_retry_delay_ms: 300          # First backoff delay, doubled on every attempt (Retry-After wins)
+  http_max_retry_after: 5           # Seconds; a longer Retry-After is not waited for (the error is returned)
+  bulk_batch_size: 100              # Items per request in createMany/updateMany/deleteMany (add-domain --bulk)
+
+# Generated Logger (read by `flutterator create`; --dart-define=LOG_LEVEL=... overrides at build time)
+logging:
+  debug_min_level: "verbose"        # verbose | apiReq | info | warning | error | fatal
+  release_min_level: "warning"      # Lower levels are skipped before any string is built
+  api_logger_in_release: false      # Keep ApiLogger in the Dio chain of release builds
+
+# Router
+router:
+  deferred_pages: false             # add-page imports pages with `deferred as` (smaller initial bundle on web)
+
+# App startup (read by `flutterator create`)
+startup:
+  fast_startup: false               # Parallel bootstrap, lazy singletons, Timeline spans per phase in main.dart
+
+# Performance instrumentation (read by `flutterator create` and `flutterator add-instrumentation`)
+performance:
+  instrumentation: false            # core/performance/: frame timings, route build times, API latency histograms
+  jank_threshold_ms: 16             # Build or raster phase longer than this counts as a janky frame
+  report_interval_seconds: 60       # Summary logged through Logger every N seconds
+  report_level: "warning"           # Logger level of the summary (at least warning above 5% jank)
+
+# Mock seed assets written by `flutterator add-domain` (assets/mock/<entity>.json)
+mock:
+  format: "json"                    # json (indented) | compact (one line) | ndjson (one item per line)
+  items: 3                          # Sample items per entity, written one at a time
+  gzip: false                       # Gzip the asset (.json.gz / .ndjson.gz); the mock service needs dart:io (no web)
+
 # Custom templates (optional)
 # templates:
 #   entity: "templates/custom_entity.jinja"
@@ -249,7 +512,24 @@ def show_config(config: FlutteratorConfig) -> None:
     table.add_row("Domain Folder", config.domain_folder)
     table.add_row("Component Folder", config.component_folder)
     table.add_row("Auto Build Runner", "✅" if config.auto_run_build_runner else "❌")
+    table.add_row("Const Fix (dart fix)", "✅" if config.dart_fix else "❌")
     table.add_row("Primary Color", config.primary_color)
     table.add_row("Secondary Color", config.secondary_color)
+    table.add_row("HTTP Cache", "✅" if config.http_cache else "❌")
+    if config.http_cache:
+        table.add_row("HTTP Cache Max Age", f"{config.http_cache_max_age}s")
+        table.add_row("HTTP Cache Max Entries", str(config.http_cache_max_entries))
+        table.add_row("HTTP Cache On Disk", "✅" if config.http_cache_disk else "❌")
+    table.add_row("HTTP Retries", f"{config.http_retries} (from {config.http_retry_delay_ms}ms)")
+    table.add_row("Bulk Batch Size", str(config.bulk_batch_size))
+    table.add_row("Log Level (debug / release)", f"{config.log_debug_min_level} / {config.log_release_min_level}")
+    table.add_row("ApiLogger In Release", "✅" if config.api_logger_in_release else "❌")
+    table.add_row("Deferred Pages", "✅" if config.deferred_pages else "❌")
+    table.add_row("Fast Startup", "✅" if config.fast_startup else "❌")
+    table.add_row("Performance Instrumentation", "✅" if config.perf_instrumentation else "❌")
+    if config.perf_instrumentation:
+        table.add_row("Jank Threshold", f"{config.perf_jank_threshold_ms}ms")
+        table.add_row("Performance Report Interval", f"{config.perf_report_interval_seconds}s ({config.perf_report_level})")
+    table.add_row("Mock Seed Assets", f"{config.mock_items} items, {config.mock_format}{' + gzip' if config.mock_gzip else ''}")
     
     console.print(Panel(table, title=f"⚙️  Configuration ({config._source})", border_style="blue"))
@@ -0,0 +1,89 @@
+"""Post-generation const pass over generated Dart code.
+
+Runs ``dart fix`` restricted to the const-related lints, so widgets built from
+user input (fields, names) that the templates cannot mark ``const`` themselves
+are still cheap to rebuild. The generated analysis_options.yaml enables these
+lints, which ``dart fix`` needs in order to report them.
+"""
+
+import re
+import subprocess
+from pathlib import Path
+from typing import Iterable, Optional
+
+# Lints whose fixes only add/remove `const` (or `new`) — never change behavior
+CONST_FIX_CODES = (
+    "prefer_const_constructors",
+    "prefer_const_constructors_in_immutables",
+    "prefer_const_declarations",
+    "prefer_const_literals_to_create_immutables",
+    "unnecessary_const",
+    "unnecessary_new",
+)
+
+_FILE_LINE = re.compile(r"^(\S.*\.dart)$")
+_FIX_LINE = re.compile(r"^\s+(\w+)\s+[•-]\s+(\d+)\s+fix(?:es)?$")
+
+
+def parse_dart_fix_output(output: str) -> dict[str, dict[str, int]]:
+    """Parse ``dart fix`` output into ``{file: {code: count}}``.
+
+    Works for both ``--apply`` and ``--dry-run`` output::
+
+        lib/main.dart
+          prefer_const_constructors • 2 fixes
+    """
+    results: dict[str, dict[str, int]] = {}
+    current: Optional[str] = None
+    for line in output.splitlines():
+        file_match = _FILE_LINE.match(line.rstrip())
+        if file_match:
+            current = file_match.group(1)
+            continue
+        fix_match = _FIX_LINE.match(line.rstrip())
+        if fix_match and current:
+            code, count = fix_match.group(1), int(fix_match.group(2))
+            results.setdefault(current, {})[code] = count
+    return results
+
+
+def apply_const_fixes(
+    project_path: Path,
+    targets: Optional[Iterable[Path]] = None,
+    *,
+    dry_run: bool = False,
+) -> dict[str, dict[str, int]]:
+    """Run the const ``dart fix`` pass on ``targets`` (default: ``lib``).
+
+    Targets are files or directories, absolute or relative to ``project_path``;
+    missing ones are skipped. File keys in the result are relative to the
+    project root.
+
+    Raises:
+        FileNotFoundError: If the ``dart`` executable is not available.
+        subprocess.CalledProcessError: If ``dart fix`` fails.
+    """
+    project_path = Path(project_path)
+    code_args = [f"--code={code}" for code in CONST_FIX_CODES]
+    results: dict[str, dict[str, int]] = {}
+    for target in targets or [Path("lib")]:
+        target = Path(target)
+        if not target.is_absolute():
+            target = project_path / target
+        if not target.exists():
+            continue
+        rel_target = target.resolve().relative_to(project_path.resolve())
+        completed = subprocess.run(
+            ["dart", "fix", "--dry-run" if dry_run else "--apply", *code_args, str(rel_target)],
+            cwd=project_path,
+            check=True,
+            capture_output=True,
+            text=True,
+        )
+        for file_name, fixes in parse_dart_fix_output(completed.stdout).items():
+            # dart fix reports paths relative to the target it was given
+            key = rel_target.as_posix() if target.is_file() else (rel_target / file_name).as_posix()
+            merged = results.setdefault(key, {})
+            for code, count in fixes.items():
+                merged[code] = merged.get(code, 0) + count
+    return results
@@ -0,0 +1,124 @@
+"""Recursive Dart type AST for field specs (``String?``, ``List<Todo>``, ``Map<String, List<Todo?>>?``).
+
+A spec is parsed once by :func:`parse_dart_type` into an immutable
+:class:`DartType` tree. Parses are cached per spec string and equal subtrees
+are interned, so validation, entity, DTO, mapper, form and mock-data
+generation all walk the same objects instead of re-slicing the string.
+"""
+
+import re
+from dataclasses import dataclass
+from functools import cached_property, lru_cache
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+# Generic roots with special handling, keyed by lowercase name (field specs accept list<T>)
+COLLECTION_TYPES = {'list': 'List', 'set': 'Set', 'map': 'Map'}
+
+_TOKEN = re.compile(r"\s*(?:(\w+)|([<>,?]))")
+
+
+@dataclass(frozen=True)
+class DartType:
+    """One node of a Dart type: ``name<args...>`` with an optional ``?``."""
+
+    name: str
+    args: Tuple["DartType", ...] = ()
+    nullable: bool = False
+
+    @cached_property
+    def text(self) -> str:
+        """Canonical spelling: ``Map<String, List<Todo>>?``."""
+        args = f"<{', '.join(arg.text for arg in self.args)}>" if self.args else ""
+        return f"{self.name}{args}{'?' if self.nullable else ''}"
+
+    def __str__(self) -> str:
+        return self.text
+
+    @property
+    def non_null(self) -> "DartType":
+        return intern_dart_type(self.name, self.args) if self.nullable else self
+
+    @property
+    def collection(self) -> Optional[str]:
+        """``'List'``, ``'Set'`` or ``'Map'`` for collection roots, else None."""
+        return COLLECTION_TYPES.get(self.name.lower())
+
+    def walk(self) -> Iterator["DartType"]:
+        """This node, then every argument depth-first."""
+        yield self
+        for arg in self.args:
+            yield from arg.walk()
+
+    def leaves(self) -> List["DartType"]:
+        """Nodes without type arguments (the named types a spec refers to)."""
+        return [node for node in self.walk() if not node.args]
+
+    def transform(self, fn: Callable[["DartType"], "DartType"]) -> "DartType":
+        """Rebuild bottom-up: ``fn`` receives each node with its arguments already transformed."""
+        args = tuple(arg.transform(fn) for arg in self.args)
+        node = intern_dart_type(self.name, args, self.nullable) if args != self.args else self
+        return fn(node)
+
+
+_INTERNED: Dict[Tuple[str, Tuple[DartType, ...], bool], DartType] = {}
+
+
+def intern_dart_type(name: str, args: Tuple[DartType, ...] = (), nullable: bool = False) -> DartType:
+    """Return the shared :class:`DartType` instance for ``name<args>?``."""
+    key = (name, args, nullable)
+    node = _INTERNED.get(key)
+    if node is None:
+        node = _INTERNED[key] = DartType(name, args, nullable)
+    return node
+
+
+def _tokenize(spec: str) -> List[str]:
+    tokens = []
+    pos = 0
+    spec = spec.rstrip()
+    while pos < len(spec):
+        match = _TOKEN.match(spec, pos)
+        if match is None:
+            raise ValueError(f"Unexpected character '{spec[pos:].lstrip()[:1]}' in type '{spec}'")
+        tokens.append(match.group(1) or match.group(2))
+        pos = match.end()
+    return tokens
+
+
+@lru_cache(maxsize=None)
+def parse_dart_type(spec: str) -> DartType:
+    """Parse a field type spec into a :class:`DartType`.
+
+    Raises:
+        ValueError: If the spec is empty, has unbalanced ``<>`` or stray tokens.
+    """
+    tokens = _tokenize(spec)
+    if not tokens:
+        raise ValueError("Type cannot be empty")
+
+    def parse(pos: int) -> Tuple[DartType, int]:
+        if pos >= len(tokens) or not re.fullmatch(r"\w+", tokens[pos]):
+            found = f"'{tokens[pos]}'" if pos < len(tokens) else "end of type"
+            raise ValueError(f"Expected a type name but found {found} in '{spec}'")
+        name = tokens[pos]
+        pos += 1
+        args: List[DartType] = []
+        if pos < len(tokens) and tokens[pos] == '<':
+            while True:
+                arg, pos = parse(pos + 1)
+                args.append(arg)
+                if pos < len(tokens) and tokens[pos] == ',':
+                    continue
+                if pos < len(tokens) and tokens[pos] == '>':
+                    pos += 1
+                    break
+                raise ValueError(f"Unbalanced '<' in type '{spec}'")
+        nullable = pos < len(tokens) and tokens[pos] == '?'
+        if nullable:
+            pos += 1
+        return intern_dart_type(name, tuple(args), nullable), pos
+
+    node, pos = parse(0)
+    if pos != len(tokens):
+        raise ValueError(f"Unexpected '{tokens[pos]}' in type '{spec}'")
+    return node
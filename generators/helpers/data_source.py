@@ -1,32 +1,66 @@
-"""Mock vs remote data source helpers — DataSourceConfig and mock JSON assets."""
+"""Mock / remote / local data source helpers — DataSourceConfig and mock JSON assets."""
 
 from __future__ import annotations
 
+import gzip
+import io
 import json
 import re
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Iterator, Optional
 
-from generators.templates.copier import generate_file
+from generators.templates.copier import generate_file, write_generated_file
+
+from .config import MOCK_FORMATS  # assets/mock/ seed formats: indented JSON, single-line JSON, one item per line
+from .dart_type import parse_dart_type
+from .discovery import DomainScan
 
 REMOTE_PATTERN = re.compile(
     r"['\"](?P<key>[a-z][a-z0-9_]*)['\"]\s*:\s*DataSource\.remote",
 )
+SOURCE_PATTERN = re.compile(
+    r"['\"](?P<key>[a-z][a-z0-9_]*)['\"]\s*:\s*DataSource\.(?P<source>mock|remote|local)",
+)
+# Body of the `entities` map in data_source_config.dart, and one entry line of it
+ENTITIES_MAP_PATTERN = re.compile(r"(?<=static const Map<String, DataSource> entities = \{\n)(?P<body>.*?\n)(?=  \};)", re.DOTALL)
+DATA_SOURCE_ENUM_PATTERN = re.compile(r"enum DataSource \{(?P<values>[^}]*)\}")
+ENTRY_LINE_PATTERN = re.compile(r"^    '(?P<key>[a-z][a-z0-9_]*)': DataSource\.(?P<source>mock|remote|local),$")
+
+DATA_SOURCE_CONFIG_TEMPLATE = "apis/common/data_source_config_template.jinja"
+DATA_SOURCE_CONFIG_PATH = "apis/common/data_source_config.dart"
+
+# Dart field type (lowercase) -> (SQLite column type, Dart type of the DAO lookup argument)
+SQLITE_COLUMN_TYPES = {
+    "string": ("TEXT", "String"),
+    "str": ("TEXT", "String"),
+    "int": ("INTEGER", "int"),
+    "bool": ("INTEGER", "bool"),
+    "double": ("REAL", "double"),
+    "num": ("REAL", "num"),
+    "datetime": ("TEXT", "String"),
+}
+
+# Packages required by DataSource.local entities
+LOCAL_DEPENDENCIES = ["sqflite", "path"]
 
 
-def scan_domain_entity_keys(lib_path: Path, domain_folder: str = "domain") -> list[str]:
+
+def scan_domain_entity_keys(lib_path: Path, domain_folder: str = "domain", *, scan: Optional[DomainScan] = None) -> list[str]:
     """Return snake_case entity keys that have a repository interface."""
-    domain_root = lib_path / domain_folder
-    if not domain_root.is_dir():
-        return []
-    keys: list[str] = []
-    for entity_dir in sorted(domain_root.iterdir()):
-        if not entity_dir.is_dir():
-            continue
-        i_repo = entity_dir / "model" / f"i_{entity_dir.name}_repository.dart"
-        if i_repo.is_file():
-            keys.append(entity_dir.name)
-    return keys
+    return (scan or DomainScan(lib_path, domain_folder)).repository_keys()
+
+
+def scan_local_entity_keys(lib_path: Path, domain_folder: str = "domain", *, scan: Optional[DomainScan] = None) -> set[str]:
+    """Return entity keys generated with ``--local`` (they have a SQLite DAO)."""
+    return (scan or DomainScan(lib_path, domain_folder)).local_keys()
+
+
+def read_preserved_sources(config_path: Path) -> dict[str, str]:
+    """Parse existing data_source_config.dart into entity key -> 'mock' | 'remote' | 'local'."""
+    if not config_path.is_file():
+        return {}
+    content = config_path.read_text(encoding="utf-8")
+    return {m.group("key"): m.group("source") for m in SOURCE_PATTERN.finditer(content)}
 
 
 def read_preserved_remote_keys(config_path: Path) -> set[str]:
@@ -42,14 +76,27 @@ def build_entities_map(
     *,
     has_login: bool,
     preserved_remote: set[str],
+    preserved_local: Optional[set[str]] = None,
+    local_keys: Optional[set[str]] = None,
+    known_keys: Optional[set[str]] = None,
 ) -> dict[str, str]:
-    """Build entity key -> 'mock' | 'remote' for template rendering."""
+    """Build entity key -> 'mock' | 'remote' | 'local' for template rendering.
+
+    Entities with a DAO (``local_keys``) start as local the first time they
+    appear; afterwards the value already in the config wins, so a manual
+    switch to mock is kept. Local falls back to mock when the DAO is gone.
+    """
+    preserved_local = preserved_local or set()
+    local_keys = local_keys or set()
+    known_keys = known_keys or set()
     entities: dict[str, str] = {}
     if has_login:
         entities["auth"] = "remote" if "auth" in preserved_remote else "mock"
     for key in entity_keys:
         if key in preserved_remote:
             entities[key] = "remote"
+        elif key in local_keys and (key in preserved_local or key not in known_keys):
+            entities[key] = "local"
         else:
             entities[key] = "mock"
     return entities
@@ -60,8 +107,7 @@ def _format_entities_entries(entities: dict[str, str]) -> str:
         return ""
     lines = []
     for key, source in entities.items():
-        enum_val = "DataSource.mock" if source == "mock" else "DataSource.remote"
-        lines.append(f"    '{key}': {enum_val},")
+        lines.append(f"    '{key}': DataSource.{source},")
     return "\n".join(lines)
 
 
@@ -73,19 +119,23 @@ def regenerate_data_source_config(
     has_login: bool = False,
 ) -> None:
     """Regenerate lib/apis/common/data_source_config.dart from scanned entities."""
-    config_rel = "apis/common/data_source_config.dart"
+    config_rel = DATA_SOURCE_CONFIG_PATH
     config_path = lib_path / config_rel
-    entity_keys = scan_domain_entity_keys(lib_path, domain_folder)
-    preserved_remote = read_preserved_remote_keys(config_path)
+    scan = DomainScan(lib_path, domain_folder)
+    entity_keys = scan_domain_entity_keys(lib_path, domain_folder, scan=scan)
+    preserved = read_preserved_sources(config_path)
     entities = build_entities_map(
         entity_keys,
         has_login=has_login,
-        preserved_remote=preserved_remote,
+        preserved_remote={key for key, source in preserved.items() if source == "remote"},
+        preserved_local={key for key, source in preserved.items() if source == "local"},
+        local_keys=scan_local_entity_keys(lib_path, domain_folder, scan=scan),
+        known_keys=set(preserved),
     )
     generate_file(
         project_name,
         lib_path,
-        "apis/common/data_source_config_template.jinja",
+        DATA_SOURCE_CONFIG_TEMPLATE,
         config_rel,
         {
             "entities_entries": _format_entities_entries(entities),
@@ -94,6 +144,124 @@ def regenerate_data_source_config(
     )
 
 
+def update_data_source_config(
+    project_name: str,
+    lib_path: Path,
+    entity: str,
+    *,
+    domain_folder: str = "domain",
+    has_login: bool = False,
+    rebuild: bool = False,
+) -> bool:
+    """Add or remove ``entity``'s line in data_source_config.dart without scanning the domain.
+
+    The entry is inserted in the position a full render would give it (after
+    ``auth``, entities sorted) when the entity has a repository interface, and
+    removed when it does not. It starts as ``local`` when the entity has a DAO
+    and ``mock`` otherwise; an existing entry keeps its value (see
+    :func:`build_entities_map`). Other entries are left untouched.
+
+    Falls back to :func:`regenerate_data_source_config` (and returns False)
+    with ``rebuild``, when the map cannot be found, when ``auth`` must be
+    added or dropped, for the first or last entry, or when the ``DataSource``
+    enum lacks the value to write (projects created before ``DataSource.local``).
+    Returns True when the file was updated in place.
+    """
+    config_path = lib_path / DATA_SOURCE_CONFIG_PATH
+    content = config_path.read_text(encoding="utf-8") if config_path.is_file() and not rebuild else None
+    match = ENTITIES_MAP_PATTERN.search(content) if content is not None else None
+    lines = match.group("body").splitlines() if match else []
+    parsed = [ENTRY_LINE_PATTERN.match(line) for line in lines]
+    enum = DATA_SOURCE_ENUM_PATTERN.search(content) if content is not None else None
+    enum_values = set(re.findall(r"\w+", enum.group("values"))) if enum else set()
+
+    updated: Optional[str] = None
+    if parsed and all(parsed) and (parsed[0].group("key") == "auth") == has_login:
+        preserved = {m.group("key"): m.group("source") for m in parsed}
+        keys = [m.group("key") for m in parsed]
+        entity_dir = lib_path / domain_folder / entity
+        wanted = entity != "auth" and (entity_dir / "model" / f"i_{entity}_repository.dart").is_file()
+        source = None
+        if wanted:
+            source = build_entities_map(
+                [entity],
+                has_login=False,
+                preserved_remote={key for key, value in preserved.items() if value == "remote"},
+                preserved_local={key for key, value in preserved.items() if value == "local"},
+                local_keys={entity} if (entity_dir / "infrastructure" / f"{entity}_dao.dart").is_file() else set(),
+                known_keys=set(preserved),
+            )[entity]
+        if source is not None and source not in enum_values:
+            pass  # Enum predates this value (no DataSource.local): regenerate the whole file
+        elif wanted:
+            entry = _format_entities_entries({entity: source})
+            if entity in preserved:
+                lines[keys.index(entity)] = entry
+            else:
+                first = 1 if has_login else 0
+                lines.insert(next((i for i in range(first, len(keys)) if keys[i] > entity), len(keys)), entry)
+        elif entity in preserved and entity != "auth" and len(keys) > 1:
+            del lines[keys.index(entity)]
+        if source in enum_values or (not wanted and (entity not in preserved or len(keys) > 1)):
+            updated = content[: match.start("body")] + "\n".join(lines) + "\n" + content[match.end("body"):]
+
+    if updated is None:
+        regenerate_data_source_config(project_name, lib_path, domain_folder=domain_folder, has_login=has_login)
+        return False
+    if updated != content:
+        write_generated_file(lib_path, DATA_SOURCE_CONFIG_PATH, DATA_SOURCE_CONFIG_TEMPLATE, updated)
+    return True
+
+
+def local_index_columns(
+    field_list: list[dict],
+    indexed_fields: list[str],
+    *,
+    known_enums: Optional[dict] = None,
+) -> list[dict]:
+    """Describe the indexed SQLite columns of a local entity's DAO.
+
+    Only scalar fields can be indexed (enums are stored by name). Raises
+    ValueError for unknown fields or unsupported types.
+    """
+    known_enums = known_enums or {}
+    types = {field["name"]: field["type"] for field in field_list}
+    columns: list[dict] = []
+    for name in indexed_fields:
+        if name == "id":
+            continue  # primary key, always indexed
+        if name not in types:
+            raise ValueError(f"Indexed field '{name}' is not a field of the entity")
+        base = types[name].rstrip("?")
+        if base in known_enums:
+            sql_type, dart_type = "TEXT", "String"
+        elif base.lower() in SQLITE_COLUMN_TYPES:
+            sql_type, dart_type = SQLITE_COLUMN_TYPES[base.lower()]
+        else:
+            raise ValueError(f"Field '{name}' of type '{types[name]}' cannot be indexed (scalar types only)")
+        columns.append({
+            "name": name,
+            "pascal": name[0].upper() + name[1:],
+            "sql_type": sql_type,
+            "dart_type": dart_type,
+        })
+    return columns
+
+
+def ensure_local_database(project_name: str, lib_path: Path) -> None:
+    """Generate core/infrastructure/local_database.dart if it doesn't already exist."""
+    target = lib_path / "core" / "infrastructure" / "local_database.dart"
+    if not target.exists():
+        generate_file(project_name, lib_path, "core/infrastructure/local_database_template.jinja", "core/infrastructure/local_database.dart")
+
+
+def missing_local_dependencies(project_path: Path) -> list[str]:
+    """Return the LOCAL_DEPENDENCIES not yet declared in pubspec.yaml."""
+    from generators.config.pubspec import missing_dependencies
+
+    return missing_dependencies(project_path, LOCAL_DEPENDENCIES)
+
+
 def ensure_mock_assets_dir(project_path: Path) -> Path:
     """Ensure assets/mock/ exists in the Flutter project root."""
     mock_dir = project_path / "assets" / "mock"
@@ -110,12 +278,27 @@ def _sample_value_for_type(
 ) -> object:
     """Return a JSON-serializable sample value for a DTO field."""
     known_enums = known_enums or {}
-    is_nullable = field_type.endswith("?")
-    base = field_type[:-1] if is_nullable else field_type
 
     if field_name == "id":
         return str(index)
 
+    try:
+        parsed = parse_dart_type(field_type).non_null
+    except ValueError:
+        return f"sample-{field_name}-{index}"
+    base = parsed.name
+
+    if parsed.collection in ("List", "Set"):
+        element = parsed.args[0] if parsed.args else None
+        if element is not None and not element.args and element.name in known_enums:
+            vals = known_enums[element.name].get("values") or []
+            if vals:
+                return [vals[0]]
+        return []
+
+    if parsed.collection == "Map":
+        return {}
+
     base_lower = base.lower()
     if base_lower in ("string", "str"):
         return f"sample-{field_name}-{index}"
@@ -134,23 +317,64 @@ def _sample_value_for_type(
             return values[0]
         return "pending"
 
-    if base.startswith("List<") or base.startswith("Set<"):
-        inner = base[base.index("<") + 1 : base.rindex(">")]
-        if inner in known_enums:
-            vals = known_enums[inner].get("values") or []
-            if vals:
-                return [vals[0]]
-        return []
-
-    if base.startswith("Map<"):
-        return {}
-
     if base[0].isupper() if base else False:
         return f"sample-{field_name}-{index}"
 
     return f"sample-{field_name}-{index}"
 
 
+def mock_asset_name(entity_folder_name: str, mock_format: str = "json", compress: bool = False) -> str:
+    """File name of an entity's seed asset, e.g. ``todo.json`` or ``todo.ndjson.gz``."""
+    name = f"{entity_folder_name}.{'ndjson' if mock_format == 'ndjson' else 'json'}"
+    return f"{name}.gz" if compress else name
+
+
+def iter_mock_items(
+    field_list: list[dict],
+    item_count: int,
+    *,
+    known_enums: Optional[dict] = None,
+) -> Iterator[dict]:
+    """Yield ``item_count`` sample items, one at a time."""
+    for i in range(1, item_count + 1):
+        yield {
+            field["name"]: _sample_value_for_type(field["name"], field["type"], i, known_enums=known_enums)
+            for field in field_list
+        }
+
+
+def write_mock_items(out_path: Path, items: Iterable[dict], mock_format: str = "json", compress: bool = False) -> int:
+    """Stream ``items`` to ``out_path`` without holding the list; return the item count.
+
+    ``json`` is the indented ``{"items": [...]}`` document, ``compact`` the
+    same document on one line, ``ndjson`` one item per line. With
+    ``compress`` the file is gzipped (no timestamp, so output is reproducible).
+    """
+    if mock_format not in MOCK_FORMATS:
+        raise ValueError(f"Unknown mock format '{mock_format}' (expected one of {', '.join(MOCK_FORMATS)})")
+    raw = open(out_path, "wb")
+    stream = gzip.GzipFile(fileobj=raw, mode="wb", mtime=0) if compress else raw
+    count = 0
+    with raw, stream, io.TextIOWrapper(stream, encoding="utf-8") as out:
+        if mock_format == "ndjson":
+            for count, item in enumerate(items, 1):
+                out.write(json.dumps(item, separators=(",", ":")) + "\n")
+            return count
+        compact = mock_format == "compact"
+        out.write('{"items":[' if compact else '{\n  "items": [')
+        for count, item in enumerate(items, 1):
+            if compact:
+                out.write(("," if count > 1 else "") + json.dumps(item, separators=(",", ":")))
+            else:
+                body = json.dumps(item, indent=2).replace("\n", "\n    ")
+                out.write(("," if count > 1 else "") + "\n    " + body)
+        if compact:
+            out.write("]}\n")
+        else:
+            out.write("\n  ]\n}\n" if count else "]\n}\n")
+    return count
+
+
 def generate_mock_json(
     project_path: Path,
     entity_folder_name: str,
@@ -158,23 +382,26 @@ def generate_mock_json(
     *,
     known_enums: Optional[dict] = None,
     item_count: int = 3,
+    mock_format: str = "json",
+    compress: bool = False,
 ) -> Path:
-    """Write assets/mock/<entity>.json with sample items."""
+    """Write the seed asset ``assets/mock/<entity>.json`` (or ``.ndjson``, ``.gz``).
+
+    Items are generated and written one at a time, so large ``item_count``
+    values use constant memory. Seed files of the same entity in another
+    format are removed, so only the one the mock service reads is bundled.
+    """
     mock_dir = ensure_mock_assets_dir(project_path)
-    items = []
-    for i in range(1, item_count + 1):
-        item: dict[str, object] = {}
-        for field in field_list:
-            item[field["name"]] = _sample_value_for_type(
-                field["name"],
-                field["type"],
-                i,
-                known_enums=known_enums,
-            )
-        items.append(item)
-    out_path = mock_dir / f"{entity_folder_name}.json"
-    out_path.write_text(
-        json.dumps({"items": items}, indent=2) + "\n",
-        encoding="utf-8",
+    out_path = mock_dir / mock_asset_name(entity_folder_name, mock_format, compress)
+    for fmt in ("json", "ndjson"):
+        for gz in (False, True):
+            stale = mock_dir / mock_asset_name(entity_folder_name, fmt, gz)
+            if stale != out_path and stale.exists():
+                stale.unlink()
+    write_mock_items(
+        out_path,
+        iter_mock_items(field_list, item_count, known_enums=known_enums),
+        mock_format,
+        compress,
     )
     return out_path
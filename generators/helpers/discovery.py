@@ -0,0 +1,153 @@
+"""Single-pass discovery of the domain folder (``lib/<domain_folder>/``).
+
+A :class:`DomainScan` lists each directory it needs at most once, with
+``os.scandir``. Entry types come from the listing itself (``d_type``), so
+discovering N entities costs one listing of the domain root plus one of each
+``model/`` folder, with no per-entry ``stat``/``exists``/``is_dir`` calls.
+Entity files recorded in the project manifest (``.flutterator/manifest.json``)
+take their class name from it; other entity files are read once to detect
+their freezed class.
+
+Build one scan and query it for everything a command needs (models, enums,
+repository keys, DAO keys, failure files). Build a new one after the command
+writes to the domain folder.
+"""
+
+import os
+import re
+from functools import cached_property
+from pathlib import Path
+from typing import Dict, List, Optional, Set
+
+from .manifest import UNCHANGED, Manifest, manifest_at
+
+_ENTITY_CLASS = re.compile(r'abstract class (\w+)\s+with\s+_\$')
+_CLASS_NAME = re.compile(r'abstract class (\w+)\s+with')
+_ENUM = re.compile(r'enum\s+(\w+)\s*\{')
+
+# model/ files that never hold an entity (besides i_*.dart, *_failure.dart and generated parts)
+_NON_ENTITY_FILES = {'value_objects.dart', 'value_validators.dart', 'common_interfaces.dart'}
+
+
+def list_dir(path: Path) -> Dict[str, bool]:
+    """Return ``{name: is_dir}`` for the entries of ``path``, or ``{}`` if it is not a directory."""
+    try:
+        with os.scandir(path) as entries:
+            return {entry.name: entry.is_dir() for entry in entries}
+    except (FileNotFoundError, NotADirectoryError):
+        return {}
+
+
+def is_entity_file_name(name: str) -> bool:
+    """Whether a model/ file name can hold an entity (before reading it)."""
+    if not name.endswith('.dart') or name.endswith('.freezed.dart') or name.endswith('.g.dart'):
+        return False
+    if name.startswith('i_') or name.endswith('_failure.dart'):
+        return False
+    return name not in _NON_ENTITY_FILES
+
+
+def declared_entity_class(content: str, require_freezed: bool = True) -> Optional[str]:
+    """Class name of the freezed entity declared in Dart ``content``, or None.
+
+    With ``require_freezed=False`` any ``abstract class X with ...`` counts.
+    """
+    if require_freezed and not _ENTITY_CLASS.search(content):
+        return None
+    match = _CLASS_NAME.search(content)
+    return match.group(1) if match else None
+
+
+def entity_class_name(path: Path, require_freezed: bool = True) -> Optional[str]:
+    """Class name of the freezed entity declared in ``path`` (one read), or None."""
+    try:
+        content = path.read_text()
+    except Exception:
+        return None
+    return declared_entity_class(content, require_freezed)
+
+
+class DomainScan:
+    """Lazily listed view of ``lib/<domain_folder>/``; each directory is listed once."""
+
+    def __init__(self, lib_path: Path, domain_folder: str = "domain"):
+        self.lib_path = Path(lib_path)
+        self.domain_folder = domain_folder
+        self.root = self.lib_path / domain_folder
+        self._listings: Dict[str, Dict[str, bool]] = {}
+
+    def _listing(self, rel: str) -> Dict[str, bool]:
+        if rel not in self._listings:
+            self._listings[rel] = list_dir(self.root / rel if rel else self.root)
+        return self._listings[rel]
+
+    @cached_property
+    def folders(self) -> List[str]:
+        """Sub-folders of the domain root (entity folders, ``enums``...), sorted."""
+        return sorted(name for name, is_dir in self._listing("").items() if is_dir)
+
+    def files(self, folder: str, sub: str) -> Set[str]:
+        """File names in ``<folder>/<sub>/`` (e.g. ``("todo", "model")``)."""
+        return {name for name, is_dir in self._listing(f"{folder}/{sub}").items() if not is_dir}
+
+    def has_file(self, folder: str, sub: str, name: str) -> bool:
+        return name in self.files(folder, sub)
+
+    @cached_property
+    def manifest(self) -> Optional[Manifest]:
+        """Manifest of the project owning ``lib_path`` (one read), or None if it has none."""
+        return manifest_at(self.lib_path.parent)
+
+    def _entity_class(self, folder: str, name: str) -> Optional[str]:
+        rel = f"{self.lib_path.name}/{self.domain_folder}/{folder}/model/{name}"
+        entry = self.manifest.get(rel) if self.manifest else None
+        if entry is not None and self.manifest.file_status(rel) == UNCHANGED:
+            # Generated file not edited since (size + mtime): the class was recorded when it was rendered
+            return entry.get("entity_class")
+        return entity_class_name(self.root / folder / "model" / name)
+
+    @cached_property
+    def models(self) -> Dict[str, dict]:
+        """``{file_stem: {'class_name', 'folder'}}`` for every entity under ``*/model/``."""
+        models_map: Dict[str, dict] = {}
+        for folder in self.folders:
+            for name in sorted(self.files(folder, "model")):
+                if not is_entity_file_name(name):
+                    continue
+                class_name = self._entity_class(folder, name)
+                if class_name:
+                    models_map[name[:-len('.dart')]] = {'class_name': class_name, 'folder': folder}
+        return models_map
+
+    @cached_property
+    def enums_info(self) -> Dict[str, dict]:
+        """``{EnumName: {'file_stem', 'folder'}}`` for the enums in ``enums/``."""
+        enums_map: Dict[str, dict] = {}
+        for name, is_dir in sorted(self._listing("enums").items()):
+            if is_dir or not name.endswith('.dart'):
+                continue
+            try:
+                content = (self.root / "enums" / name).read_text()
+            except Exception:
+                continue
+            for match in _ENUM.finditer(content):
+                enums_map[match.group(1)] = {
+                    'file_stem': name[:-len('.dart')],
+                    'folder': f"{self.domain_folder}/enums",
+                }
+        return enums_map
+
+    def model_class_name(self, file_stem: str) -> Optional[str]:
+        """Class name of the entity file ``<any folder>/model/<file_stem>.dart``."""
+        for folder in self.folders:
+            if self.has_file(folder, "model", f"{file_stem}.dart"):
+                return entity_class_name(self.root / folder / "model" / f"{file_stem}.dart", require_freezed=False)
+        return None
+
+    def repository_keys(self) -> List[str]:
+        """Entity folders with a ``model/i_<folder>_repository.dart`` interface, sorted."""
+        return [folder for folder in self.folders if self.has_file(folder, "model", f"i_{folder}_repository.dart")]
+
+    def local_keys(self) -> Set[str]:
+        """Entity folders generated with ``--local`` (``infrastructure/<folder>_dao.dart``)."""
+        return {folder for folder in self.folders if self.has_file(folder, "infrastructure", f"{folder}_dao.dart")}
@@ -7,15 +7,52 @@ They only contain model and infrastructure layers (no application/presentation).
 from pathlib import Path
 from typing import Optional
 from generators.templates.copier import generate_file
-import re
 from .utils import map_field_type, map_field_type_to_dto, to_pascal_case_preserve, pascal_case_to_kebab_case, pascal_case_to_camel_case, PRIMITIVE_TYPES, KNOWN_VALUE_OBJECTS
-from .validation import parse_field_type
+from .dart_type import DartType, parse_dart_type
+from .data_source import ensure_local_database, local_index_columns, mock_asset_name
 from .feature import (
     generate_value_objects_and_validators,
-    find_domain_models_with_class_names,
     get_domain_model_class_name,
-    find_enums_with_info,
 )
+from .type_context import TypeResolutionContext
+
+# Field types that can back a findBy<Field> query (DateTime has no stable query-string form)
+QUERYABLE_TYPES = {'String', 'int', 'double', 'bool'}
+
+
+def indexed_query_fields(field_list: list[dict], known_enums: Optional[dict] = None) -> list[dict]:
+    """Describe the findBy<Field> queries of fields declared with ``@indexed``.
+
+    Returns one dict per field with the domain-facing parameter type (enum or
+    primitive), the DTO-level type (enums travel as their name) and the
+    expression that converts the parameter for the service.
+    Raises ValueError for fields whose type cannot be queried.
+    """
+    known_enums = known_enums or {}
+    queries = []
+    for field in field_list:
+        if not field.get('indexed') or field['name'] == 'id':
+            continue
+        name = field['name']
+        base = map_field_type(field['type']).rstrip('?')
+        if base in known_enums:
+            domain_type, dto_type, to_dto = base, 'String', f"{name}.name"
+        elif base in QUERYABLE_TYPES:
+            domain_type, dto_type, to_dto = base, base, name
+        else:
+            raise ValueError(
+                f"Field '{name}' of type '{field['type']}' cannot be @indexed "
+                f"(use String, int, double, bool or an enum)"
+            )
+        queries.append({
+            'name': name,
+            'pascal': name[0].upper() + name[1:],
+            'domain_type': domain_type,
+            'dto_type': dto_type,
+            'to_dto': to_dto,
+            'enum_import': known_enums[base] if base in known_enums else None,
+        })
+    return queries
 
 
 def create_domain_entity_layers(
@@ -27,6 +64,14 @@ def create_domain_entity_layers(
     folder: Optional[str],
     *,
     no_repo: bool = False,
+    bulk: bool = False,
+    batch_size: int = 100,
+    local: bool = False,
+    indexed_fields: Optional[list[str]] = None,
+    reactive: bool = False,
+    mock_format: str = "json",
+    mock_gzip: bool = False,
+    type_context: Optional[TypeResolutionContext] = None,
 ) -> None:
     """Create model and infrastructure layers for a domain entity
     
@@ -39,6 +84,19 @@ def create_domain_entity_layers(
         folder: Domain folder path
         no_repo: If True, skip repository interface, Retrofit service, and repository impl
             (entity, DTO, and mapper only — e.g. nested types for deserialization).
+        bulk: If True, add createMany/updateMany/deleteMany to the repository
+            interface, services and repository.
+        batch_size: Items per bulk request; the repository chunks larger lists.
+        local: If True, also generate a SQLite DAO and a local-first service
+            (DataSource.local) that syncs with the remote service in the background.
+        indexed_fields: Scalar fields stored as indexed DAO columns (with ``local``).
+            Fields declared with ``@indexed`` (``field['indexed']``) are added
+            automatically and also get findBy<Field> through every layer.
+        reactive: If True, add watchAll() to the repository, backed by a broadcast
+            stream in the mock/local services and a polling wrapper for the remote one.
+        mock_format: Seed asset format the mock service reads (``json``, ``compact``
+            or ``ndjson``, see ``generate_mock_json``).
+        mock_gzip: If True, the mock service reads a gzipped seed asset.
     
     Domain entities do NOT include application or presentation layers.
     They are meant to be shared across multiple features.
@@ -52,13 +110,19 @@ def create_domain_entity_layers(
     # Discover domain models and enums early (needed by VO generation and entity building)
     lib_path = domain_dir.parent.parent if folder else domain_dir.parent
     domain_folder = folder if folder else "domain"
-    models_with_classes = find_domain_models_with_class_names(lib_path, domain_folder) if lib_path.exists() else {}
-    enums_info = find_enums_with_info(lib_path, domain_folder) if lib_path.exists() else {}
-    known_enums = set(enums_info.keys())
+    context = type_context or TypeResolutionContext(lib_path, domain_folder)
+    enums_info = context.enums_info
+    known_enums = context.enums
     
     def _is_enum(t: str) -> bool:
         return t in known_enums
     
+    query_fields = indexed_query_fields(field_list, enums_info) if not no_repo else []
+    query_imports = "".join(
+        f"import 'package:{project_name}/{q['enum_import']['folder']}/{q['enum_import']['file_stem']}.dart';\n"
+        for q in query_fields if q['enum_import']
+    )
+    
     # Model layer
     model_dir = domain_dir / "model"
     model_dir.mkdir(exist_ok=True)
@@ -70,11 +134,15 @@ def create_domain_entity_layers(
     entity_fields = []
     needs_dartz = False
     
+    # Each field type is parsed once; the entity, imports, DTO and mapper all read this tree
+    parsed_types = {field['name']: parse_dart_type(field['type']) for field in field_list}
+    
     for field in field_list:
         field_name = field['name']
         field_type = field['type']
-        is_nullable = field_type.endswith('?')
-        base_type_raw = field_type[:-1] if is_nullable else field_type
+        parsed = parsed_types[field_name]
+        is_nullable = parsed.nullable
+        base_type_raw = str(parsed.non_null)
         
         if field_name == 'id':
             entity_fields.append(f"  required UniqueId id,")
@@ -82,8 +150,7 @@ def create_domain_entity_layers(
             needs_dartz = True
             entity_fields.append(f"  required Option<{base_type_raw}> {field_name},")
         elif is_nullable:
-            coll_root, _, _ = parse_field_type(base_type_raw)
-            if coll_root.lower() in ('list', 'set', 'map'):
+            if parsed.collection:
                 entity_fields.append(f"  {base_type_raw}? {field_name},")
                 continue
             needs_dartz = True
@@ -95,7 +162,7 @@ def create_domain_entity_layers(
                 entity_fields.append(f"  required Option<{base_type_raw}> {field_name},")
         elif _is_enum(field_type):
             entity_fields.append(f"  required {field_type} {field_name},")
-        elif '<' in field_type:
+        elif parsed.args:
             entity_fields.append(f"  required {field_type} {field_name},")
         elif field_type in KNOWN_VALUE_OBJECTS:
             entity_fields.append(f"  required {field_type} {field_name},")
@@ -120,30 +187,22 @@ def create_domain_entity_layers(
     
     def _add_model_import(class_name: str) -> None:
         """Add an import for a domain model if it exists in the project."""
-        for file_stem, model_info in models_with_classes.items():
-            if model_info['class_name'] == class_name:
-                ref_import = f"import 'package:{project_name}/{domain_folder}/{model_info['folder']}/model/{file_stem}.dart';"
-                if ref_import not in referenced_imports:
-                    referenced_imports.append(ref_import)
-                break
+        found = context.model_info(class_name)
+        if found:
+            file_stem, model_info = found
+            ref_import = f"import 'package:{project_name}/{domain_folder}/{model_info['folder']}/model/{file_stem}.dart';"
+            if ref_import not in referenced_imports:
+                referenced_imports.append(ref_import)
     
     for field in field_list:
-        field_type = field['type']
-        # Strip nullable suffix for import resolution
-        ft = field_type[:-1] if field_type.endswith('?') else field_type
-        if '<' in ft:
-            base_type, gp1, gp2 = parse_field_type(ft)
-            for gp in (gp1, gp2):
-                if gp and gp[0].isupper() and gp not in PRIMITIVE_TYPES and gp not in KNOWN_VALUE_OBJECTS:
-                    if _is_enum(gp):
-                        _add_enum_import(gp)
-                    else:
-                        _add_model_import(gp)
-        elif ft and ft[0].isupper() and ft not in PRIMITIVE_TYPES and ft not in KNOWN_VALUE_OBJECTS:
-            if _is_enum(ft):
-                _add_enum_import(ft)
-            else:
-                _add_model_import(ft)
+        # Every named type in the tree, at any depth (Map<String, List<Todo?>> -> Todo)
+        for node in parsed_types[field['name']].leaves():
+            name = node.name
+            if name[0].isupper() and name not in PRIMITIVE_TYPES and name not in KNOWN_VALUE_OBJECTS:
+                if _is_enum(name):
+                    _add_enum_import(name)
+                else:
+                    _add_model_import(name)
     
     all_entity_imports = entity_import
     if referenced_imports:
@@ -168,24 +227,20 @@ def create_domain_entity_layers(
     infra_dir.mkdir(exist_ok=True)
     
     # Create DTO (convert types to DTO format - List<Model> -> List<ModelDto>, Model -> ModelDto, Enum -> String)
-    dto_fields = ",\n".join([f"    required {map_field_type_to_dto(field['type'], known_enums=known_enums)} {field['name']}" for field in field_list])
+    dto_fields = ",\n".join([f"    required {map_field_type_to_dto(field['type'], context=context)} {field['name']}" for field in field_list])
     
     # Find referenced DTOs and add imports
     referenced_dto_imports = []
     
     for field in field_list:
-        field_type = field['type']
-        dto_field_type = map_field_type_to_dto(field_type, known_enums=known_enums)
-        
-        if 'Dto' in dto_field_type:
-            for model_match in re.finditer(r'(\w+)Dto', dto_field_type):
-                model_name = model_match.group(1)
-                for file_stem, model_info in models_with_classes.items():
-                    if model_info['class_name'] == model_name:
-                        ref_import = f"import 'package:{project_name}/{domain_folder}/{model_info['folder']}/infrastructure/{file_stem}_dto.dart';"
-                        if ref_import not in referenced_dto_imports:
-                            referenced_dto_imports.append(ref_import)
-                        break
+        for node in parsed_types[field['name']].leaves():
+            if context.is_domain_model(node.name):
+                found = context.model_info(node.name)
+                if found:
+                    file_stem, model_info = found
+                    ref_import = f"import 'package:{project_name}/{domain_folder}/{model_info['folder']}/infrastructure/{file_stem}_dto.dart';"
+                    if ref_import not in referenced_dto_imports:
+                        referenced_dto_imports.append(ref_import)
     
     # Combine DTO imports
     dto_imports = "\n".join(referenced_dto_imports) if referenced_dto_imports else ""
@@ -204,7 +259,11 @@ import 'package:{project_name}/{import_prefix}/model/{entity_folder_name}_failur
 """
         generate_file(project_name, model_dir, "feature/i_feature_repository_template.jinja", f"i_{entity_folder_name}_repository.dart", {
             "feature_name": entity_class_name,
-            "i_repo_import": i_repo_import
+            "i_repo_import": i_repo_import + query_imports,
+            "query_fields": query_fields,
+            "bulk": bulk,
+            "batch_size": batch_size,
+            "reactive": reactive,
         })
 
     # Generate mapper fields for DTO-Domain conversions
@@ -215,27 +274,77 @@ import 'package:{project_name}/{import_prefix}/model/{entity_folder_name}_failur
     
     def _find_mapper_dep(class_name: str):
         """Find and register a mapper dependency for a domain model, return (mapper_var_name, found)."""
-        for file_stem, model_info in models_with_classes.items():
-            if model_info['class_name'] == class_name:
-                mcn = f"{model_info['class_name']}Mapper"
-                mvn = f"_{pascal_case_to_camel_case(model_info['class_name'])}Mapper"
-                mi = f"package:{project_name}/{domain_folder}/{model_info['folder']}/infrastructure/{file_stem}_mapper.dart"
-                if not any(m[0] == mcn for m in mapper_dependencies):
-                    mapper_dependencies.append((mcn, mvn, mi))
-                return mvn, True
-        return None, False
-    
-    def _is_domain_model_local(t: str) -> bool:
-        return bool(t and t[0].isupper() and t not in PRIMITIVE_TYPES and t not in KNOWN_VALUE_OBJECTS and t not in known_enums)
+        found = context.model_info(class_name)
+        if not found:
+            return None, False
+        file_stem, model_info = found
+        mcn = f"{model_info['class_name']}Mapper"
+        mvn = f"_{pascal_case_to_camel_case(model_info['class_name'])}Mapper"
+        mi = f"package:{project_name}/{domain_folder}/{model_info['folder']}/infrastructure/{file_stem}_mapper.dart"
+        if not any(m[0] == mcn for m in mapper_dependencies):
+            mapper_dependencies.append((mcn, mvn, mi))
+        return mvn, True
+    
+    _is_domain_model_local = context.is_domain_model
     
     mapper_enum_imports = []
     
+    def _add_mapper_enum_import(enum_name: str) -> None:
+        info = enums_info.get(enum_name)
+        if info:
+            ei = f"import 'package:{project_name}/{info['folder']}/{info['file_stem']}.dart';"
+            if ei not in mapper_enum_imports:
+                mapper_enum_imports.append(ei)
+    
+    def _convert(node: DartType, expr: str, to_domain: bool, depth: int = 0) -> Optional[str]:
+        """Dart expression converting ``expr`` (of type ``node``) between DTO and entity.
+
+        Recurses into List/Set/Map arguments, so nested collections are converted
+        element by element. Returns None when the value can be passed through as-is.
+        """
+        if node.nullable:
+            inner = _convert(node.non_null, expr, to_domain, depth)
+            return f"{expr} == null ? null : {inner}" if inner else None
+        suffix = str(depth + 1) if depth else ''
+        if node.collection in ('List', 'Set') and len(node.args) == 1:
+            element = node.args[0]
+            if node.collection == 'List' and not element.args and not element.nullable and _is_domain_model_local(element.name):
+                mvn, found = _find_mapper_dep(element.name)
+                if found:
+                    return f"{mvn}.toDomainList({expr})" if to_domain else f"{mvn}.toDtoList({expr})"
+                return None
+            var = f"e{suffix}"
+            inner = _convert(element, var, to_domain, depth + 1)
+            if inner is None:
+                return None
+            return f"{expr}.map(({var}) => {inner}).to{node.collection}()"
+        if node.collection == 'Map' and len(node.args) == 2:
+            k, v = f"k{suffix}", f"v{suffix}"
+            key = _convert(node.args[0], k, to_domain, depth + 1)
+            value = _convert(node.args[1], v, to_domain, depth + 1)
+            if key is None and value is None:
+                return None
+            return f"{expr}.map(({k}, {v}) => MapEntry({key or k}, {value or v}))"
+        if node.args:
+            return None
+        if _is_enum(node.name):
+            _add_mapper_enum_import(node.name)
+            return f"{node.name}.values.byName({expr})" if to_domain else f"{expr}.name"
+        if node.name in KNOWN_VALUE_OBJECTS:
+            return f"UniqueId.fromUniqueString({expr})" if to_domain else f"{expr}.getOrCrash()"
+        if _is_domain_model_local(node.name):
+            mvn, found = _find_mapper_dep(node.name)
+            if found:
+                return f"{mvn}.toDomain({expr})" if to_domain else f"{mvn}.toDto({expr})"
+        return None
+    
     for field in field_list:
         field_name = field['name']
         field_type = field['type']
         capitalized_name = to_pascal_case_preserve(field_name)
-        is_nullable = field_type.endswith('?')
-        base_type_raw = field_type[:-1] if is_nullable else field_type
+        parsed = parsed_types[field_name]
+        is_nullable = parsed.nullable
+        base_type_raw = str(parsed.non_null)
         
         if field_name == 'id':
             from_dto_fields.append(f"      id: UniqueId.fromUniqueString(dto.id)")
@@ -247,73 +356,24 @@ import 'package:{project_name}/{import_prefix}/model/{entity_folder_name}_failur
             mapper_needs_dartz = True
             from_dto_fields.append(f"      {field_name}: dto.{field_name} != null ? some({base_type_raw}.values.byName(dto.{field_name}!)) : none()")
             to_dto_fields.append(f"      {field_name}: entity.{field_name}.fold(() => null, ({base_type_raw} v) => v.name)")
-            info = enums_info.get(base_type_raw)
-            if info:
-                ei = f"import 'package:{project_name}/{info['folder']}/{info['file_stem']}.dart';"
-                if ei not in mapper_enum_imports:
-                    mapper_enum_imports.append(ei)
+            _add_mapper_enum_import(base_type_raw)
             continue
         
-        # --- Nullable Map / List / Set (Dart T?, not Option) ---
-        coll_root, cg1, cg2 = parse_field_type(base_type_raw)
-        if is_nullable and coll_root.lower() == 'map' and cg1 and cg2:
-            if _is_enum(cg2):
-                from_dto_fields.append(
-                    f"      {field_name}: dto.{field_name} != null ? dto.{field_name}!.map((k, v) => MapEntry(k, {cg2}.values.byName(v))) : null"
-                )
-                to_dto_fields.append(
-                    f"      {field_name}: entity.{field_name} != null ? entity.{field_name}!.map((k, v) => MapEntry(k, v.name)) : null"
-                )
-                info = enums_info.get(cg2)
-                if info:
-                    ei = f"import 'package:{project_name}/{info['folder']}/{info['file_stem']}.dart';"
-                    if ei not in mapper_enum_imports:
-                        mapper_enum_imports.append(ei)
-            elif _is_domain_model_local(cg2):
-                mvn, found = _find_mapper_dep(cg2)
-                if found:
-                    from_dto_fields.append(
-                        f"      {field_name}: dto.{field_name} != null ? dto.{field_name}!.map((k, v) => MapEntry(k, {mvn}.toDomain(v))) : null"
-                    )
-                    to_dto_fields.append(
-                        f"      {field_name}: entity.{field_name} != null ? entity.{field_name}!.map((k, v) => MapEntry(k, {mvn}.toDto(v))) : null"
-                    )
-                else:
-                    from_dto_fields.append(f"      {field_name}: dto.{field_name}")
-                    to_dto_fields.append(f"      {field_name}: entity.{field_name}")
-            else:
+        # --- List / Set / Map, nullable (Dart T?, not Option) or not, arguments may nest ---
+        if parsed.collection:
+            dto_expr = f"dto.{field_name}!" if is_nullable else f"dto.{field_name}"
+            entity_expr = f"entity.{field_name}!" if is_nullable else f"entity.{field_name}"
+            to_domain = _convert(parsed.non_null, dto_expr, True)
+            to_dto = _convert(parsed.non_null, entity_expr, False)
+            if to_domain is None or to_dto is None:
                 from_dto_fields.append(f"      {field_name}: dto.{field_name}")
                 to_dto_fields.append(f"      {field_name}: entity.{field_name}")
-            continue
-        
-        if is_nullable and coll_root.lower() in ('list', 'set') and cg1:
-            if _is_enum(cg1):
-                from_dto_fields.append(
-                    f"      {field_name}: dto.{field_name} != null ? dto.{field_name}!.map((e) => {cg1}.values.byName(e)).toList() : null"
-                )
-                to_dto_fields.append(
-                    f"      {field_name}: entity.{field_name} != null ? entity.{field_name}!.map((e) => e.name).toList() : null"
-                )
-                info = enums_info.get(cg1)
-                if info:
-                    ei = f"import 'package:{project_name}/{info['folder']}/{info['file_stem']}.dart';"
-                    if ei not in mapper_enum_imports:
-                        mapper_enum_imports.append(ei)
-            elif _is_domain_model_local(cg1):
-                mvn, found = _find_mapper_dep(cg1)
-                if found:
-                    from_dto_fields.append(
-                        f"      {field_name}: dto.{field_name} != null ? {mvn}.toDomainList(dto.{field_name}!) : null"
-                    )
-                    to_dto_fields.append(
-                        f"      {field_name}: entity.{field_name} != null ? {mvn}.toDtoList(entity.{field_name}!) : null"
-                    )
-                else:
-                    from_dto_fields.append(f"      {field_name}: dto.{field_name}")
-                    to_dto_fields.append(f"      {field_name}: entity.{field_name}")
+            elif is_nullable:
+                from_dto_fields.append(f"      {field_name}: dto.{field_name} != null ? {to_domain} : null")
+                to_dto_fields.append(f"      {field_name}: entity.{field_name} != null ? {to_dto} : null")
             else:
-                from_dto_fields.append(f"      {field_name}: dto.{field_name}")
-                to_dto_fields.append(f"      {field_name}: entity.{field_name}")
+                from_dto_fields.append(f"      {field_name}: {to_domain}")
+                to_dto_fields.append(f"      {field_name}: {to_dto}")
             continue
         
         # --- Nullable types (Type?) ---
@@ -335,62 +395,11 @@ import 'package:{project_name}/{import_prefix}/model/{entity_folder_name}_failur
                     to_dto_fields.append(f"      {field_name}: entity.{field_name}.fold(() => null, ({base_type_raw} v) => v)")
             continue
         
-        ft_parse = field_type[:-1] if field_type.endswith('?') else field_type
-        base_type, gp1, gp2 = parse_field_type(ft_parse)
-        
         # --- Enum (standalone, no generics) ---
         if _is_enum(field_type):
             from_dto_fields.append(f"      {field_name}: {field_type}.values.byName(dto.{field_name})")
             to_dto_fields.append(f"      {field_name}: entity.{field_name}.name")
-            info = enums_info.get(field_type)
-            if info:
-                ei = f"import 'package:{project_name}/{info['folder']}/{info['file_stem']}.dart';"
-                if ei not in mapper_enum_imports:
-                    mapper_enum_imports.append(ei)
-        
-        # --- Map<K, V> ---
-        elif base_type == 'Map' and gp1 and gp2:
-            if _is_enum(gp2):
-                from_dto_fields.append(f"      {field_name}: dto.{field_name}.map((k, v) => MapEntry(k, {gp2}.values.byName(v)))")
-                to_dto_fields.append(f"      {field_name}: entity.{field_name}.map((k, v) => MapEntry(k, v.name))")
-                info = enums_info.get(gp2)
-                if info:
-                    ei = f"import 'package:{project_name}/{info['folder']}/{info['file_stem']}.dart';"
-                    if ei not in mapper_enum_imports:
-                        mapper_enum_imports.append(ei)
-            elif _is_domain_model_local(gp2):
-                mvn, found = _find_mapper_dep(gp2)
-                if found:
-                    from_dto_fields.append(f"      {field_name}: dto.{field_name}.map((k, v) => MapEntry(k, {mvn}.toDomain(v)))")
-                    to_dto_fields.append(f"      {field_name}: entity.{field_name}.map((k, v) => MapEntry(k, {mvn}.toDto(v)))")
-                else:
-                    from_dto_fields.append(f"      {field_name}: dto.{field_name}")
-                    to_dto_fields.append(f"      {field_name}: entity.{field_name}")
-            else:
-                from_dto_fields.append(f"      {field_name}: dto.{field_name}")
-                to_dto_fields.append(f"      {field_name}: entity.{field_name}")
-        
-        # --- List<T>, Set<T> ---
-        elif '<' in ft_parse and gp1:
-            if _is_enum(gp1):
-                from_dto_fields.append(f"      {field_name}: dto.{field_name}.map((e) => {gp1}.values.byName(e)).toList()")
-                to_dto_fields.append(f"      {field_name}: entity.{field_name}.map((e) => e.name).toList()")
-                info = enums_info.get(gp1)
-                if info:
-                    ei = f"import 'package:{project_name}/{info['folder']}/{info['file_stem']}.dart';"
-                    if ei not in mapper_enum_imports:
-                        mapper_enum_imports.append(ei)
-            elif _is_domain_model_local(gp1):
-                mvn, found = _find_mapper_dep(gp1)
-                if found:
-                    from_dto_fields.append(f"      {field_name}: {mvn}.toDomainList(dto.{field_name})")
-                    to_dto_fields.append(f"      {field_name}: {mvn}.toDtoList(entity.{field_name})")
-                else:
-                    from_dto_fields.append(f"      {field_name}: dto.{field_name}")
-                    to_dto_fields.append(f"      {field_name}: entity.{field_name}")
-            else:
-                from_dto_fields.append(f"      {field_name}: dto.{field_name}")
-                to_dto_fields.append(f"      {field_name}: entity.{field_name}")
+            _add_mapper_enum_import(field_type)
         
         # --- UniqueId ---
         elif field_type in KNOWN_VALUE_OBJECTS:
@@ -423,11 +432,33 @@ import 'package:{project_name}/{import_prefix}/model/{entity_folder_name}_failur
             "entity_name_camel": pascal_case_to_camel_case(entity_class_name),
             "kebab_name": pascal_case_to_kebab_case(entity_class_name),
             "import_prefix": import_prefix,
+            "bulk": bulk,
+            "local": local,
+            "query_fields": query_fields,
+            "reactive": reactive,
+            "mock_asset": mock_asset_name(entity_folder_name, mock_format, mock_gzip),
+            "mock_format": mock_format,
+            "mock_gzip": mock_gzip,
         }
         generate_file(project_name, infra_dir, "domain/i_domain_service_template.jinja", f"i_{entity_folder_name}_service.dart", service_ctx)
         generate_file(project_name, infra_dir, "domain/domain_remote_service_template.jinja", f"{entity_folder_name}_remote_service.dart", service_ctx)
         generate_file(project_name, infra_dir, "domain/mock_domain_service_template.jinja", f"mock_{entity_folder_name}_service.dart", service_ctx)
         generate_file(project_name, infra_dir, "domain/domain_service_module_template.jinja", f"{entity_folder_name}_service_module.dart", service_ctx)
+        if reactive:
+            generate_file(project_name, infra_dir, "domain/polling_domain_service_template.jinja", f"polling_{entity_folder_name}_service.dart", service_ctx)
+        if local:
+            ensure_local_database(project_name, lib_path)
+            dao_ctx = {
+                **service_ctx,
+                "table_name": f"{entity_folder_name}s",
+                "indexed_columns": local_index_columns(
+                    field_list,
+                    list(dict.fromkeys([*(indexed_fields or []), *(q["name"] for q in query_fields)])),
+                    known_enums=enums_info,
+                ),
+            }
+            generate_file(project_name, infra_dir, "domain/domain_dao_template.jinja", f"{entity_folder_name}_dao.dart", dao_ctx)
+            generate_file(project_name, infra_dir, "domain/local_domain_service_template.jinja", f"local_{entity_folder_name}_service.dart", service_ctx)
     
     # Create Mapper
     # Build mapper imports and constructor parameters
@@ -465,5 +496,10 @@ import 'package:{project_name}/{import_prefix}/infrastructure/{entity_folder_nam
             "entity_name": entity_class_name,  # Use class name for template (PascalCase)
             "file_name": entity_folder_name,  # Use folder name for file references (snake_case)
             "import_prefix": import_prefix,
-            "repo_import": repo_import
+            "repo_import": repo_import,
+            "query_imports": query_imports,
+            "query_fields": query_fields,
+            "bulk": bulk,
+            "batch_size": batch_size,
+            "reactive": reactive,
         })
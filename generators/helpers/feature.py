@@ -1,10 +1,10 @@
 """Feature generation functions"""
 
-import re
 from pathlib import Path
 from typing import Optional, List, Dict
 from generators.templates.copier import generate_file
 from .utils import map_field_type, map_field_type_to_dto, to_pascal_case, to_pascal_case_preserve
+from .discovery import DomainScan
 
 
 def create_feature_layers(feature_dir: Path, feature_name: str, field_list: list[dict], project_name: str, folder: Optional[str], lib_path: Optional[Path] = None, domain_folder: str = "domain") -> None:
@@ -294,39 +294,6 @@ extension {feature_name.capitalize()}DomainX on {feature_name.capitalize()} {{
     (infra_dir / f"{feature_name}_extensions.dart").write_text(extension_content)
 
 
-def _is_entity_file(file_path: Path) -> bool:
-    """Check if a .dart file contains a freezed entity class definition.
-    
-    Excludes failure files, interfaces, value objects, validators,
-    and generated files (.freezed.dart, .g.dart).
-    """
-    name = file_path.name
-    if name.endswith('.freezed.dart') or name.endswith('.g.dart'):
-        return False
-    if name.startswith('i_') or name.endswith('_failure.dart'):
-        return False
-    if name in ('value_objects.dart', 'value_validators.dart', 'common_interfaces.dart'):
-        return False
-    
-    try:
-        content = file_path.read_text()
-        return bool(re.search(r'abstract class (\w+)\s+with\s+_\$', content))
-    except Exception:
-        return False
-
-
-def _get_class_name_from_file(file_path: Path) -> Optional[str]:
-    """Extract the freezed class name from a .dart entity file."""
-    try:
-        content = file_path.read_text()
-        match = re.search(r'abstract class (\w+)\s+with', content)
-        if match:
-            return match.group(1)
-    except Exception:
-        pass
-    return None
-
-
 def find_domain_models(lib_path: Path, domain_folder: str) -> List[str]:
     """Find all available domain models in the domain folder.
     
@@ -348,8 +315,8 @@ def find_domain_models(lib_path: Path, domain_folder: str) -> List[str]:
 def get_domain_model_class_name(lib_path: Path, domain_folder: str, folder_name: str) -> Optional[str]:
     """Get the class name (PascalCase) from a domain model entity file.
     
-    First checks for an entity file matching folder_name, then scans
-    all entity files in the folder's model/ directory.
+    Looks for ``<any folder>/model/<folder_name>.dart`` in one scan of the
+    domain folder.
     
     Args:
         lib_path: Path to lib/ directory
@@ -359,16 +326,7 @@ def get_domain_model_class_name(lib_path: Path, domain_folder: str, folder_name:
     Returns:
         Class name in PascalCase (e.g., 'TodoItem') or None if not found
     """
-    domain_path = lib_path / domain_folder
-    
-    # Try exact match first: folder_name is the file stem
-    for item in domain_path.iterdir():
-        if item.is_dir():
-            candidate = item / "model" / f"{folder_name}.dart"
-            if candidate.exists():
-                return _get_class_name_from_file(candidate)
-    
-    return None
+    return DomainScan(lib_path, domain_folder).model_class_name(folder_name)
 
 
 def find_domain_models_with_class_names(lib_path: Path, domain_folder: str) -> Dict[str, dict]:
@@ -388,28 +346,7 @@ def find_domain_models_with_class_names(lib_path: Path, domain_folder: str) -> D
             'user_profile': {'class_name': 'UserProfile', 'folder': 'auth'},
         }
     """
-    domain_path = lib_path / domain_folder
-    
-    if not domain_path.exists():
-        return {}
-    
-    models_map = {}
-    for item in domain_path.iterdir():
-        if item.is_dir():
-            model_dir = item / "model"
-            if not (model_dir.exists() and model_dir.is_dir()):
-                continue
-            for dart_file in model_dir.iterdir():
-                if dart_file.suffix == '.dart' and _is_entity_file(dart_file):
-                    class_name = _get_class_name_from_file(dart_file)
-                    if class_name:
-                        file_stem = dart_file.stem
-                        models_map[file_stem] = {
-                            'class_name': class_name,
-                            'folder': item.name,
-                        }
-    
-    return models_map
+    return DomainScan(lib_path, domain_folder).models
 
 
 def find_enums(lib_path: Path, domain_folder: str) -> List[str]:
@@ -445,27 +382,7 @@ def find_enums_with_info(lib_path: Path, domain_folder: str) -> Dict[str, dict]:
                 },
             }
     """
-    enums_dir = lib_path / domain_folder / "enums"
-
-    if not enums_dir.exists():
-        return {}
-
-    enums_map: Dict[str, dict] = {}
-    for dart_file in enums_dir.iterdir():
-        if dart_file.suffix != '.dart':
-            continue
-        try:
-            content = dart_file.read_text()
-        except Exception:
-            continue
-        for match in re.finditer(r'enum\s+(\w+)\s*\{', content):
-            enum_name = match.group(1)
-            enums_map[enum_name] = {
-                'file_stem': dart_file.stem,
-                'folder': f"{domain_folder}/enums",
-            }
-
-    return enums_map
+    return DomainScan(lib_path, domain_folder).enums_info
 
 
 def create_presentation_feature_layers(feature_dir: Path, feature_name: str, domain_model_name: str, domain_folder: str, project_name: str, folder: Optional[str], domain_model_folder: Optional[str] = None) -> None:
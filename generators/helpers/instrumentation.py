@@ -0,0 +1,128 @@
+"""Wiring of core/performance/ into an existing project (``add-instrumentation``).
+
+``flutterator create --perf`` renders router.dart, main.dart and the Dio module
+already wired. For projects created without it, these functions patch the
+three files in place. A file is reported ``manual`` instead of being touched
+when its shape is not recognized (hand-edited), with the snippet to add.
+"""
+
+import re
+from pathlib import Path
+
+WIRED = "wired"
+ALREADY_WIRED = "already wired"
+MANUAL = "manual"
+
+_IMPORT_LINE = re.compile(r"^import '[^']+';[ \t]*$", re.MULTILINE)
+
+# Snippets printed when a file has to be wired by hand
+MANUAL_HINTS = {
+    "router.dart": "GoRouter(observers: <NavigatorObserver>[getIt<PerformanceRouteObserver>()], ...)",
+    "main.dart": "getIt<PerformanceMonitor>().start();  // after configureDependencies(), before runApp()",
+    "apis/core/api_injectable_module.dart": "dio.interceptors.add(apiLatencyInterceptor);  // first in the chain",
+}
+
+
+def _add_imports(content: str, imports: list[str]) -> str:
+    """Add ``imports`` (package URIs) after the last import line, skipping existing ones."""
+    missing = [uri for uri in imports if f"import '{uri}';" not in content]
+    if not missing:
+        return content
+    lines = "".join(f"import '{uri}';\n" for uri in missing)
+    last = None
+    for last in _IMPORT_LINE.finditer(content):
+        pass
+    if last is None:
+        return lines + "\n" + content
+    return content[:last.end() + 1] + lines + content[last.end() + 1:]
+
+
+def wire_router(lib_path: Path, project_name: str) -> str:
+    """Add the PerformanceRouteObserver to the GoRouter in lib/router.dart."""
+    router_path = lib_path / "router.dart"
+    if not router_path.exists():
+        return MANUAL
+    content = router_path.read_text(encoding="utf-8")
+    if "PerformanceRouteObserver" in content:
+        return ALREADY_WIRED
+    match = re.search(r"GoRouter\(\s*\n", content)
+    if match is None or "observers:" in content:
+        return MANUAL
+    content = (
+        content[:match.end()]
+        + "  observers: <NavigatorObserver>[getIt<PerformanceRouteObserver>()],\n"
+        + content[match.end():]
+    )
+    content = _add_imports(content, [
+        f"package:{project_name}/core/performance/performance_route_observer.dart",
+        f"package:{project_name}/injection.dart",
+    ])
+    router_path.write_text(content, encoding="utf-8")
+    return WIRED
+
+
+def wire_main(lib_path: Path, project_name: str) -> str:
+    """Start the PerformanceMonitor in lib/main.dart, right before runApp()."""
+    main_path = lib_path / "main.dart"
+    if not main_path.exists():
+        return MANUAL
+    content = main_path.read_text(encoding="utf-8")
+    if "PerformanceMonitor" in content:
+        return ALREADY_WIRED
+    match = re.search(r"^([ \t]*)[^\n]*?\brunApp\(", content, re.MULTILINE)
+    if match is None or "configureDependencies" not in content[:match.start()]:
+        return MANUAL
+    indent = match.group(1)
+    content = (
+        content[:match.start()]
+        + f"{indent}// Frame timings, route build times and API latency, reported through Logger\n"
+        + f"{indent}getIt<PerformanceMonitor>().start();\n\n"
+        + content[match.start():]
+    )
+    content = _add_imports(content, [
+        f"package:{project_name}/core/performance/performance_monitor.dart",
+        f"package:{project_name}/injection.dart",
+    ])
+    main_path.write_text(content, encoding="utf-8")
+    return WIRED
+
+
+def wire_api_module(lib_path: Path, project_name: str) -> str:
+    """Inject ApiLatencyInterceptor into the Dio provider and add it first to the chain."""
+    module_path = lib_path / "apis" / "core" / "api_injectable_module.dart"
+    if not module_path.exists():
+        return MANUAL
+    content = module_path.read_text(encoding="utf-8")
+    if "ApiLatencyInterceptor" in content:
+        return ALREADY_WIRED
+    signature = re.search(r"Dio dio\(([^)]*)\)\s*\{", content)
+    chain = re.search(r"dio\.interceptors[ \t]*\n([ \t]*)", content)
+    if signature is None or chain is None or chain.start() < signature.end():
+        return MANUAL
+    params = signature.group(1).strip()
+    new_params = f"{params}, ApiLatencyInterceptor apiLatencyInterceptor" if params else "ApiLatencyInterceptor apiLatencyInterceptor"
+    indent = chain.group(1)
+    chain_at = chain.end()  # first cascade (or the comment above it)
+    content = (
+        content[:signature.start(1)]
+        + new_params
+        + content[signature.end(1):chain_at]
+        + f"..add(apiLatencyInterceptor)\n{indent}"
+        + content[chain_at:]
+    )
+    content = _add_imports(content, [f"package:{project_name}/core/performance/api_latency_interceptor.dart"])
+    module_path.write_text(content, encoding="utf-8")
+    return WIRED
+
+
+def wire_instrumentation(lib_path: Path, project_name: str) -> dict[str, str]:
+    """Wire core/performance/ into router.dart, main.dart and the Dio module.
+
+    Returns ``{file relative to lib/: status}`` with status ``wired``,
+    ``already wired`` or ``manual`` (see :data:`MANUAL_HINTS`).
+    """
+    return {
+        "router.dart": wire_router(lib_path, project_name),
+        "main.dart": wire_main(lib_path, project_name),
+        "apis/core/api_injectable_module.dart": wire_api_module(lib_path, project_name),
+    }
@@ -0,0 +1,210 @@
+"""Manifest of the files Flutterator rendered (``.flutterator/manifest.json``).
+
+One entry per generated file, keyed by its project-relative path::
+
+    "lib/domain/todo/model/todo.dart": {
+        "template": "feature/feature_entity_template.jinja",
+        "template_version": "<sha256 of the template source>",
+        "input_hash": "<sha256 of the template variables>",
+        "output_hash": "<sha256 of the rendered content>",
+        "size": 1234,
+        "mtime_ns": 1718000000000000000,
+        "entity_class": "Todo"
+    }
+
+``entity_class`` is only present for files that declare a freezed entity.
+
+The manifest answers "did Flutterator generate this file, from what, and has
+it been edited since?" without rendering or reading content. A file whose size
+and mtime match its entry is unchanged; otherwise its hash decides.
+``generate_file`` skips outputs whose template and inputs are unchanged and
+backs up hand-edited files before overwriting them.
+"""
+
+import atexit
+import hashlib
+import json
+import os
+import shutil
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+MANIFEST_FILE = Path(".flutterator") / "manifest.json"
+BACKUP_DIR = Path(".flutterator") / "backups"
+MANIFEST_VERSION = 1
+
+UNCHANGED = "unchanged"
+MODIFIED = "modified"
+MISSING = "missing"
+UNTRACKED = "untracked"
+
+
+def sha256_text(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def _canonical(value):
+    if isinstance(value, (set, frozenset)):
+        return sorted(_canonical(v) for v in value)
+    if isinstance(value, dict):
+        return {str(k): _canonical(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_canonical(v) for v in value]
+    if isinstance(value, (str, int, float, bool)) or value is None:
+        return value
+    return str(value)
+
+
+def hash_inputs(variables: dict) -> str:
+    """Stable hash of template variables (sets sorted, unknown objects by ``str``)."""
+    return sha256_text(json.dumps(_canonical(variables), sort_keys=True))
+
+
+def find_project_root(directory: Path) -> Optional[Path]:
+    """Nearest ancestor of ``directory`` (itself included) containing pubspec.yaml.
+
+    Not cached: relative paths depend on the cwd and ``create`` adds the
+    pubspec after the first lookups.
+    """
+    directory = Path(directory).absolute()
+    for candidate in (directory, *directory.parents):
+        if (candidate / "pubspec.yaml").is_file():
+            return candidate
+    return None
+
+
+class Manifest:
+    """Entries of one project's manifest, loaded once and saved by :func:`flush_manifests`."""
+
+    def __init__(self, root: Path, entries: Optional[Dict[str, dict]] = None):
+        self.root = Path(root)
+        self.path = self.root / MANIFEST_FILE
+        self.entries: Dict[str, dict] = entries or {}
+        self.dirty = False
+        self.skipped = 0
+        self.backed_up: List[str] = []
+        self.session = time.strftime("%Y%m%d-%H%M%S")
+
+    @classmethod
+    def load(cls, root: Path) -> Optional["Manifest"]:
+        """Read ``<root>/.flutterator/manifest.json``; None if absent or unreadable."""
+        try:
+            data = json.loads((Path(root) / MANIFEST_FILE).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if data.get("version") != MANIFEST_VERSION:
+            return None
+        return cls(root, data.get("files") or {})
+
+    def relpath(self, path: Path) -> str:
+        return Path(os.path.relpath(Path(path).absolute(), self.root)).as_posix()
+
+    def get(self, rel: str) -> Optional[dict]:
+        return self.entries.get(rel)
+
+    def file_status(self, rel: str) -> str:
+        """``unchanged``/``modified``/``missing`` for tracked files, ``untracked`` otherwise."""
+        entry = self.entries.get(rel)
+        if entry is None:
+            return UNTRACKED
+        try:
+            stat = os.stat(self.root / rel)
+        except FileNotFoundError:
+            return MISSING
+        if stat.st_size == entry.get("size") and stat.st_mtime_ns == entry.get("mtime_ns"):
+            return UNCHANGED
+        content = (self.root / rel).read_text(encoding="utf-8", errors="replace")
+        if sha256_text(content) != entry.get("output_hash"):
+            return MODIFIED
+        # Touched but identical: remember the new stat so the next check is cheap
+        entry["size"], entry["mtime_ns"] = stat.st_size, stat.st_mtime_ns
+        self.dirty = True
+        return UNCHANGED
+
+    def matches(self, rel: str, template_version: str, input_hash: str) -> bool:
+        """True if ``rel`` was last rendered from the same template version and inputs."""
+        entry = self.entries.get(rel)
+        return (
+            entry is not None
+            and entry.get("template_version") == template_version
+            and entry.get("input_hash") == input_hash
+        )
+
+    def backup(self, rel: str) -> Path:
+        """Copy a hand-edited file to ``.flutterator/backups/<session>/<rel>``."""
+        target = self.root / BACKUP_DIR / self.session / rel
+        target.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copy2(self.root / rel, target)
+        self.backed_up.append(rel)
+        return target
+
+    def record(self, rel: str, template: str, template_version: str, input_hash: str, content: str, entity_class: Optional[str] = None) -> None:
+        stat = os.stat(self.root / rel)
+        entry = {
+            "template": template,
+            "template_version": template_version,
+            "input_hash": input_hash,
+            "output_hash": sha256_text(content),
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+        }
+        if entity_class:
+            entry["entity_class"] = entity_class
+        self.entries[rel] = entry
+        self.dirty = True
+
+    def forget(self, rel: str) -> None:
+        if self.entries.pop(rel, None) is not None:
+            self.dirty = True
+
+    def save(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        data = {"version": MANIFEST_VERSION, "files": dict(sorted(self.entries.items()))}
+        self.path.write_text(json.dumps(data, indent=2) + "\n", encoding="utf-8")
+        self.dirty = False
+
+
+_MANIFESTS: Dict[Path, Manifest] = {}
+
+
+def manifest_at(root: Path, create: bool = False) -> Optional[Manifest]:
+    """Shared :class:`Manifest` of the project at ``root`` (loaded once per process).
+
+    Returns None when the project has no manifest yet, unless ``create``.
+    """
+    root = Path(root).absolute()
+    if root not in _MANIFESTS:
+        manifest = Manifest.load(root)
+        if manifest is None and not create:
+            return None
+        if not _MANIFESTS:
+            atexit.register(flush_manifests)
+        _MANIFESTS[root] = manifest or Manifest(root)
+    return _MANIFESTS[root]
+
+
+def manifest_for(path: Path) -> Optional[Manifest]:
+    """Manifest of the Flutter project containing ``path`` (created on first use), or None outside one."""
+    root = find_project_root(Path(path))
+    return manifest_at(root, create=True) if root is not None else None
+
+
+def flush_manifests() -> List[Manifest]:
+    """Save every modified manifest; return the manifests touched in this process."""
+    for manifest in _MANIFESTS.values():
+        if manifest.dirty:
+            manifest.save()
+    return list(_MANIFESTS.values())
+
+
+def close_manifests() -> List[Manifest]:
+    """Save and forget every manifest; the next lookup reads them from disk again."""
+    manifests = flush_manifests()
+    _MANIFESTS.clear()
+    return manifests
+
+
+def discard_manifests() -> None:
+    """Forget every manifest without saving (e.g. the project was thrown away)."""
+    _MANIFESTS.clear()
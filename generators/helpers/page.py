@@ -4,6 +4,7 @@ import click
 from pathlib import Path
 from typing import Optional
 from generators.templates.copier import generate_file
+from generators.templates._core.core_generator import ensure_common_widgets
 
 
 def generate_page_file(page_name: str, presentation_dir: Path, project_name: str) -> None:
@@ -13,8 +14,22 @@ def generate_page_file(page_name: str, presentation_dir: Path, project_name: str
     })
 
 
-def update_router(project_dir: Path, page_name: str, project_name: str, folder: Optional[str] = None) -> None:
-    """Update the router.dart file to include the new page"""
+def ensure_deferred_page(project_name: str, lib_path: Path) -> None:
+    """Generate core/presentation/deferred_page.dart if it doesn't already exist."""
+    ensure_common_widgets(project_name, lib_path)
+    target = lib_path / "core" / "presentation" / "deferred_page.dart"
+    if not target.exists():
+        generate_file(project_name, lib_path, "core/presentation/deferred_page_template.jinja", "core/presentation/deferred_page.dart")
+
+
+def update_router(project_dir: Path, page_name: str, project_name: str, folder: Optional[str] = None, deferred: bool = False) -> None:
+    """Update the router.dart file to include the new page.
+
+    With ``deferred=True`` the page is imported with ``deferred as`` and built
+    through ``DeferredPage``, so its code is loaded on first navigation. The
+    route path is written as a literal because constants of a deferred library
+    cannot be read before ``loadLibrary()``.
+    """
     router_path = project_dir / "lib" / "router.dart"
     if not router_path.exists():
         click.echo("⚠️ router.dart not found, skipping router update")
@@ -30,8 +45,18 @@ def update_router(project_dir: Path, page_name: str, project_name: str, folder:
     content = router_path.read_text()
     
     # Add import
-    import_line = f"import 'package:{project_name}/{import_prefix}/{page_name}_page.dart';"
-    if import_line not in content:
+    page_import = f"import 'package:{project_name}/{import_prefix}/{page_name}_page.dart'"
+    if deferred:
+        deferred_prefix = f"{page_name}_page"
+        import_lines = [
+            f"import 'package:{project_name}/core/presentation/deferred_page.dart';",
+            f"{page_import} deferred as {deferred_prefix};",
+        ]
+    else:
+        import_lines = [f"{page_import};"]
+    for import_line in import_lines:
+        if import_line in content:
+            continue
         # Find where to insert import (after other imports)
         lines = content.split('\n')
         insert_index = 0
@@ -45,7 +70,16 @@ def update_router(project_dir: Path, page_name: str, project_name: str, folder:
         content = '\n'.join(lines)
     
     # Add route
-    route_line = f"""GoRoute(
+    if deferred:
+        route_line = f"""GoRoute(
+      path: '/{page_name}',
+      builder: (BuildContext context, GoRouterState state) => DeferredPage(
+        loadLibrary: {deferred_prefix}.loadLibrary,
+        builder: (BuildContext context) => {deferred_prefix}.{page_name.capitalize()}Page(),
+      ),
+    ),"""
+    else:
+        route_line = f"""GoRoute(
       path: {page_name.capitalize()}Page.routeName,
       builder: (BuildContext context, GoRouterState state) => const {page_name.capitalize()}Page(),
     ),"""
@@ -0,0 +1,77 @@
+"""Wall time and filesystem call counts of one command (``flutterator --profile``).
+
+While a :class:`FsProfile` is active, ``os.stat``, ``os.lstat``, ``os.scandir``
+and ``os.listdir`` are wrapped with counters; ``pathlib`` and ``os.path``
+(``exists``, ``is_dir``, ``is_file``, ``iterdir``...) go through them. File
+opens are counted through an audit hook. ``DirEntry.is_dir()`` answers from
+the directory listing without a ``stat`` and is therefore not counted.
+"""
+
+import os
+import sys
+import time
+from collections import Counter
+from typing import Callable, List
+
+COUNTED_CALLS = ("stat", "lstat", "scandir", "listdir")
+
+_active: List["FsProfile"] = []
+_audit_hook_installed = False
+
+
+def _audit(event: str, args: tuple) -> None:
+    if event == "open" and _active:
+        _active[-1].counts["open"] += 1
+
+
+class FsProfile:
+    """Count filesystem calls between :meth:`start` and :meth:`stop` (or as a context manager)."""
+
+    def __init__(self):
+        self.counts: Counter = Counter()
+        self.elapsed = 0.0
+        self._started = 0.0
+        self._originals: dict = {}
+
+    def _counting(self, name: str, original: Callable) -> Callable:
+        def wrapper(*args, **kwargs):
+            self.counts[name] += 1
+            return original(*args, **kwargs)
+        return wrapper
+
+    def start(self) -> "FsProfile":
+        global _audit_hook_installed
+        for name in COUNTED_CALLS:
+            original = getattr(os, name)
+            self._originals[name] = original
+            setattr(os, name, self._counting(name, original))
+        if not _audit_hook_installed:
+            # Audit hooks cannot be removed; it only counts while a profile is active
+            sys.addaudithook(_audit)
+            _audit_hook_installed = True
+        _active.append(self)
+        self._started = time.perf_counter()
+        return self
+
+    def stop(self) -> "FsProfile":
+        self.elapsed = time.perf_counter() - self._started
+        for name, original in self._originals.items():
+            setattr(os, name, original)
+        self._originals = {}
+        if self in _active:
+            _active.remove(self)
+        return self
+
+    @property
+    def stat_calls(self) -> int:
+        return self.counts["stat"] + self.counts["lstat"]
+
+    @property
+    def listing_calls(self) -> int:
+        return self.counts["scandir"] + self.counts["listdir"]
+
+    def __enter__(self) -> "FsProfile":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
@@ -0,0 +1,140 @@
+"""Dependency and code-size audit of a generated project (``audit-size``).
+
+Cross-references the ``package:`` imports under lib/ with the dependencies
+declared in pubspec.yaml, and attributes the Dart AOT size reported by
+``flutter build <target> --analyze-size`` to packages and to the top-level
+folders of the app package (core, features, domain, ...).
+"""
+
+import json
+import re
+import subprocess
+from pathlib import Path
+from typing import Optional
+
+import yaml
+
+_PACKAGE_IMPORT = re.compile(r"^\s*(?:import|export)\s+['\"]package:(\w+)/", re.MULTILINE)
+_ANALYSIS_FILE = re.compile(r"(\S+code-size-analysis_\d+\.json)")
+
+# Declared dependencies that are used without a Dart import
+IMPLICIT_DEPENDENCIES = {
+    "json_annotation": "required by json_serializable / freezed fromJson codegen",
+    "flutter_lints": "included by analysis_options.yaml",
+}
+
+# `flutter build` targets that support --analyze-size
+ANALYZE_SIZE_TARGETS = ["apk", "appbundle", "ios", "linux", "macos", "windows"]
+
+
+def scan_package_imports(root: Path) -> dict[str, set[str]]:
+    """Return ``{package: {files importing it}}`` for the .dart files under ``root``.
+
+    Generated parts (``*.g.dart``, ``*.freezed.dart``, ``*.config.dart``) are
+    scanned too; file paths are relative to ``root``.
+    """
+    root = Path(root)
+    imports: dict[str, set[str]] = {}
+    if not root.is_dir():
+        return imports
+    for dart_file in root.rglob("*.dart"):
+        rel = dart_file.relative_to(root).as_posix()
+        for package in _PACKAGE_IMPORT.findall(dart_file.read_text(encoding="utf-8", errors="ignore")):
+            imports.setdefault(package, set()).add(rel)
+    return imports
+
+
+def read_pubspec_dependencies(project_path: Path) -> tuple[dict, dict]:
+    """Return ``(dependencies, dev_dependencies)`` declared in pubspec.yaml."""
+    pubspec = Path(project_path) / "pubspec.yaml"
+    if not pubspec.is_file():
+        return {}, {}
+    data = yaml.safe_load(pubspec.read_text(encoding="utf-8")) or {}
+    return data.get("dependencies") or {}, data.get("dev_dependencies") or {}
+
+
+def audit_dependencies(project_path: Path, project_name: Optional[str] = None) -> dict:
+    """Compare lib/ imports with pubspec.yaml.
+
+    Returns a dict with:
+      - ``used``: ``{package: sorted files}`` for declared dependencies imported by lib/
+      - ``implicit``: ``{package: reason}`` for declared dependencies used without an import
+      - ``unused``: declared (non-SDK) dependencies that nothing in lib/ imports
+      - ``undeclared``: packages imported by lib/ but missing from ``dependencies``
+    """
+    project_path = Path(project_path)
+    dependencies, _ = read_pubspec_dependencies(project_path)
+    imports = scan_package_imports(project_path / "lib")
+    if project_name:
+        imports.pop(project_name, None)
+
+    used, implicit, unused = {}, {}, []
+    for package, spec in dependencies.items():
+        if isinstance(spec, dict) and "sdk" in spec:
+            continue
+        if package in imports:
+            used[package] = sorted(imports[package])
+        elif package in IMPLICIT_DEPENDENCIES:
+            implicit[package] = IMPLICIT_DEPENDENCIES[package]
+        else:
+            unused.append(package)
+    undeclared = sorted(package for package in imports if package not in dependencies)
+    return {"used": used, "implicit": implicit, "unused": sorted(unused), "undeclared": undeclared}
+
+
+def _node_size(node: dict) -> int:
+    if "value" in node:
+        return int(node["value"])
+    return sum(_node_size(child) for child in node.get("children", []))
+
+
+def attribute_size(analysis: dict, project_name: str) -> dict[str, int]:
+    """Sum the Dart AOT size of an ``--analyze-size`` JSON tree by owner.
+
+    Keys are ``package:<name>`` / ``dart:<lib>`` for dependencies and the SDK,
+    and ``<project_name>/<folder>`` for the first path segment of the app
+    package (``my_app/core``, ``my_app/features``, ``my_app/main.dart``...).
+    """
+    sizes: dict[str, int] = {}
+    app_package = f"package:{project_name}"
+
+    def visit(node: dict) -> None:
+        name = node.get("n", "")
+        if name == app_package:
+            for child in node.get("children", []):
+                key = f"{project_name}/{child.get('n', '')}"
+                sizes[key] = sizes.get(key, 0) + _node_size(child)
+            return
+        if name.startswith("package:") or name.startswith("dart:"):
+            sizes[name] = sizes.get(name, 0) + _node_size(node)
+            return
+        for child in node.get("children", []):
+            visit(child)
+
+    visit(analysis)
+    return sizes
+
+
+def run_size_analysis(project_path: Path, target: str = "apk") -> Path:
+    """Run ``flutter build <target> --analyze-size`` and return the analysis JSON path.
+
+    Raises:
+        FileNotFoundError: If ``flutter`` is not available.
+        subprocess.CalledProcessError: If the build fails.
+        RuntimeError: If the output does not name an analysis file.
+    """
+    project_path = Path(project_path)
+    cmd = ["flutter", "build", target, "--analyze-size"]
+    if target in ("apk", "appbundle"):
+        # One ABI: --analyze-size does not support fat APKs
+        cmd += ["--target-platform", "android-arm64"]
+    completed = subprocess.run(cmd, cwd=project_path, check=True, capture_output=True, text=True)
+    match = _ANALYSIS_FILE.search(completed.stdout + completed.stderr)
+    if match is None:
+        raise RuntimeError("flutter build did not report a code-size analysis file")
+    analysis_path = Path(match.group(1))
+    return analysis_path if analysis_path.is_absolute() else project_path / analysis_path
+
+
+def load_size_analysis(path: Path) -> dict:
+    return json.loads(Path(path).read_text(encoding="utf-8"))
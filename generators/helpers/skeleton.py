@@ -0,0 +1,199 @@
+"""Pre-built project skeletons for ``flutterator create --skeleton-cache``.
+
+A skeleton is a project created once with the regular pipeline (``flutter
+create``, templates, ``pub add``, ``build_runner``) under the placeholder name
+:data:`SKELETON_NAME`, and stored in ``~/.cache/flutterator/skeletons/<key>/``.
+The key hashes everything the output depends on: Flutterator version, Flutter
+SDK version, the generator sources and templates, ``--login``/``--minimal``
+and the resolved configuration (colors, API, logging, startup...).
+
+Later ``create`` calls with the same key copy the skeleton and rewrite the
+placeholder (``flutterator_skeleton_app``, ``flutteratorSkeletonApp``,
+``FlutteratorSkeletonApp``, ``Flutterator Skeleton App``) in file contents and
+paths. Only ``flutter pub get --offline`` is left to run.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import subprocess
+import tempfile
+from contextlib import contextmanager
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Iterator, Optional
+
+from .file_copy import copy_file
+from .manifest import MANIFEST_FILE, close_manifests, discard_manifests, sha256_text
+
+SKELETON_NAME = "flutterator_skeleton_app"
+SKELETON_CACHE_LIMIT = 5  # skeletons kept, most recently used first
+
+GENERATORS_DIR = Path(__file__).resolve().parent.parent
+
+# Build outputs that are machine-specific or regenerated by `flutter pub get`
+_BUILD_OUTPUTS = (".dart_tool", "build", ".flutterator/backups")
+
+
+def skeleton_cache_dir() -> Path:
+    """``$FLUTTERATOR_CACHE_DIR`` or ``$XDG_CACHE_HOME/flutterator`` (``~/.cache/flutterator``), plus ``skeletons``."""
+    base = os.environ.get("FLUTTERATOR_CACHE_DIR")
+    if not base:
+        base = os.path.join(os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"), "flutterator")
+    return Path(base) / "skeletons"
+
+
+@lru_cache(maxsize=None)
+def flutter_sdk_version() -> str:
+    """Framework version reported by ``flutter --version --machine`` (raises FileNotFoundError without flutter)."""
+    result = subprocess.run(["flutter", "--version", "--machine"], check=True, capture_output=True, text=True)
+    try:
+        return json.loads(result.stdout)["frameworkVersion"]
+    except (ValueError, KeyError):
+        return sha256_text(result.stdout)
+
+
+@lru_cache(maxsize=None)
+def generators_hash() -> str:
+    """Hash of every generator source and template (paths and contents)."""
+    digest = hashlib.sha256()
+    for path in sorted(GENERATORS_DIR.rglob("*")):
+        if not path.is_file() or "__pycache__" in path.parts:
+            continue
+        digest.update(path.relative_to(GENERATORS_DIR).as_posix().encode())
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def skeleton_key(flutterator_version: str, flutter_version: str, options: dict) -> str:
+    """Cache key of a skeleton; ``options`` must be JSON-serializable."""
+    payload = {
+        "flutterator": flutterator_version,
+        "flutter": flutter_version,
+        "generators": generators_hash(),
+        "options": options,
+    }
+    return sha256_text(json.dumps(payload, sort_keys=True, default=str))[:16]
+
+
+def find_skeleton(key: str) -> Optional[Path]:
+    """Cached skeleton project for ``key``, or None."""
+    project = skeleton_cache_dir() / key / SKELETON_NAME
+    if not (project / "pubspec.yaml").is_file():
+        return None
+    os.utime(project.parent)  # most recently used, see _prune
+    return project
+
+
+def _prune(keep: int = SKELETON_CACHE_LIMIT) -> None:
+    entries = [p for p in skeleton_cache_dir().iterdir() if p.is_dir() and not p.name.startswith(".")]
+    entries.sort(key=lambda p: p.stat().st_mtime, reverse=True)
+    for stale in entries[keep:]:
+        shutil.rmtree(stale, ignore_errors=True)
+
+
+@contextmanager
+def skeleton_build(key: str) -> Iterator[Path]:
+    """Build a skeleton: yields a staging directory that is the current directory meanwhile.
+
+    Create the project there as ``SKELETON_NAME`` (the pipeline works with
+    paths relative to the cwd). On success it is stored under ``key``; on
+    error the staging directory is removed.
+    """
+    cache_dir = skeleton_cache_dir()
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    staging = Path(tempfile.mkdtemp(prefix=".build-", dir=cache_dir))
+    previous_cwd = os.getcwd()
+    try:
+        os.chdir(staging)
+        try:
+            yield staging
+        except BaseException:
+            discard_manifests()
+            raise
+        finally:
+            os.chdir(previous_cwd)
+        close_manifests()
+        project = staging / SKELETON_NAME
+        for output in _BUILD_OUTPUTS:
+            shutil.rmtree(project / output, ignore_errors=True)
+        target = cache_dir / key
+        if not (target / SKELETON_NAME / "pubspec.yaml").is_file():
+            shutil.rmtree(target, ignore_errors=True)
+            os.replace(staging, target)
+        _prune()
+    finally:
+        shutil.rmtree(staging, ignore_errors=True)
+
+
+def name_variants(project_name: str) -> Dict[str, str]:
+    """Spellings of a snake_case name used by ``flutter create`` (bundle ids, display names...)."""
+    words = [w for w in project_name.split("_") if w]
+    pascal = "".join(w[:1].upper() + w[1:] for w in words)
+    return {
+        "snake": project_name,
+        "camel": pascal[:1].lower() + pascal[1:],
+        "pascal": pascal,
+        "title": " ".join(w[:1].upper() + w[1:] for w in words),
+    }
+
+
+def _rewrite(text: str, replacements: Dict[str, str]) -> str:
+    for old, new in replacements.items():
+        text = text.replace(old, new)
+    return text
+
+
+def materialize_skeleton(skeleton: Path, dest: Path, project_name: str) -> int:
+    """Copy ``skeleton`` to ``dest`` renaming the placeholder to ``project_name``; return files rewritten.
+
+    Files without the placeholder are copied as-is (see ``copy_file``). Manifest
+    entries of rewritten files get the new output hash, so they are not seen
+    as hand-edited; their input hash is cleared so the next generation
+    re-renders them.
+    """
+    old, new = name_variants(SKELETON_NAME), name_variants(project_name)
+    replacements = {old[kind]: new[kind] for kind in ("snake", "pascal", "camel", "title")}
+    encoded = [placeholder.encode() for placeholder in replacements]
+    rewritten = []
+
+    for dirpath, _, filenames in os.walk(skeleton):
+        rel_dir = Path(dirpath).relative_to(skeleton)
+        for filename in filenames:
+            src = Path(dirpath) / filename
+            rel = Path(_rewrite((rel_dir / filename).as_posix(), replacements))
+            target = dest / rel
+            data = src.read_bytes()
+            if any(placeholder in data for placeholder in encoded):
+                try:
+                    text = data.decode("utf-8")
+                except UnicodeDecodeError:
+                    copy_file(src, target)
+                    continue
+                target.parent.mkdir(parents=True, exist_ok=True)
+                target.write_text(_rewrite(text, replacements), encoding="utf-8")
+                shutil.copymode(src, target)
+                rewritten.append(rel.as_posix())
+            else:
+                copy_file(src, target)
+
+    _adopt_rewritten(dest, rewritten)
+    return len(rewritten)
+
+
+def _adopt_rewritten(project: Path, rewritten: list) -> None:
+    manifest_path = project / MANIFEST_FILE
+    if not manifest_path.is_file():
+        return
+    data = json.loads(manifest_path.read_text(encoding="utf-8"))
+    files = data.get("files") or {}
+    for rel in rewritten:
+        entry = files.get(rel)
+        if entry is None:
+            continue
+        stat = os.stat(project / rel)
+        entry["output_hash"] = sha256_text((project / rel).read_text(encoding="utf-8"))
+        entry["size"], entry["mtime_ns"] = stat.st_size, stat.st_mtime_ns
+        entry["input_hash"] = ""
+    manifest_path.write_text(json.dumps(data, indent=2) + "\n", encoding="utf-8")
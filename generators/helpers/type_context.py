@@ -0,0 +1,86 @@
+"""Type resolution context shared by field validation and code generation.
+
+Enums and domain models are discovered by scanning lib/<domain_folder>/; a
+``TypeResolutionContext`` holds one :class:`DomainScan` (each directory listed
+at most once, lazily) and answers every later lookup from dicts/sets, so
+validating or mapping an entity with many relation fields no longer re-reads
+the domain per field.
+
+Build one per command, after the domain is in the state the command expects,
+and pass it down. Call :meth:`refresh` if the command itself adds enums or
+models before resolving again.
+"""
+
+from functools import cached_property
+from pathlib import Path
+from typing import Dict, FrozenSet, Optional
+
+from .discovery import DomainScan
+from .utils import DART_TOP_TYPES, KNOWN_VALUE_OBJECTS, PRIMITIVE_TYPES
+
+
+class TypeResolutionContext:
+    """Cached view of the primitives, value objects, enums and models of a project."""
+
+    primitives: FrozenSet[str] = frozenset(PRIMITIVE_TYPES)
+    value_objects: FrozenSet[str] = frozenset(KNOWN_VALUE_OBJECTS)
+    top_types: FrozenSet[str] = frozenset(DART_TOP_TYPES)
+
+    def __init__(self, lib_path: Optional[Path], domain_folder: str = "domain"):
+        self.lib_path = Path(lib_path) if lib_path else None
+        self.domain_folder = domain_folder or "domain"
+        self.scan: Optional[DomainScan] = DomainScan(self.lib_path, self.domain_folder) if self.lib_path else None
+
+    @cached_property
+    def enums_info(self) -> Dict[str, dict]:
+        """``{EnumName: {'file_stem', 'folder'}}`` (see ``find_enums_with_info``)."""
+        return self.scan.enums_info if self.scan else {}
+
+    @cached_property
+    def enums(self) -> FrozenSet[str]:
+        return frozenset(self.enums_info)
+
+    @cached_property
+    def models(self) -> Dict[str, dict]:
+        """``{file_stem: {'class_name', 'folder'}}`` (see ``find_domain_models_with_class_names``)."""
+        return self.scan.models if self.scan else {}
+
+    @cached_property
+    def class_to_stem(self) -> Dict[str, str]:
+        """Reverse map of :attr:`models`: ``{ClassName: file_stem}``."""
+        return {info['class_name']: stem for stem, info in self.models.items()}
+
+    def refresh(self) -> None:
+        """Drop the cached scan; the next lookup re-reads the domain folder."""
+        for name in ("enums_info", "enums", "models", "class_to_stem"):
+            self.__dict__.pop(name, None)
+        if self.lib_path:
+            self.scan = DomainScan(self.lib_path, self.domain_folder)
+
+    def is_enum(self, name: str) -> bool:
+        return name in self.enums
+
+    def model_class_name(self, name: str) -> Optional[str]:
+        """Class name of the model ``name`` refers to (class name or file stem), or None."""
+        if name in self.class_to_stem:
+            return name
+        info = self.models.get(name)
+        return info['class_name'] if info else None
+
+    def model_info(self, class_name: str) -> Optional[tuple[str, dict]]:
+        """``(file_stem, info)`` of the model with ``class_name``, or None."""
+        stem = self.class_to_stem.get(class_name)
+        return (stem, self.models[stem]) if stem is not None else None
+
+    def is_domain_model(self, name: str) -> bool:
+        """PascalCase type that is not a primitive, value object, Object or enum (see ``utils._is_domain_model``)."""
+        return (
+            bool(name) and name[0].isupper() and name not in self.primitives and name not in self.value_objects
+            and name not in self.top_types and name not in self.enums
+        )
+
+    def describe_models(self) -> str:
+        """``"stem (ClassName), ..."`` for error messages."""
+        if not self.models:
+            return 'none'
+        return ', '.join(f"{stem} ({info['class_name']})" for stem, info in self.models.items())
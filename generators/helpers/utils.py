@@ -1,6 +1,11 @@
 """Utility functions for Flutterator"""
 
-from typing import Optional, Set
+from typing import TYPE_CHECKING, Optional, Set
+
+from .dart_type import DartType, intern_dart_type, parse_dart_type
+
+if TYPE_CHECKING:
+    from .type_context import TypeResolutionContext
 
 
 def to_pascal_case(snake_str: str) -> str:
@@ -112,6 +117,8 @@ def pascal_case_to_kebab_case(pascal_str: str) -> str:
 
 PRIMITIVE_TYPES = {'String', 'int', 'double', 'bool', 'DateTime'}
 KNOWN_VALUE_OBJECTS = {'UniqueId'}
+# Accepted as generic arguments (Map<String, dynamic>); never mapped to a DTO
+DART_TOP_TYPES = {'dynamic', 'Object'}
 
 
 def get_form_field_metadata(base_type: str, field_name: str, known_enums: Optional[Set[str]] = None) -> dict:
@@ -226,11 +233,13 @@ def get_form_field_metadata(base_type: str, field_name: str, known_enums: Option
     }
 
 
-def _is_domain_model(t: str, known_enums: Optional[Set[str]] = None) -> bool:
+def _is_domain_model(t: str, known_enums: Optional[Set[str]] = None, context: Optional["TypeResolutionContext"] = None) -> bool:
     """Check if a type is a domain model (PascalCase, not a primitive, known VO, or enum)."""
+    if context is not None:
+        return context.is_domain_model(t)
     if not t or not t[0].isupper():
         return False
-    if t in PRIMITIVE_TYPES or t in KNOWN_VALUE_OBJECTS:
+    if t in PRIMITIVE_TYPES or t in KNOWN_VALUE_OBJECTS or t in DART_TOP_TYPES:
         return False
     if known_enums and t in known_enums:
         return False
@@ -239,7 +248,7 @@ def _is_domain_model(t: str, known_enums: Optional[Set[str]] = None) -> bool:
 
 def _dto_for_single_type(t: str, known_enums: Optional[Set[str]] = None) -> str:
     """Map a single (non-generic) type to its DTO equivalent."""
-    if t in PRIMITIVE_TYPES:
+    if t in PRIMITIVE_TYPES or t in DART_TOP_TYPES:
         return t
     if t in KNOWN_VALUE_OBJECTS:
         return 'String'
@@ -247,7 +256,7 @@ def _dto_for_single_type(t: str, known_enums: Optional[Set[str]] = None) -> str:
         return 'String'
     if t and t[0].isupper():
         return f"{t}Dto"
-    return t
+    return map_field_type(t)
 
 
 def map_field_type(field_type: str) -> str:
@@ -270,10 +279,14 @@ def map_field_type(field_type: str) -> str:
     return type_mapping.get(field_type.lower(), field_type)
 
 
-def map_field_type_to_dto(field_type: str, known_enums: Optional[Set[str]] = None) -> str:
+def map_field_type_to_dto(field_type: str, known_enums: Optional[Set[str]] = None, context: Optional["TypeResolutionContext"] = None) -> str:
     """
     Map field type from string to Dart type for DTOs.
     
+    Enums come from ``context.enums`` when a TypeResolutionContext is given,
+    otherwise from ``known_enums``. Generic arguments are mapped recursively
+    (``Map<String, List<Todo>>`` -> ``Map<String, List<TodoDto>>``).
+    
     Conversions:
         Type?           -> Type? (nullable). UniqueId? -> String?, Model? -> ModelDto?
         Enum            -> String (when known_enums is provided and type is in set)
@@ -283,56 +296,23 @@ def map_field_type_to_dto(field_type: str, known_enums: Optional[Set[str]] = Non
         Map<K, V>       -> Map<KDto, VDto> (only domain models get Dto suffix)
         UniqueId        -> String
         DomainModel     -> DomainModelDto
-        primitives      -> as-is
+        primitives, dynamic, Object -> as-is
     """
-    import re
+    if context is not None:
+        known_enums = context.enums
     
-    # Nullable suffix: Type? -> DtoType? (including List<T>? -> List<TDto>?)
-    if field_type.endswith('?'):
-        base = field_type[:-1]
-        if '<' in base and '>' in base:
-            return f"{map_field_type_to_dto(base, known_enums)}?"
-        dto_base = _dto_for_single_type(base, known_enums)
-        return f"{dto_base}?"
-    
-    if '<' in field_type and '>' in field_type:
-        # Option<T> -> T? (kept for backward compat with static templates)
-        option_match = re.match(r'^Option\s*<\s*(\w+)\s*>$', field_type)
-        if option_match:
-            inner = option_match.group(1)
-            dto_inner = _dto_for_single_type(inner, known_enums)
-            return f"{dto_inner}?"
-        
-        # Map<K, V>
-        map_match = re.match(r'^(\w+)\s*<\s*(\w+)\s*,\s*(\w+)\s*>$', field_type)
-        if map_match:
-            base = map_match.group(1)
-            key_type = map_match.group(2)
-            val_type = map_match.group(3)
-            dto_key = _dto_for_single_type(key_type, known_enums)
-            dto_val = _dto_for_single_type(val_type, known_enums)
-            return f"{base}<{dto_key}, {dto_val}>"
-        
-        # Single-param generic: List<T>, Set<T>
-        single_match = re.match(r'^(\w+)\s*<\s*(\w+)\s*>$', field_type)
-        if single_match:
-            base = single_match.group(1)
-            inner = single_match.group(2)
-            dto_inner = _dto_for_single_type(inner, known_enums)
-            return f"{base}<{dto_inner}>"
-        
+    try:
+        parsed = parse_dart_type(field_type)
+    except ValueError:
         return field_type
     
-    # UniqueId -> String in DTO
-    if field_type in KNOWN_VALUE_OBJECTS:
-        return 'String'
-    
-    # Enum -> String in DTO
-    if known_enums and field_type in known_enums:
-        return 'String'
-    
-    # Domain models -> ModelDto
-    if _is_domain_model(field_type, known_enums):
-        return f"{field_type}Dto"
+    def _to_dto(node: DartType) -> DartType:
+        # Option<T> -> T? (kept for backward compat with static templates)
+        if node.name == 'Option' and len(node.args) == 1:
+            inner = node.args[0]
+            return intern_dart_type(inner.name, inner.args, True)
+        if node.args:
+            return node
+        return intern_dart_type(_dto_for_single_type(node.name, known_enums), (), node.nullable)
     
-    return map_field_type(field_type)
+    return str(parsed.transform(_to_dto))
@@ -3,7 +3,8 @@
 import re
 from typing import Optional, List, Tuple, Dict
 from pathlib import Path
-from .feature import find_domain_models, find_domain_models_with_class_names, find_enums
+from .dart_type import DartType, parse_dart_type
+from .type_context import TypeResolutionContext
 from .utils import to_pascal_case
 
 
@@ -24,6 +25,9 @@ VALID_PRIMITIVE_TYPES = {
     'string', 'String', 'int', 'double', 'bool', 'Bool', 'DateTime', 'datetime', 'date'
 }
 
+# Field modifiers accepted after the type (e.g. "title:string@indexed")
+FIELD_MODIFIERS = {'indexed'}
+
 # Valid Dart collection types (without generic parameters)
 VALID_COLLECTION_TYPES = {
     'List', 'list', 'Set', 'set', 'Map', 'map'
@@ -60,74 +64,52 @@ def validate_field_name(field_name: str) -> Tuple[bool, Optional[str]]:
     return True, None
 
 
-def _find_matching_angle_bracket(field_type: str, open_idx: int) -> int:
-    """Return index of the `>` that closes the `<` at *open_idx*, or -1 if unbalanced."""
-    depth = 0
-    for j in range(open_idx, len(field_type)):
-        ch = field_type[j]
-        if ch == '<':
-            depth += 1
-        elif ch == '>':
-            depth -= 1
-            if depth == 0:
-                return j
-    return -1
-
-
 def parse_field_type(field_type: str) -> Tuple[str, Optional[str], Optional[str]]:
     """
-    Parse a field type, handling generics like List<NoteItem>, List<String?>, Map<String, int>.
+    Parse a field type, handling generics like List<NoteItem>, List<String?>, Map<String, List<int>>.
 
-    Uses balanced angle brackets so inner types may include `?` (e.g. List<String?>).
+    Thin wrapper over :func:`parse_dart_type` for callers that only need the
+    first level; use the :class:`DartType` directly to walk nested generics.
 
     Args:
         field_type: The field type string (e.g., "List<NoteItem>", "Map<String, int>", "string")
 
     Returns:
         Tuple of (base_type, generic_param1, generic_param2).
-        generic_param1/2 are None if not a generic type.
+        generic_param1/2 are None if not a generic type (or if the type is
+        nullable or malformed, in which case base_type is the input unchanged).
         For Map<K, V>: returns (Map, K, V).
         For List<T>/Set<T>: returns (List, T, None).
     """
     field_type = field_type.strip()
-    m_head = re.match(r'^(\w+)\s*<', field_type)
-    if not m_head:
+    try:
+        parsed = parse_dart_type(field_type)
+    except ValueError:
         return field_type, None, None
-    base = m_head.group(1)
-    open_idx = field_type.find('<')
-
-    close_idx = _find_matching_angle_bracket(field_type, open_idx)
-    if close_idx == -1 or close_idx != len(field_type) - 1:
+    if parsed.nullable or not parsed.args:
         return field_type, None, None
-
-    inner = field_type[open_idx + 1:close_idx].strip()
-    if base.lower() == 'map':
-        depth = 0
-        split_at = -1
-        for k, ch in enumerate(inner):
-            if ch == '<':
-                depth += 1
-            elif ch == '>':
-                depth -= 1
-            elif ch == ',' and depth == 0:
-                split_at = k
-                break
-        if split_at == -1:
-            return field_type, None, None
-        k_type = inner[:split_at].strip()
-        v_type = inner[split_at + 1:].strip()
-        return base, k_type, v_type
-    return base, inner, None
+    params = [str(arg) for arg in parsed.args[:2]] + [None]
+    return parsed.name, params[0], params[1]
 
 
-def validate_field_type(field_type: str, lib_path: Optional[Path] = None, domain_folder: str = "domain") -> Tuple[bool, Optional[str], Optional[str]]:
+def validate_field_type(
+    field_type: str,
+    lib_path: Optional[Path] = None,
+    domain_folder: str = "domain",
+    context: Optional[TypeResolutionContext] = None,
+) -> Tuple[bool, Optional[str], Optional[str]]:
     """
     Validate a field type.
     
+    Generic arguments are validated recursively, so nested collections such
+    as ``Map<String, List<Todo>>`` are accepted.
+    
     Args:
         field_type: The field type to validate
         lib_path: Optional path to lib/ directory for checking domain models
         domain_folder: Domain folder name (default: "domain")
+        context: Enums/models of the project, scanned once; pass the same
+            context when validating several fields (built from lib_path if omitted)
         
     Returns:
         Tuple of (is_valid, error_message, normalized_type)
@@ -138,14 +120,17 @@ def validate_field_type(field_type: str, lib_path: Optional[Path] = None, domain
     
     field_type = field_type.strip()
     
-    # Detect nullable suffix (e.g., String?, int?, SomeModel?)
-    is_nullable = field_type.endswith('?')
-    if is_nullable:
-        base_field_type = field_type[:-1].strip()
-    else:
-        base_field_type = field_type.strip()
+    try:
+        parsed = parse_dart_type(field_type)
+    except ValueError as e:
+        return False, f"Invalid field type '{field_type}': {e}", None
+    
+    # Nullable suffix (e.g., String?, int?, SomeModel?, List<T>?)
+    is_nullable = parsed.nullable
+    base_type = parsed.name
     
-    base_type, generic_param1, generic_param2 = parse_field_type(base_field_type)
+    if context is None and lib_path:
+        context = TypeResolutionContext(lib_path, domain_folder)
     
     base_type_lower = base_type.lower()
     
@@ -160,18 +145,45 @@ def validate_field_type(field_type: str, lib_path: Optional[Path] = None, domain
     def _normalize_primitive(t: str) -> str:
         return NORMALIZE_PRIMITIVE.get(t.lower(), t)
     
-    def _resolve_generic_type(gtype: str) -> Tuple[bool, Optional[str], Optional[str]]:
-        """Resolve a generic type parameter: primitive, known VO, enum, or domain model.
+    def _resolve_collection(node: DartType) -> Tuple[bool, Optional[str], Optional[str]]:
+        """Resolve List<T>, Set<T> or Map<K, V> (ignoring the node's own ``?``)."""
+        normalized_base = node.collection
+        
+        if normalized_base == 'Map':
+            if len(node.args) != 2:
+                return False, f"Map requires two generic parameters (e.g., Map<String, int>)", None
+            ok1, err1, norm_key = _resolve_generic_type(node.args[0])
+            if not ok1:
+                return False, f"Invalid Map key type: {err1}", None
+            ok2, err2, norm_val = _resolve_generic_type(node.args[1])
+            if not ok2:
+                return False, f"Invalid Map value type: {err2}", None
+            return True, None, f"Map<{norm_key}, {norm_val}>"
+        
+        if not node.args:
+            return False, f"Collection type '{node.name}' requires a generic parameter (e.g., {normalized_base}<ItemType>)", None
+        if len(node.args) > 1:
+            return False, f"'{normalized_base}' takes only one generic parameter", None
+        ok, err, normalized_inner = _resolve_generic_type(node.args[0])
+        if not ok:
+            return False, err, None
+        return True, None, f"{normalized_base}<{normalized_inner}>"
+    
+    def _resolve_generic_type(node: DartType) -> Tuple[bool, Optional[str], Optional[str]]:
+        """Resolve a generic type parameter: primitive, known VO, enum, domain model or nested collection.
 
         Inner nullability is allowed (e.g. ``String?``, ``Todo?`` inside ``List<...>``).
         """
-        gtype = gtype.strip()
-        inner_nullable = gtype.endswith('?')
-        g_base = gtype[:-1].strip() if inner_nullable else gtype
+        g_base = node.name
 
         def _with_inner_null(norm: str) -> str:
-            return f"{norm}?" if inner_nullable else norm
+            return f"{norm}?" if node.nullable else norm
 
+        if node.collection:
+            ok, err, norm = _resolve_collection(node)
+            return (True, None, _with_inner_null(norm)) if ok else (False, err, None)
+        if node.args:
+            return False, f"Type '{g_base}' cannot have generic parameters (only List, Set and Map can)", None
         # Dart top types (e.g. Map<String, dynamic> for JSON blobs)
         if g_base.lower() == 'dynamic':
             return True, None, _with_inner_null('dynamic')
@@ -181,19 +193,13 @@ def validate_field_type(field_type: str, lib_path: Optional[Path] = None, domain
             return True, None, _with_inner_null(_normalize_primitive(g_base))
         if g_base in KNOWN_VALUE_OBJECT_TYPES:
             return True, None, _with_inner_null(g_base)
-        if lib_path:
-            known_enums = find_enums(lib_path, domain_folder)
-            if g_base in known_enums:
+        if context is not None:
+            if context.is_enum(g_base):
                 return True, None, _with_inner_null(g_base)
-            available_models = find_domain_models(lib_path, domain_folder)
-            models_with_classes = find_domain_models_with_class_names(lib_path, domain_folder)
-            if g_base in available_models:
-                return True, None, _with_inner_null(models_with_classes[g_base]['class_name'])
-            for _stem, info in models_with_classes.items():
-                if info['class_name'] == g_base:
-                    return True, None, _with_inner_null(g_base)
-            available_str = ', '.join([f"{k} ({v['class_name']})" for k, v in models_with_classes.items()]) if models_with_classes else 'none'
-            return False, f"Model '{g_base}' not found in domain. Available models: {available_str}. Create it first using: flutterator add-domain --name {g_base.lower()}", None
+            class_name = context.model_class_name(g_base)
+            if class_name:
+                return True, None, _with_inner_null(class_name)
+            return False, f"Model '{g_base}' not found in domain. Available models: {context.describe_models()}. Create it first using: flutterator add-domain --name {g_base.lower()}", None
         return False, f"Model '{g_base}' cannot be validated (lib_path not provided). Please ensure the project path is correct.", None
     
     def _with_nullable(normalized: str) -> str:
@@ -201,67 +207,41 @@ def validate_field_type(field_type: str, lib_path: Optional[Path] = None, domain
     
     # --- UniqueId (known value object, no generic) ---
     if base_type in KNOWN_VALUE_OBJECT_TYPES:
-        if generic_param1:
+        if parsed.args:
             return False, f"'{base_type}' does not take generic parameters", None
         return True, None, _with_nullable(base_type)
     
     # --- Primitive types ---
     if base_type_lower in VALID_PRIMITIVE_TYPES:
-        if generic_param1:
+        if parsed.args:
             return False, f"Primitive type '{base_type}' cannot have generic parameters", None
         return True, None, _with_nullable(_normalize_primitive(base_type))
     
-    # --- Collection types: List<T>, Set<T>, Map<K, V> ---
-    if base_type_lower in VALID_COLLECTION_TYPES:
-        normalized_base = {'list': 'List', 'set': 'Set', 'map': 'Map'}.get(base_type_lower, base_type)
-        
-        if normalized_base == 'Map':
-            if not generic_param1 or not generic_param2:
-                return False, f"Map requires two generic parameters (e.g., Map<String, int>)", None
-            ok1, err1, norm_key = _resolve_generic_type(generic_param1)
-            if not ok1:
-                return False, f"Invalid Map key type: {err1}", None
-            ok2, err2, norm_val = _resolve_generic_type(generic_param2)
-            if not ok2:
-                return False, f"Invalid Map value type: {err2}", None
-            return True, None, _with_nullable(f"Map<{norm_key}, {norm_val}>")
-        else:
-            if not generic_param1:
-                return False, f"Collection type '{base_type}' requires a generic parameter (e.g., {normalized_base}<ItemType>)", None
-            if generic_param2:
-                return False, f"'{normalized_base}' takes only one generic parameter", None
-            ok, err, normalized_inner = _resolve_generic_type(generic_param1)
-            if not ok:
-                return False, err, None
-            return True, None, _with_nullable(f"{normalized_base}<{normalized_inner}>")
+    # --- Collection types: List<T>, Set<T>, Map<K, V> (arguments may nest) ---
+    if parsed.collection:
+        ok, err, normalized = _resolve_collection(parsed)
+        if not ok:
+            return False, err, None
+        return True, None, _with_nullable(normalized)
     
     # --- Enum type (PascalCase, found in domain/enums/) ---
-    if base_type[0].isupper() and base_type_lower not in VALID_PRIMITIVE_TYPES and lib_path:
-        known_enums = find_enums(lib_path, domain_folder)
-        if base_type in known_enums:
-            if generic_param1:
+    if base_type[0].isupper() and base_type_lower not in VALID_PRIMITIVE_TYPES and context is not None:
+        if context.is_enum(base_type):
+            if parsed.args:
                 return False, f"Enum type '{base_type}' cannot have generic parameters.", None
             return True, None, _with_nullable(base_type)
     
     # --- Domain model (PascalCase, not a known type) ---
     if base_type[0].isupper() and base_type_lower not in VALID_PRIMITIVE_TYPES:
-        if generic_param1:
+        if parsed.args:
             return False, f"Domain model type '{base_type}' cannot have generic parameters directly. Use List<{base_type}> for lists.", None
         
-        if lib_path:
-            available_models = find_domain_models(lib_path, domain_folder)
-            models_with_classes = find_domain_models_with_class_names(lib_path, domain_folder)
-            
-            for _stem, info in models_with_classes.items():
-                if info['class_name'] == base_type:
-                    return True, None, _with_nullable(base_type)
-            
-            if base_type in available_models:
-                class_name = models_with_classes[base_type]['class_name']
+        if context is not None:
+            class_name = context.model_class_name(base_type)
+            if class_name:
                 return True, None, _with_nullable(class_name)
             
-            available_str = ', '.join([f"{k} ({v['class_name']})" for k, v in models_with_classes.items()]) if models_with_classes else 'none'
-            return False, f"Model '{base_type}' not found in domain. Available models: {available_str}. Create it first using: flutterator add-domain --name {base_type.lower()}", None
+            return False, f"Model '{base_type}' not found in domain. Available models: {context.describe_models()}. Create it first using: flutterator add-domain --name {base_type.lower()}", None
         
         return False, f"Model '{base_type}' cannot be validated (lib_path not provided). Please ensure the project path is correct.", None
     
@@ -362,3 +342,42 @@ def parse_fields_string(fields_str: str) -> List[Tuple[str, str]]:
     
     return fields
 
+
+def split_field_modifiers(field_type: str) -> Tuple[str, List[str]]:
+    """
+    Split ``@modifier`` suffixes off a field type.
+    
+    Args:
+        field_type: Type with optional modifiers (e.g., "Status@indexed")
+        
+    Returns:
+        (type, modifiers) — e.g. ("Status", ["indexed"])
+        
+    Raises:
+        ValueError: If a modifier is not in FIELD_MODIFIERS
+    """
+    base, *modifiers = [part.strip() for part in field_type.split('@')]
+    for modifier in modifiers:
+        if modifier not in FIELD_MODIFIERS:
+            allowed = ', '.join(f'@{m}' for m in sorted(FIELD_MODIFIERS))
+            raise ValueError(f"Unknown field modifier '@{modifier}' (allowed: {allowed})")
+    return base, modifiers
+
+
+def parse_fields_with_modifiers(fields_str: str) -> List[Tuple[str, str, List[str]]]:
+    """
+    Parse a fields string that may carry modifiers into (name, type, modifiers) tuples.
+    
+    Args:
+        fields_str: Fields string in format "name:type@modifier,name:type"
+        
+    Returns:
+        List of (field_name, field_type, modifiers) tuples
+    """
+    fields = []
+    for field_name, raw_type in parse_fields_string(fields_str):
+        field_type, modifiers = split_field_modifiers(raw_type)
+        if not field_type:
+            raise ValueError(f"Field type cannot be empty for '{field_name}'")
+        fields.append((field_name, field_type, modifiers))
+    return fields
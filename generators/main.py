@@ -3,13 +3,15 @@ import subprocess
 import sys
 import shutil
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from .assets import copy_assets
 from .config import generate_config_files
 from .templates import generate_files
 from .initializator import initialize_project
-from generators.helpers.config import load_config
+from generators.helpers.config import apply_cli_overrides, load_config
+from generators.helpers.file_copy import COPY_WORKERS
 
 def run_cmd(cmd, capture_output=False):
     """Executes a shell command and displays output"""
@@ -25,7 +27,8 @@ def run_cmd(cmd, capture_output=False):
         click.echo("❌ Comando non trovato. Assicurati che sia installato e nel PATH.")
         sys.exit(1)
 
-def init(flutter_name, login, cursor_setup=True):
+def prepare_project_dir(flutter_name):
+    """Ask before overwriting an existing ``flutter_name`` folder; exit if declined."""
     # Controlla se esiste già una cartella con lo stesso nome del progetto
     project_dir = Path(flutter_name)
     if project_dir.exists():
@@ -37,6 +40,23 @@ def init(flutter_name, login, cursor_setup=True):
         else:
             click.echo("❌ Operation canceled.")
             sys.exit(1)
+
+
+def resolve_create_config(project_path, http_cache=None, release_log_level=None, api_logger_in_release=None, fast_startup=None, perf=None):
+    """Configuration used by ``create``: defaults + config files + CLI flags."""
+    cfg = load_config(project_path)
+    return apply_cli_overrides(
+        cfg,
+        http_cache=http_cache,
+        release_log_level=release_log_level,
+        api_logger_in_release=api_logger_in_release,
+        fast_startup=fast_startup,
+        perf=perf,
+    )
+
+
+def init(flutter_name, login, cursor_setup=True, http_cache=None, release_log_level=None, api_logger_in_release=None, fast_startup=None, perf=None, minimal=False, summary=True):
+    prepare_project_dir(flutter_name)
     
     
     click.echo(f"\n🚀 Creating Flutter project: {flutter_name}")
@@ -52,20 +72,42 @@ def init(flutter_name, login, cursor_setup=True):
     initialize_project(lib_path, project_path, login)
 
     # Load configuration (will use defaults + global config if exists)
-    cfg = load_config(project_path)
+    cfg = resolve_create_config(
+        project_path,
+        http_cache=http_cache,
+        release_log_level=release_log_level,
+        api_logger_in_release=api_logger_in_release,
+        fast_startup=fast_startup,
+        perf=perf,
+    )
 
     # Generate files in various folders
-    generate_files(lib_path, login, flutter_name, cfg.primary_color, cfg.secondary_color)
+    generate_files(lib_path, login, flutter_name, cfg.primary_color, cfg.secondary_color, config=cfg)
     
-    # Generate configuration files (pubspec.yaml, analysis_options.yaml)
-    generate_config_files(lib_path, login, flutter_name)
+    # Assets and the Cursor ecosystem are copied on a thread pool while
+    # flutter pub add runs; neither touches pubspec.yaml
+    with ThreadPoolExecutor(max_workers=COPY_WORKERS, thread_name_prefix="flutterator-copy") as pool:
+        # Copy assets to the assets folder
+        copies = list(copy_assets(flutter_name, executor=pool))
 
-    # Copy assets to the lib/assets folder
-    copy_assets(flutter_name)
+        if cursor_setup:
+            from generators.cursor import copy_cursor_ecosystem
+            copies += copy_cursor_ecosystem(project_path, login, flutter_name, executor=pool)
 
+        # Generate configuration files (pubspec.yaml, analysis_options.yaml)
+        generate_config_files(lib_path, login, flutter_name, config=cfg, minimal=minimal)
+
+        for copy in copies:
+            copy.result()
+
+    if summary:
+        print_summary(flutter_name, login, cfg, cursor_setup=cursor_setup, minimal=minimal)
+
+
+def print_summary(flutter_name, login, cfg, cursor_setup=True, minimal=False):
+    """Print the end-of-create summary of ``flutter_name``."""
+    project_path = Path(flutter_name)
     if cursor_setup:
-        from generators.cursor import copy_cursor_ecosystem
-        copy_cursor_ecosystem(project_path, login, flutter_name)
         click.echo("\n📎 Cursor ecosystem (rules, agents, skills) added.")
 
     click.echo("\n✅ Project created successfully!")
@@ -76,6 +118,14 @@ def init(flutter_name, login, cursor_setup=True):
         click.echo(f"   Login: ✅ Email/Password")
     else:
         click.echo(f"   Login: ❌ None")
+    if cfg.http_cache:
+        click.echo(f"   HTTP cache: ✅ ETag/Cache-Control + request dedup")
+    if cfg.fast_startup:
+        click.echo(f"   Fast startup: ✅ Parallel bootstrap + Timeline spans")
+    if cfg.perf_instrumentation:
+        click.echo(f"   Performance: ✅ Jank, route build times and API latency via Logger")
+    if minimal:
+        click.echo(f"   Dependencies: minimal (only packages the generated code imports)")
 
     click.echo(f"\n🚀 Dependencies and code generation will be handled automatically!")
     click.echo(f"   flutter run")
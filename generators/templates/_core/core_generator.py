@@ -1,5 +1,20 @@
+import re
 from pathlib import Path
-from ..copier import generate_file
+from typing import Optional
+
+from ..copier import _load_template, generate_file, write_generated_file
+
+ERROR_LOCALIZER_TEMPLATE = "core/errors/error_localizer_template.jinja"
+ERROR_LOCALIZER_PATH = "core/errors/error_localizer.dart"
+
+# One `localize<Entity>Failure` method, from the blank line before its doc comment to its closing brace
+_LOCALIZE_BLOCK = re.compile(
+    r"\n  /// Map (?P<cls>\w+) to user-friendly error message\n"
+    r"  static String localize(?P=cls)\(BuildContext context, (?P<alias>\w+)\.(?P=cls) failure\) \{\n"
+    r".*?\n  \}\n",
+    re.DOTALL,
+)
+_FAILURE_IMPORT = re.compile(r"^import 'package:[^']+' as (?P<alias>\w+_failure);\n", re.MULTILINE)
 
 
 def infer_has_login(lib_path: Path) -> bool:
@@ -13,8 +28,8 @@ def infer_has_login(lib_path: Path) -> bool:
     ).exists()
 
 
-def generate_files(project_name: str, lib_path: Path, has_login: bool):
-    generate_app_widget(project_name, lib_path, has_login)
+def generate_files(project_name: str, lib_path: Path, has_login: bool, http_cache: bool = False):
+    generate_app_widget(project_name, lib_path, has_login, http_cache=http_cache)
     generate_model(project_name, lib_path)
     generate_infrastructure(project_name, lib_path)
     generate_error_localizer(project_name, lib_path, domain_folder="domain", has_login=has_login)
@@ -60,17 +75,16 @@ def generate_error_localizer(project_name: str, lib_path: Path, domain_folder: s
     **or** when ``domain/auth/model/auth_failure.dart`` exists, so sign-in code
     can localize errors even on projects created without ``--login``.
     """
-    from generators.helpers.feature import find_domain_models_with_class_names
+    from generators.helpers.discovery import DomainScan
 
-    auth_failure_path = lib_path / domain_folder / "auth" / "model" / "auth_failure.dart"
-    include_auth_failure_localizer = bool(has_login or auth_failure_path.is_file())
+    scan = DomainScan(lib_path, domain_folder)
+    include_auth_failure_localizer = bool(has_login or scan.has_file("auth", "model", "auth_failure.dart"))
 
     domain_failures = []
-    models = find_domain_models_with_class_names(lib_path, domain_folder) if lib_path.exists() else {}
+    models = scan.models
 
     for file_stem, info in sorted(models.items()):
-        failure_file = lib_path / domain_folder / info['folder'] / "model" / f"{file_stem}_failure.dart"
-        if not failure_file.exists():
+        if not scan.has_file(info['folder'], "model", f"{file_stem}_failure.dart"):
             continue
 
         class_name = info['class_name']
@@ -78,28 +92,104 @@ def generate_error_localizer(project_name: str, lib_path: Path, domain_folder: s
         # Dedicated AuthFailure block below; skip generic template for entity stem "auth".
         if include_auth_failure_localizer and file_stem == "auth" and failure_class == "AuthFailure":
             continue
-        alias = f"{file_stem}_failure"
-        import_path = f"{project_name}/{domain_folder}/{info['folder']}/model/{file_stem}_failure.dart"
-
-        domain_failures.append({
-            "import_path": import_path,
-            "alias": alias,
-            "failure_class": failure_class,
-            "class_name": class_name,
-        })
+        domain_failures.append(_domain_failure(project_name, domain_folder, file_stem, info['folder'], class_name))
 
     generate_file(
         project_name, lib_path,
-        "core/errors/error_localizer_template.jinja",
-        "core/errors/error_localizer.dart",
+        ERROR_LOCALIZER_TEMPLATE,
+        ERROR_LOCALIZER_PATH,
         {"domain_failures": domain_failures, "has_login": include_auth_failure_localizer},
     )
 
 
-def generate_app_widget(project_name: str, lib_path: Path, has_login: bool):
-    """Generate app widget file using Jinja template"""
+def _domain_failure(project_name: str, domain_folder: str, file_stem: str, folder: str, class_name: str) -> dict:
+    """Template context of one ``localize<Entity>Failure`` method."""
+    return {
+        "import_path": f"{project_name}/{domain_folder}/{folder}/model/{file_stem}_failure.dart",
+        "alias": f"{file_stem}_failure",
+        "failure_class": f"{class_name}Failure",
+        "class_name": class_name,
+    }
+
+
+def _insert_sorted(content: str, spans: list, key: str, text: str) -> str:
+    """Insert ``text`` before the first ``(key, start, end)`` span with a greater key, else after the last."""
+    for span_key, start, _ in spans:
+        if span_key > key:
+            return content[:start] + text + content[start:]
+    end = spans[-1][2]
+    return content[:end] + text + content[end:]
+
+
+def update_error_localizer(
+    project_name: str,
+    lib_path: Path,
+    entity: str,
+    class_name: str,
+    domain_folder: str = "domain",
+    has_login: bool = False,
+    rebuild: bool = False,
+) -> bool:
+    """Add or remove ``entity``'s localize method in error_localizer.dart without scanning the domain.
+
+    The method and its import are inserted in the position a full render
+    would give them (entities sorted by name) when ``<entity>_failure.dart``
+    exists, and removed when it does not. Other methods, including messages
+    edited by hand, are left untouched; an existing method is kept as is.
+
+    Falls back to :func:`generate_error_localizer` (and returns False) with
+    ``rebuild``, when the file is missing, or when the change is structural:
+    first or last domain failure, or the auth localizer appearing/disappearing.
+    Returns True when the file was updated in place.
+    """
+    output_file = lib_path / ERROR_LOCALIZER_PATH
+    include_auth = bool(has_login or (lib_path / domain_folder / "auth" / "model" / "auth_failure.dart").is_file())
+    content = output_file.read_text() if output_file.is_file() and not rebuild else None
+
+    def is_domain(alias: str) -> bool:
+        return not (include_auth and alias == "auth_failure")
+
+    updated: Optional[str] = None
+    if content is not None and "class ErrorLocalizer {" in content and ("localizeAuthFailure(" in content) == include_auth:
+        blocks = [(m.group("alias")[: -len("_failure")], m.start(), m.end()) for m in _LOCALIZE_BLOCK.finditer(content) if is_domain(m.group("alias"))]
+        imports = [(m.group("alias")[: -len("_failure")], m.start(), m.end()) for m in _FAILURE_IMPORT.finditer(content) if is_domain(m.group("alias"))]
+        present = {key for key, _, _ in blocks}
+        wanted = (lib_path / domain_folder / entity / "model" / f"{entity}_failure.dart").is_file() and is_domain(f"{entity}_failure")
+        if blocks and imports:
+            if wanted and entity in present:
+                updated = content
+            elif wanted:
+                rendered = _load_template(ERROR_LOCALIZER_TEMPLATE)[0].render(
+                    project_name=project_name,
+                    domain_failures=[_domain_failure(project_name, domain_folder, entity, entity, class_name)],
+                    has_login=include_auth,
+                )
+                block = next(m.group(0) for m in _LOCALIZE_BLOCK.finditer(rendered) if is_domain(m.group("alias")))
+                import_line = next(m.group(0) for m in _FAILURE_IMPORT.finditer(rendered) if is_domain(m.group("alias")))
+                # Methods come after the imports: insert them first so the import spans stay valid
+                updated = _insert_sorted(content, blocks, entity, block)
+                updated = _insert_sorted(updated, imports, entity, import_line)
+            elif entity not in present:
+                updated = content
+            elif len(blocks) > 1 and entity in {key for key, _, _ in imports}:
+                updated = content
+                for spans in (blocks, imports):  # blocks first: they come after the imports
+                    _, start, end = next(span for span in spans if span[0] == entity)
+                    updated = updated[:start] + updated[end:]
+
+    if updated is None:
+        generate_error_localizer(project_name, lib_path, domain_folder=domain_folder, has_login=has_login)
+        return False
+    if updated != content:
+        write_generated_file(lib_path, ERROR_LOCALIZER_PATH, ERROR_LOCALIZER_TEMPLATE, updated)
+    return True
+
+
+def generate_app_widget(project_name: str, lib_path: Path, has_login: bool, http_cache: bool = False):
+    """Generate app widget file using Jinja template (``http_cache``: AuthBloc clears the HTTP cache on sign-out)"""
     generate_file(project_name, lib_path, "core/presentation/app_widget_template.jinja", "core/presentation/app_widget.dart", {
-        "has_login": has_login
+        "has_login": has_login,
+        "http_cache": http_cache,
     })
 
 def generate_common_interfaces(project_name: str, lib_path: Path):
@@ -1,12 +1,24 @@
 from pathlib import Path
 from ..copier import generate_file
+from generators.helpers.config import DEFAULTS
 from generators.helpers.data_source import regenerate_data_source_config
 
 
-def generate_files(project_name: str, lib_path: Path, has_login: bool = False):
+def generate_files(project_name: str, lib_path: Path, has_login: bool = False, config=None):
+    http_cache = bool(config and config.http_cache)
+    api_logger_in_release = bool(config and config.api_logger_in_release)
+    performance = bool(config and config.perf_instrumentation)
     generate_common(project_name, lib_path, has_login=has_login)
-    generate_core(project_name, lib_path)
-    generate_interceptors(project_name, lib_path, has_login=has_login)
+    generate_core(
+        project_name,
+        lib_path,
+        http_cache=http_cache,
+        api_logger_in_release=api_logger_in_release,
+        performance=performance,
+    )
+    generate_interceptors(project_name, lib_path, has_login=has_login, config=config)
+    if http_cache:
+        generate_http_cache_interceptor(project_name, lib_path, config)
 
 
 def generate_common(project_name: str, lib_path: Path, has_login: bool = False):
@@ -19,32 +31,78 @@ def generate_common(project_name: str, lib_path: Path, has_login: bool = False):
     )
 
 
-def generate_core(project_name: str, lib_path: Path):
-    generate_api_injectable_module(project_name, lib_path)
+def generate_core(
+    project_name: str,
+    lib_path: Path,
+    http_cache: bool = False,
+    api_logger_in_release: bool = False,
+    performance: bool = False,
+):
+    generate_api_injectable_module(
+        project_name,
+        lib_path,
+        http_cache=http_cache,
+        api_logger_in_release=api_logger_in_release,
+        performance=performance,
+    )
 
 
-def generate_interceptors(project_name: str, lib_path: Path, has_login: bool = False):
+def generate_interceptors(project_name: str, lib_path: Path, has_login: bool = False, config=None):
     generate_api_logger(project_name, lib_path)
-    generate_auth_interceptor(project_name, lib_path, has_login=has_login)
+    generate_auth_interceptor(project_name, lib_path, has_login=has_login, config=config)
 
 
 def generate_constants(project_name: str, lib_path: Path):
     generate_file(project_name, lib_path, "apis/common/constants_template.jinja", "apis/common/constants.dart")
 
 
-def generate_api_injectable_module(project_name: str, lib_path: Path):
-    generate_file(project_name, lib_path, "apis/core/api_injectable_module_template.jinja", "apis/core/api_injectable_module.dart")
+def generate_api_injectable_module(
+    project_name: str,
+    lib_path: Path,
+    http_cache: bool = False,
+    api_logger_in_release: bool = False,
+    performance: bool = False,
+):
+    generate_file(
+        project_name,
+        lib_path,
+        "apis/core/api_injectable_module_template.jinja",
+        "apis/core/api_injectable_module.dart",
+        {"http_cache": http_cache, "api_logger_in_release": api_logger_in_release, "performance": performance},
+    )
 
 
 def generate_api_logger(project_name: str, lib_path: Path):
     generate_file(project_name, lib_path, "apis/interceptors/api_logger_template.jinja", "apis/interceptors/api_logger.dart")
 
 
-def generate_auth_interceptor(project_name: str, lib_path: Path, has_login: bool = False):
+def generate_auth_interceptor(project_name: str, lib_path: Path, has_login: bool = False, config=None):
+    http_retries = config.http_retries if config else DEFAULTS["http_retries"]
+    http_retry_delay_ms = config.http_retry_delay_ms if config else DEFAULTS["http_retry_delay_ms"]
+    http_max_retry_after = config.http_max_retry_after if config else DEFAULTS["http_max_retry_after"]
     generate_file(
         project_name,
         lib_path,
         "apis/interceptors/auth_interceptor_template.jinja",
         "apis/interceptors/auth_interceptor.dart",
-        {"has_login": has_login},
+        {
+            "has_login": has_login,
+            "http_retries": max(0, int(http_retries)),
+            "http_retry_delay_ms": max(1, int(http_retry_delay_ms)),
+            "http_max_retry_after": max(0, int(http_max_retry_after)),
+        },
+    )
+
+
+def generate_http_cache_interceptor(project_name: str, lib_path: Path, config):
+    generate_file(
+        project_name,
+        lib_path,
+        "apis/interceptors/http_cache_interceptor_template.jinja",
+        "apis/interceptors/http_cache_interceptor.dart",
+        {
+            "http_cache_max_age": int(config.http_cache_max_age),
+            "http_cache_max_entries": int(config.http_cache_max_entries),
+            "http_cache_disk": bool(config.http_cache_disk),
+        },
     )
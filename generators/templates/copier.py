@@ -1,4 +1,7 @@
+from functools import lru_cache
 from pathlib import Path
+from typing import Tuple
+
 from jinja2 import Template
 
 
@@ -29,11 +32,29 @@ def hex_to_dart_color(hex_color: str) -> str:
     # Return Dart Color format
     return f"Color(0xFF{hex_color})"
 
-def generate_file(project_name: str, lib_path: Path, template_name: str, output_path: str, args: dict = None):
+@lru_cache(maxsize=None)
+def _load_template(template_name: str) -> Tuple[Template, str]:
+    """Compiled template and its version (hash of the source), once per process."""
+    from generators.helpers.manifest import sha256_text
+
     template_content = (TEMPLATE_DIR / template_name).read_text()
-    
     # Use custom delimiters to avoid conflicts with Dart string interpolation
     template = Template(template_content, variable_start_string='[[', variable_end_string=']]')
+    return template, sha256_text(template_content)
+
+
+def generate_file(project_name: str, lib_path: Path, template_name: str, output_path: str, args: dict = None):
+    """Render ``template_name`` to ``lib_path / output_path``.
+
+    Inside a Flutter project the output is recorded in ``.flutterator/manifest.json``.
+    Rendering is skipped when the file is unchanged since it was generated from
+    the same template and variables; a file edited by hand is backed up to
+    ``.flutterator/backups/`` before being overwritten.
+    """
+    from generators.helpers.discovery import declared_entity_class
+    from generators.helpers.manifest import MODIFIED, UNCHANGED, hash_inputs, manifest_for
+
+    template, template_version = _load_template(template_name)
     
     # Prepare variables for substitution
     template_vars = {"project_name": project_name, "feature_name": args.get("feature_name", "") if args else ""}
@@ -45,7 +66,41 @@ def generate_file(project_name: str, lib_path: Path, template_name: str, output_
         "err_response_statusMessage": "err.response?.statusMessage",
     })
     
-    content = template.render(**template_vars)
     output_file = lib_path / output_path
+    manifest = manifest_for(output_file.parent)
+    if manifest is not None:
+        rel = manifest.relpath(output_file)
+        input_hash = hash_inputs(template_vars)
+        status = manifest.file_status(rel)
+        if status == UNCHANGED and manifest.matches(rel, template_version, input_hash):
+            manifest.skipped += 1
+            return
+        if status == MODIFIED:
+            manifest.backup(rel)
+
+    content = template.render(**template_vars)
     output_file.parent.mkdir(parents=True, exist_ok=True)
-    output_file.write_text(content)
\ No newline at end of file
+    output_file.write_text(content)
+    if manifest is not None:
+        manifest.record(rel, template_name, template_version, input_hash, content, declared_entity_class(content))
+
+
+def write_generated_file(lib_path: Path, output_path: str, template_name: str, content: str) -> None:
+    """Write ``content`` to a generated file updated in place rather than re-rendered.
+
+    Keeps ``.flutterator/manifest.json`` in sync: a file unchanged since it was
+    generated gets the new output hash (and an empty input hash, so the next
+    ``generate_file`` renders it again); a hand-edited file stays ``modified``.
+    """
+    from generators.helpers.manifest import UNCHANGED, manifest_for
+
+    output_file = lib_path / output_path
+    manifest = manifest_for(output_file.parent)
+    status = None
+    if manifest is not None:
+        rel = manifest.relpath(output_file)
+        status = manifest.file_status(rel)
+    output_file.write_text(content)
+    if status == UNCHANGED:
+        _, template_version = _load_template(template_name)
+        manifest.record(rel, template_name, template_version, "", content)
@@ -2,14 +2,29 @@ from pathlib import Path
 from ..copier import generate_file, hex_to_dart_color
 
 
-def generate_files(project_name: str, lib_path: Path, has_login: bool, primary_color: str = None, secondary_color: str = None):
+def generate_files(project_name: str, lib_path: Path, has_login: bool, primary_color: str = None, secondary_color: str = None, config=None):
     """Generate main lib files using Jinja templates"""
-    generate_main(project_name, lib_path, primary_color, secondary_color)
+    performance = bool(config and config.perf_instrumentation)
+    generate_main(
+        project_name,
+        lib_path,
+        primary_color,
+        secondary_color,
+        fast_startup=bool(config and config.fast_startup),
+        performance=performance,
+    )
     generate_injection(project_name, lib_path)
-    generate_router(project_name, lib_path, has_login)
+    generate_router(project_name, lib_path, has_login, performance=performance)
 
 
-def generate_main(project_name: str, lib_path: Path, primary_color: str = None, secondary_color: str = None):
+def generate_main(
+    project_name: str,
+    lib_path: Path,
+    primary_color: str = None,
+    secondary_color: str = None,
+    fast_startup: bool = False,
+    performance: bool = False,
+):
     """Generate main.dart file using Jinja template"""
     # Convert hex colors to Dart Color format, fallback to default colors if not provided
     if primary_color and primary_color.strip():
@@ -25,6 +40,8 @@ def generate_main(project_name: str, lib_path: Path, primary_color: str = None,
     generate_file(project_name, lib_path, "main_template.jinja", "main.dart", {
         "primary_color": primary_dart_color,
         "secondary_color": secondary_dart_color,
+        "fast_startup": fast_startup,
+        "performance": performance,
     })
 
 
@@ -33,8 +50,9 @@ def generate_injection(project_name: str, lib_path: Path):
     generate_file(project_name, lib_path, "injection_template.jinja", "injection.dart")
 
 
-def generate_router(project_name: str, lib_path: Path, has_login: bool):
+def generate_router(project_name: str, lib_path: Path, has_login: bool, performance: bool = False):
     """Generate router.dart file using Jinja template"""
     generate_file(project_name, lib_path, "router_template.jinja", "router.dart", {
-        "has_login": has_login
+        "has_login": has_login,
+        "performance": performance,
     })
\ No newline at end of file
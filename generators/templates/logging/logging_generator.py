@@ -1,9 +1,10 @@
 from pathlib import Path
 from ..copier import generate_file
+from generators.helpers.config import DEFAULTS, LOG_LEVELS
 
-def generate_files(project_name: str, lib_path: Path):
+def generate_files(project_name: str, lib_path: Path, config=None):
     # logger.dart
-    generate_logger(project_name, lib_path)
+    generate_logger(project_name, lib_path, config)
 
     # console.dart
     generate_console(project_name, lib_path)
@@ -15,8 +16,22 @@ def generate_files(project_name: str, lib_path: Path):
     generate_logger_injectable_module(project_name, lib_path)
 
 
-def generate_logger(project_name: str, lib_path: Path):
-    generate_file(project_name, lib_path, "logging/logger_template.jinja", "logging/logger.dart")
+def _min_level(config, key: str) -> str:
+    level = getattr(config, key, None) if config is not None else None
+    return level if level in LOG_LEVELS else DEFAULTS[key]
+
+def generate_logger(project_name: str, lib_path: Path, config=None):
+    generate_file(
+        project_name,
+        lib_path,
+        "logging/logger_template.jinja",
+        "logging/logger.dart",
+        {
+            "debug_min_level": _min_level(config, "log_debug_min_level"),
+            "release_min_level": _min_level(config, "log_release_min_level"),
+            "log_levels": LOG_LEVELS,
+        },
+    )
 
 def generate_console(project_name: str, lib_path: Path):
     generate_file(project_name, lib_path, "logging/console_template.jinja", "logging/console.dart")
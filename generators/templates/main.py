@@ -6,6 +6,7 @@ from .auth.sign_in_form_generator import generate_files as generate_sign_in_form
 from .home.home_generator import generate_files as generate_home_files
 from .lib.lib_generator import generate_files as generate_lib_files
 from .logging.logging_generator import generate_files as generate_logging_files
+from .performance.performance_generator import generate_files as generate_performance_files
 from .splash.splash_generator import generate_files as generate_splash_files
 from .storage.storage_generator import generate_files as generate_storage_files
 from ._core.core_generator import generate_files as generate_core_files
@@ -18,27 +19,31 @@ from ._core.core_generator import generate_error_localizer
 # from .infrastructure import generate_infrastructure
 # from .api import generate_api
 
-def generate_files(lib_path, login: bool, project_name: str, primary_color: str = None, secondary_color: str = None):
+def generate_files(lib_path, login: bool, project_name: str, primary_color: str = None, secondary_color: str = None, config=None):
     click.echo("\n📁 Generating files...")
 
     # Generate lib files
-    generate_lib_files(project_name, lib_path, login, primary_color, secondary_color)
+    generate_lib_files(project_name, lib_path, login, primary_color, secondary_color, config=config)
 
     # Generate core files
-    generate_core_files(project_name, lib_path, login)
+    generate_core_files(project_name, lib_path, login, http_cache=bool(config and config.http_cache))
 
     # Generate splash files
     generate_splash_files(project_name, lib_path, login)
 
     
     # Generate logging files
-    generate_logging_files(project_name, lib_path)
+    generate_logging_files(project_name, lib_path, config=config)
+
+    # Generate performance instrumentation (frame timings, route build times, API latency)
+    if config is not None and config.perf_instrumentation:
+        generate_performance_files(project_name, lib_path, config=config)
 
     # Generate storage files
-    generate_storage_files(project_name, lib_path)
+    generate_storage_files(project_name, lib_path, config=config)
 
     # Generate apis files (auth interceptor aligns with AuthBloc when login is enabled)
-    generate_apis_files(project_name, lib_path, has_login=login)
+    generate_apis_files(project_name, lib_path, has_login=login, config=config)
 
 
     # Generate home files
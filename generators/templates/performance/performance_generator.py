@@ -0,0 +1,60 @@
+from pathlib import Path
+from ..copier import generate_file
+from generators.helpers.config import DEFAULTS, LOG_LEVELS
+
+# Files (relative to lib/) owned by the performance generator; `add-instrumentation` writes them.
+PERFORMANCE_FILES = [
+    "core/performance/performance_monitor.dart",
+    "core/performance/frame_timing_collector.dart",
+    "core/performance/latency_histogram.dart",
+    "core/performance/performance_route_observer.dart",
+    "core/performance/api_latency_interceptor.dart",
+]
+
+def generate_files(project_name: str, lib_path: Path, config=None):
+    generate_performance_monitor(project_name, lib_path, config)
+    generate_frame_timing_collector(project_name, lib_path)
+    generate_latency_histogram(project_name, lib_path)
+    generate_route_observer(project_name, lib_path)
+    generate_api_latency_interceptor(project_name, lib_path)
+
+
+def _positive(config, key: str) -> int:
+    value = getattr(config, key, None) if config is not None else None
+    try:
+        return max(1, int(value))
+    except (TypeError, ValueError):
+        return DEFAULTS[key]
+
+def report_level(config) -> str:
+    """Logger level of the periodic performance report (``performance.report_level``)."""
+    level = getattr(config, "perf_report_level", None) if config is not None else None
+    return level if level in LOG_LEVELS else DEFAULTS["perf_report_level"]
+
+def generate_performance_monitor(project_name: str, lib_path: Path, config=None):
+    level = report_level(config)
+    generate_file(
+        project_name,
+        lib_path,
+        "core/performance/performance_monitor_template.jinja",
+        "core/performance/performance_monitor.dart",
+        {
+            "jank_threshold_ms": _positive(config, "perf_jank_threshold_ms"),
+            "report_interval_seconds": _positive(config, "perf_report_interval_seconds"),
+            "report_level": level,
+            # Janky windows are reported at warning at least
+            "jank_report_level": max(level, "warning", key=LOG_LEVELS.index),
+        },
+    )
+
+def generate_frame_timing_collector(project_name: str, lib_path: Path):
+    generate_file(project_name, lib_path, "core/performance/frame_timing_collector_template.jinja", "core/performance/frame_timing_collector.dart")
+
+def generate_latency_histogram(project_name: str, lib_path: Path):
+    generate_file(project_name, lib_path, "core/performance/latency_histogram_template.jinja", "core/performance/latency_histogram.dart")
+
+def generate_route_observer(project_name: str, lib_path: Path):
+    generate_file(project_name, lib_path, "core/performance/performance_route_observer_template.jinja", "core/performance/performance_route_observer.dart")
+
+def generate_api_latency_interceptor(project_name: str, lib_path: Path):
+    generate_file(project_name, lib_path, "core/performance/api_latency_interceptor_template.jinja", "core/performance/api_latency_interceptor.dart")
@@ -1,5 +1,22 @@
 from pathlib import Path
 from ..copier import generate_file
 
-def generate_files(project_name: str, lib_path: Path):
-    generate_file(project_name, lib_path, "storage/storage_repository_template.jinja", "storage/storage_repository.dart")
+# Files (relative to lib/) owned by the storage generator; `upgrade-storage` rewrites them.
+STORAGE_FILES = [
+    "storage/storage_repository.dart",
+    "storage/storage_injectable_module.dart",
+]
+
+def generate_files(project_name: str, lib_path: Path, config=None):
+    generate_storage_repository(project_name, lib_path, config=config)
+    generate_storage_injectable_module(project_name, lib_path)
+
+
+def generate_storage_repository(project_name: str, lib_path: Path, config=None):
+    generate_file(project_name, lib_path, "storage/storage_repository_template.jinja", "storage/storage_repository.dart", {
+        "fast_startup": bool(config and config.fast_startup),
+    })
+
+
+def generate_storage_injectable_module(project_name: str, lib_path: Path):
+    generate_file(project_name, lib_path, "storage/storage_injectable_module_template.jinja", "storage/storage_injectable_module.dart")
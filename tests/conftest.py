@@ -1,19 +1,50 @@
 import pytest
-import tempfile
-import shutil
+import json
+import os
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 import sys
 import subprocess
 
+from generators.helpers.manifest import discard_manifests
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--run-e2e",
+        action="store_true",
+        default=False,
+        help="Run the e2e tests (real Flutter SDK on PATH, slow)",
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--run-e2e"):
+        return
+    skip_e2e = pytest.mark.skip(reason="E2E test: run with --run-e2e")
+    for item in items:
+        if "e2e" in item.keywords:
+            item.add_marker(skip_e2e)
+
+
+@pytest.fixture(autouse=True)
+def isolated_user_dirs(tmp_path_factory, monkeypatch):
+    """Per-test HOME and cache dirs, so ~/.flutteratorrc and cached skeletons never leak between tests or workers."""
+    home = tmp_path_factory.mktemp("home")
+    monkeypatch.setenv("HOME", str(home))
+    monkeypatch.setenv("FLUTTERATOR_CACHE_DIR", str(home / ".cache" / "flutterator"))
+    monkeypatch.delenv("XDG_CACHE_HOME", raising=False)
+    yield home
+    # Manifests are cached per process: drop them before the test's directories go away
+    discard_manifests()
+
 
 @pytest.fixture
-def temp_project_dir():
+def temp_project_dir(tmp_path):
     """Create a temporary directory for testing project generation"""
-    temp_dir = Path(tempfile.mkdtemp())
-    yield temp_dir
-    # Cleanup after test
-    shutil.rmtree(temp_dir, ignore_errors=True)
+    project_dir = tmp_path / "project"
+    project_dir.mkdir()
+    return project_dir
 
 
 @pytest.fixture
@@ -124,3 +155,103 @@ def flutterator_command():
         cmd = [sys.executable, "-m", "flutterator"] + list(args)
         return subprocess.run(cmd, cwd=cwd, capture_output=True, text=True, **kwargs)
     return run_command
+
+
+# `flutter` / `dart` stand-in: logs every call and fakes the commands `create` relies on
+FAKE_TOOL_SCRIPT = """#!{python}
+import json
+import os
+import sys
+from pathlib import Path
+
+tool, args = Path(sys.argv[0]).name, sys.argv[1:]
+with open(os.environ["FAKE_FLUTTER_LOG"], "a") as log:
+    log.write(json.dumps({{"argv": [tool, *args], "cwd": os.getcwd()}}) + "\\n")
+
+command = " ".join([tool, *args])
+if any(command.startswith(prefix) for prefix in os.environ.get("FAKE_FLUTTER_FAIL", "").split(",") if prefix):
+    sys.exit("fake " + tool + ": failing on purpose")
+
+if tool == "flutter" and args[:1] == ["--version"]:
+    print(json.dumps({{"frameworkVersion": "3.99.0", "dartSdkVersion": "3.9.0"}}))
+elif tool == "flutter" and args[:1] == ["create"]:
+    options, positional, rest = {{}}, [], iter(args[1:])
+    for arg in rest:
+        if arg in ("--org", "--project-name", "--template", "--platforms"):
+            options[arg] = next(rest)
+        elif not arg.startswith("-"):
+            positional.append(arg)
+    project = Path(positional[0])
+    name = options.get("--project-name", project.name)
+    org = options.get("--org", "com.example")
+    (project / "lib").mkdir(parents=True, exist_ok=True)
+    (project / "test").mkdir(exist_ok=True)
+    (project / "pubspec.yaml").write_text(
+        "name: " + name + "\\ndescription: A new Flutter project.\\nversion: 1.0.0+1\\n\\n"
+        "environment:\\n  sdk: ^3.9.0\\n\\n"
+        "dependencies:\\n  flutter:\\n    sdk: flutter\\n\\n"
+        "dev_dependencies:\\n  flutter_test:\\n    sdk: flutter\\n\\n"
+        "flutter:\\n  uses-material-design: true\\n  # assets:\\n  #   - images/a_dot_burr.jpeg\\n"
+    )
+    (project / "lib" / "main.dart").write_text("void main() {{}}\\n")
+    (project / "test" / "widget_test.dart").write_text("import 'package:" + name + "/main.dart';\\n")
+    kotlin = project.joinpath("android", "app", "src", "main", "kotlin", *org.split("."), name)
+    kotlin.mkdir(parents=True)
+    (kotlin / "MainActivity.kt").write_text("package " + org + "." + name + "\\n")
+elif tool == "flutter" and args[:2] == ["pub", "add"]:
+    section = "dev_dependencies:" if "--dev" in args else "dependencies:"
+    packages = [arg for arg in args[2:] if not arg.startswith("-")]
+    pubspec = Path("pubspec.yaml")
+    lines = pubspec.read_text().splitlines()
+    at = lines.index(section) + 1
+    lines[at:at] = ["  " + package + ": any" for package in packages]
+    pubspec.write_text("\\n".join(lines) + "\\n")
+"""
+
+
+class FakeFlutter:
+    """Fake Flutter toolchain on PATH; ``calls`` lists every ``flutter``/``dart`` invocation."""
+
+    def __init__(self, bin_dir: Path, log: Path):
+        self.bin_dir = bin_dir
+        self.log = log
+
+    @property
+    def calls(self) -> list:
+        if not self.log.exists():
+            return []
+        return [json.loads(line)["argv"] for line in self.log.read_text().splitlines()]
+
+    def ran(self, *argv: str) -> bool:
+        """True if a call started with ``argv`` (e.g. ``ran("flutter", "pub", "get")``)."""
+        return any(call[: len(argv)] == list(argv) for call in self.calls)
+
+    def fail(self, *commands: str) -> None:
+        """Make calls starting with any of ``commands`` (e.g. ``"dart run build_runner"``) exit 1."""
+        os.environ["FAKE_FLUTTER_FAIL"] = ",".join(commands)
+
+
+@pytest.fixture
+def fake_flutter(tmp_path_factory, monkeypatch):
+    """Put fake ``flutter`` and ``dart`` executables first on PATH (no Flutter SDK needed).
+
+    ``flutter create`` writes a minimal project, ``flutter pub add`` edits
+    pubspec.yaml, ``flutter --version`` reports 3.99.0 and every other command
+    succeeds without doing anything. Each test gets its own directory and log,
+    so the fixture is safe with pytest-xdist.
+    """
+    from generators.helpers.skeleton import flutter_sdk_version
+
+    root = tmp_path_factory.mktemp("fake_flutter")
+    bin_dir = root / "bin"
+    bin_dir.mkdir()
+    for tool in ("flutter", "dart"):
+        script = bin_dir / tool
+        script.write_text(FAKE_TOOL_SCRIPT.format(python=sys.executable))
+        script.chmod(0o755)
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ.get('PATH', '')}")
+    monkeypatch.setenv("FAKE_FLUTTER_LOG", str(root / "calls.jsonl"))
+    monkeypatch.setenv("FAKE_FLUTTER_FAIL", "")  # restored after the test, whatever fail() set
+    flutter_sdk_version.cache_clear()
+    yield FakeFlutter(bin_dir, root / "calls.jsonl")
+    flutter_sdk_version.cache_clear()
@@ -0,0 +1,152 @@
+"""Tests for the generated apis/ layer (Dio module and interceptors)."""
+
+from generators.config.pubspec import optional_dependencies
+from generators.helpers.config import FlutteratorConfig, apply_cli_overrides
+from generators.templates._core.core_generator import generate_app_widget
+from generators.templates.apis.apis_generator import generate_files
+from generators.templates.auth.auth_generator import generate_application
+
+
+def test_http_cache_disabled_by_default(tmp_path):
+    lib = tmp_path / "lib"
+    generate_files("my_app", lib, has_login=False, config=FlutteratorConfig())
+
+    module = (lib / "apis" / "core" / "api_injectable_module.dart").read_text()
+    assert "Dio dio(AuthInterceptor authInterceptor)" in module
+    assert "HttpCacheInterceptor" not in module
+    assert not (lib / "apis" / "interceptors" / "http_cache_interceptor.dart").exists()
+
+
+def test_http_cache_enabled_wires_interceptor(tmp_path):
+    lib = tmp_path / "lib"
+    cfg = FlutteratorConfig(http_cache=True, http_cache_max_age=60, http_cache_max_entries=50)
+    generate_files("my_app", lib, has_login=False, config=cfg)
+
+    module = (lib / "apis" / "core" / "api_injectable_module.dart").read_text()
+    assert "import 'package:my_app/apis/interceptors/http_cache_interceptor.dart';" in module
+    # Cache must run before AuthInterceptor so it sees responses/errors first
+    assert module.index("..add(httpCacheInterceptor)") < module.index("..add(authInterceptor..attach(dio))")
+
+    interceptor = (lib / "apis" / "interceptors" / "http_cache_interceptor.dart").read_text()
+    assert "Duration(seconds: 60)" in interceptor
+    assert "this.maxEntries = 50" in interceptor
+    assert "If-None-Match" in interceptor
+    assert "package:path_provider/path_provider.dart" in interceptor
+
+
+def test_http_cache_cleared_on_sign_out(tmp_path):
+    lib = tmp_path / "lib"
+    generate_app_widget("my_app", lib, has_login=True, http_cache=True)
+    app_widget = (lib / "core" / "presentation" / "app_widget.dart").read_text()
+    assert "onSignOut: getIt<HttpCacheInterceptor>().clear," in app_widget
+    assert "import 'package:my_app/apis/interceptors/http_cache_interceptor.dart';" in app_widget
+
+    # Session expiry goes through the same SignedOut handler
+    generate_application("my_app", lib)
+    bloc = (lib / "features" / "auth" / "application" / "auth_bloc.dart").read_text()
+    handler = bloc[bloc.index("Future<void> _onSignedOut("):]
+    assert handler.index("_authFacade.signOut()") < handler.index("_onSignOut?.call()") < handler.index("unauthenticated")
+
+    generate_app_widget("my_app", lib, has_login=True, http_cache=False)
+    assert "HttpCacheInterceptor" not in (lib / "core" / "presentation" / "app_widget.dart").read_text()
+
+
+def test_http_cache_304_uses_the_entry_sent_for_revalidation(tmp_path):
+    lib = tmp_path / "lib"
+    generate_files("my_app", lib, has_login=False, config=FlutteratorConfig(http_cache=True))
+    interceptor = (lib / "apis" / "interceptors" / "http_cache_interceptor.dart").read_text()
+    assert "options.extra[_entryExtra] = entry;" in interceptor
+    assert "_memory[key] ?? options.extra.remove(_entryExtra) as _CacheEntry?" in interceptor
+
+
+def test_http_cache_memory_only_skips_path_provider(tmp_path):
+    lib = tmp_path / "lib"
+    cfg = FlutteratorConfig(http_cache=True, http_cache_disk=False)
+    generate_files("my_app", lib, has_login=False, config=cfg)
+
+    interceptor = (lib / "apis" / "interceptors" / "http_cache_interceptor.dart").read_text()
+    assert "path_provider" not in interceptor
+    assert "dart:io" not in interceptor
+    assert optional_dependencies(cfg) == []
+
+
+def test_http_cache_config_section_and_cli_override():
+    cfg = FlutteratorConfig.from_dict({"api": {"http_cache": True, "http_cache_max_age": 30}}, "test")
+    assert cfg.http_cache is True
+    assert cfg.http_cache_max_age == 30
+    assert optional_dependencies(cfg) == ["path_provider"]
+
+    merged = FlutteratorConfig().merge_with(cfg)
+    assert merged.http_cache is True
+    assert merged.http_cache_max_age == 30
+
+    assert apply_cli_overrides(merged, http_cache=False).http_cache is False
+
+
+def test_api_logger_compiled_out_of_release_by_default(tmp_path):
+    lib = tmp_path / "lib"
+    generate_files("my_app", lib, has_login=False, config=FlutteratorConfig())
+
+    module = (lib / "apis" / "core" / "api_injectable_module.dart").read_text()
+    assert "if (!kReleaseMode) ApiLogger()" in module
+    assert "package:flutter/foundation.dart" in module
+
+
+def test_api_logger_kept_in_release_when_configured(tmp_path):
+    lib = tmp_path / "lib"
+    cfg = FlutteratorConfig.from_dict({"logging": {"api_logger_in_release": True}}, "test")
+    generate_files("my_app", lib, has_login=False, config=cfg)
+
+    module = (lib / "apis" / "core" / "api_injectable_module.dart").read_text()
+    assert "..add(ApiLogger())" in module
+    assert "kReleaseMode" not in module
+
+
+def test_api_logger_gates_errors_on_the_logged_level(tmp_path):
+    lib = tmp_path / "lib"
+    generate_files("my_app", lib, has_login=False, config=FlutteratorConfig())
+
+    api_logger = (lib / "apis" / "interceptors" / "api_logger.dart").read_text()
+    assert "isEnabled(LoggerLevel.warning)" not in api_logger
+    assert "statusCode == null ? LoggerLevel.error : _levelFor(statusCode)" in api_logger
+    assert "if (error && _logger.isEnabled(level))" in api_logger
+
+
+def test_auth_interceptor_parallel_single_flight_refresh(tmp_path):
+    lib = tmp_path / "lib"
+    generate_files("my_app", lib, has_login=True, config=FlutteratorConfig())
+
+    interceptor = (lib / "apis" / "interceptors" / "auth_interceptor.dart").read_text()
+    assert "class AuthInterceptor extends Interceptor {" in interceptor
+    assert "QueuedInterceptor" not in interceptor
+    assert "_refreshing ??= _refresh()" in interceptor
+    assert "..httpClientAdapter = dio.httpClientAdapter" in interceptor
+    assert "Dio()" not in interceptor
+    assert "getIt" not in interceptor
+
+    module = (lib / "apis" / "core" / "api_injectable_module.dart").read_text()
+    assert "AuthInterceptor authInterceptor(StorageRepository storageRepository)" in module
+
+
+def test_auth_interceptor_retry_policy_from_config(tmp_path):
+    lib = tmp_path / "lib"
+    cfg = FlutteratorConfig.from_dict({"api": {"http_retries": 4, "http_retry_delay_ms": 150}}, "test")
+    assert FlutteratorConfig().merge_with(cfg).http_retries == 4
+    generate_files("my_app", lib, has_login=False, config=cfg)
+
+    interceptor = (lib / "apis" / "interceptors" / "auth_interceptor.dart").read_text()
+    assert "this.maxRetries = 4," in interceptor
+    assert "const Duration(milliseconds: 150)" in interceptor
+    assert "this.maxRetryAfter = const Duration(seconds: 5)," in interceptor
+
+
+def test_auth_interceptor_caps_retry_after(tmp_path):
+    lib = tmp_path / "lib"
+    cfg = FlutteratorConfig.from_dict({"api": {"http_max_retry_after": 10}}, "test")
+    generate_files("my_app", lib, has_login=False, config=cfg)
+
+    interceptor = (lib / "apis" / "interceptors" / "auth_interceptor.dart").read_text()
+    assert "this.maxRetryAfter = const Duration(seconds: 10)," in interceptor
+    assert "return retryAfter > maxRetryAfter ? null : retryAfter;" in interceptor
+    assert "final Duration? delay = _backoff(attempt, err.response);" in interceptor
+    assert "_httpDate.firstMatch(value.trim())" in interceptor
@@ -143,6 +143,19 @@ def test_nullable_collection_types_validate_and_dto():
     assert map_field_type_to_dto("Map<String, double>?", None) == "Map<String, double>?"
 
 
+def test_parse_fields_with_modifiers():
+    """@modifiers are split off the type; unknown ones are rejected."""
+    import pytest
+    from generators.helpers.validation import parse_fields_with_modifiers
+
+    assert parse_fields_with_modifiers("title:string@indexed,tags:List<String>?") == [
+        ("title", "string", ["indexed"]),
+        ("tags", "List<String>?", []),
+    ]
+    with pytest.raises(ValueError, match="Unknown field modifier"):
+        parse_fields_with_modifiers("title:string@unique")
+
+
 def test_map_field_type():
     """Test field type mapping"""
     from generators.helpers import map_field_type
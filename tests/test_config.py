@@ -0,0 +1,59 @@
+"""Tests for configuration loading (flutterator.yaml / ~/.flutteratorrc)."""
+
+from generators.helpers import config as config_module
+from generators.helpers.config import FlutteratorConfig, load_config, validate_config_data
+
+
+def _write(path, text):
+    path.write_text(text)
+    return path
+
+
+def test_invalid_values_keep_their_defaults(capsys):
+    data = {
+        "defaults": {"dart_fix": "no", "feature_folder": "screens"},
+        "api": {"http_retries": -1, "bulk_batch_size": True, "http_cache_max_age": 30},
+        "logging": {"release_min_level": "loud"},
+        "mock": {"format": "ndjson", "items": 5},
+        "colours": {"primary": "#000000"},
+    }
+    assert validate_config_data(data, "flutterator.yaml") == {
+        "feature_folder": "screens",
+        "http_cache_max_age": 30,
+        "mock_format": "ndjson",
+        "mock_items": 5,
+    }
+    output = capsys.readouterr().out
+    for path in ("defaults.dart_fix", "api.http_retries", "api.bulk_batch_size", "logging.release_min_level", "colours"):
+        assert path in output
+
+    config = FlutteratorConfig.from_dict(data, "flutterator.yaml")
+    assert config.dart_fix is True and config.http_retries == 2 and config.log_release_min_level == "warning"
+
+
+def test_flat_keys_win_over_sections():
+    config = FlutteratorConfig.from_dict({"defaults": {"domain_folder": "entities"}, "domain_folder": "models"})
+    assert config.domain_folder == "models"
+
+
+def test_load_config_parses_each_file_once(tmp_path, monkeypatch):
+    monkeypatch.setenv("HOME", str(tmp_path / "home"))
+    (tmp_path / "home").mkdir()
+    _write(tmp_path / "home" / ".flutteratorrc", "api:\n  http_retries: 4\n")
+    project = tmp_path / "app"
+    project.mkdir()
+    config_file = _write(project / "flutterator.yaml", "mock:\n  items: 10\n")
+
+    parsed = []
+    load_yaml_file = config_module.load_yaml_file
+    monkeypatch.setattr(config_module, "load_yaml_file", lambda path: parsed.append(path.name) or load_yaml_file(path))
+
+    first = load_config(project)
+    first.mock_items = 1  # CLI overrides mutate the result, not the cached files
+    second = load_config(project)
+    assert (second.http_retries, second.mock_items) == (4, 10)
+    assert sorted(parsed) == [".flutteratorrc", "flutterator.yaml"]
+
+    _write(config_file, "mock:\n  items: 20\n  gzip: true\n")
+    assert load_config(project).mock_items == 20
+    assert sorted(parsed) == [".flutteratorrc", "flutterator.yaml", "flutterator.yaml"]
@@ -0,0 +1,61 @@
+"""Tests for `flutterator create` against the fake Flutter toolchain (see conftest.fake_flutter)."""
+
+from click.testing import CliRunner
+
+from flutterator import cli
+
+
+def _create(*args):
+    result = CliRunner().invoke(cli, ["create", "--no-cursor", "--no-login", *args])
+    assert result.exit_code == 0, result.output
+    return result
+
+
+def test_create_runs_the_flutter_pipeline(fake_flutter, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    _create("--name", "my_app")
+
+    project = tmp_path / "my_app"
+    assert fake_flutter.ran("flutter", "create", "my_app")
+    assert fake_flutter.ran("flutter", "pub", "add", "build_runner")
+    assert fake_flutter.ran("flutter", "pub", "get")
+    assert fake_flutter.ran("dart", "run", "build_runner", "build")
+    pubspec = (project / "pubspec.yaml").read_text()
+    assert "  build_runner: any" in pubspec and "  - assets/mock/" in pubspec
+    assert "runApp" in (project / "lib" / "main.dart").read_text()
+
+
+def test_create_reports_a_failing_build_runner(fake_flutter, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    fake_flutter.fail("dart run build_runner")
+    result = _create("--name", "my_app")
+    assert "build_runner not available or failed" in result.output
+
+
+def test_skeleton_cache_skips_the_pipeline_on_reuse(fake_flutter, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    _create("--name", "first_app", "--skeleton-cache")
+    assert fake_flutter.ran("flutter", "create", "flutterator_skeleton_app")
+
+    fake_flutter.log.unlink()
+    _create("--name", "second_app", "--skeleton-cache")
+    # The SDK version is read once per process, so only the offline pub get is left
+    assert fake_flutter.calls == [["flutter", "pub", "get", "--offline"]]
+
+    project = tmp_path / "second_app"
+    assert (project / "pubspec.yaml").read_text().startswith("name: second_app\n")
+    assert (project / "android/app/src/main/kotlin/com/example/second_app/MainActivity.kt").is_file()
+    for path in (project / "lib").rglob("*.dart"):
+        assert "flutterator_skeleton_app" not in path.read_text(), path
+
+
+def test_skeleton_cache_fails_when_pub_get_fails(fake_flutter, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    _create("--name", "first_app", "--skeleton-cache")
+
+    fake_flutter.fail("flutter pub get")
+    result = CliRunner().invoke(cli, ["create", "--no-cursor", "--no-login", "--name", "second_app", "--skeleton-cache"])
+    assert result.exit_code == 1
+    assert fake_flutter.calls[-2:] == [["flutter", "pub", "get", "--offline"], ["flutter", "pub", "get"]]
+    assert "fake flutter: failing on purpose" in result.output
+    assert "Project created successfully" not in result.output
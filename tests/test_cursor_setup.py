@@ -164,3 +164,38 @@ def test_mock_and_remote_doc(cursor_project):
     assert "assets/mock" in doc
     infra = (cursor_project / ".cursor/agents/layer-infrastructure.md").read_text()
     assert "assets/mock" in infra
+
+
+def test_copy_assets_on_executor_matches_inline(tmp_path, monkeypatch):
+    from concurrent.futures import ThreadPoolExecutor
+
+    from generators.assets import copy_assets
+
+    monkeypatch.chdir(tmp_path)
+    assert copy_assets("inline_app") == []
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        futures = copy_assets("pooled_app", executor=pool)
+        for future in futures:
+            future.result()
+
+    inline, pooled = tmp_path / "inline_app" / "assets", tmp_path / "pooled_app" / "assets"
+    files = sorted(p.relative_to(inline) for p in inline.rglob("*") if p.is_file())
+    assert Path("mock/auth_user.json") in files and Path("logo.png") in files
+    assert len(futures) == len(files)
+    assert files == sorted(p.relative_to(pooled) for p in pooled.rglob("*") if p.is_file())
+    for rel in files:
+        assert (inline / rel).read_bytes() == (pooled / rel).read_bytes()
+
+
+def test_copy_file_keeps_content_and_mtime(tmp_path):
+    from generators.helpers.file_copy import copy_file
+
+    src = tmp_path / "logo.png"
+    src.write_bytes(bytes(range(256)) * 512)
+    dest = tmp_path / "project" / "assets" / "logo.png"
+    copy_file(src, dest)
+
+    assert dest.read_bytes() == src.read_bytes()
+    assert dest.stat().st_mtime_ns == src.stat().st_mtime_ns
+    # A copy, never a hardlink to the template
+    assert dest.stat().st_ino != src.stat().st_ino
@@ -0,0 +1,55 @@
+"""Tests for the post-generation const `dart fix` pass."""
+
+import subprocess
+
+from generators.helpers.config import FlutteratorConfig
+from generators.helpers.dart_fix import CONST_FIX_CODES, apply_const_fixes, parse_dart_fix_output
+
+APPLY_OUTPUT = """Computing fixes in features...
+Applying fixes...
+
+todo_list/presentation/todo_list_component.dart
+  prefer_const_constructors • 2 fixes
+  unnecessary_const • 1 fix
+
+home/home_page.dart
+  prefer_const_literals_to_create_immutables • 1 fix
+
+4 fixes made in 2 files.
+"""
+
+
+def test_parse_dart_fix_output():
+    assert parse_dart_fix_output(APPLY_OUTPUT) == {
+        "todo_list/presentation/todo_list_component.dart": {
+            "prefer_const_constructors": 2,
+            "unnecessary_const": 1,
+        },
+        "home/home_page.dart": {"prefer_const_literals_to_create_immutables": 1},
+    }
+    assert parse_dart_fix_output("Computing fixes in lib...\nNothing to fix!\n") == {}
+
+
+def test_apply_const_fixes_runs_per_target(tmp_path, monkeypatch):
+    (tmp_path / "lib" / "features").mkdir(parents=True)
+    calls = []
+
+    def fake_run(cmd, cwd, **kwargs):
+        calls.append(cmd)
+        return subprocess.CompletedProcess(cmd, 0, stdout=APPLY_OUTPUT, stderr="")
+
+    monkeypatch.setattr(subprocess, "run", fake_run)
+    results = apply_const_fixes(tmp_path, [tmp_path / "lib" / "features", "lib/missing"])
+
+    # Missing targets are skipped; only const codes are requested
+    assert len(calls) == 1
+    assert calls[0][:3] == ["dart", "fix", "--apply"]
+    assert calls[0][-1] == "lib/features"
+    assert {arg.split("=", 1)[1] for arg in calls[0] if arg.startswith("--code=")} == set(CONST_FIX_CODES)
+    assert results["lib/features/home/home_page.dart"] == {"prefer_const_literals_to_create_immutables": 1}
+
+
+def test_dart_fix_config_toggle():
+    assert FlutteratorConfig().dart_fix is True
+    cfg = FlutteratorConfig.from_dict({"defaults": {"dart_fix": False}}, "test")
+    assert FlutteratorConfig().merge_with(cfg).dart_fix is False
@@ -0,0 +1,83 @@
+"""Tests for the DartType field-type AST and nested generics across the generators."""
+
+import pytest
+
+from generators.helpers.dart_type import parse_dart_type
+from generators.helpers.data_source import _sample_value_for_type
+from generators.helpers.domain import create_domain_entity_layers
+from generators.helpers.utils import map_field_type_to_dto
+from generators.helpers.validation import parse_field_type, validate_field_type
+
+
+def _write_domain(lib):
+    (lib / "domain" / "author" / "model").mkdir(parents=True)
+    (lib / "domain" / "author" / "model" / "author.dart").write_text(
+        "@freezed\nabstract class Author with _$Author {\n  const factory Author() = _Author;\n}\n"
+    )
+    (lib / "domain" / "enums").mkdir(parents=True)
+    (lib / "domain" / "enums" / "status.dart").write_text("enum Status { draft, published }\n")
+
+
+def test_parse_nested_and_interned():
+    parsed = parse_dart_type("Map<String,List< Todo? >>?")
+    assert str(parsed) == "Map<String, List<Todo?>>?"
+    assert parsed.nullable and parsed.collection == "Map"
+    assert [leaf.name for leaf in parsed.leaves()] == ["String", "Todo"]
+    # Equal subtrees are the same object, whatever the spelling
+    assert parsed.args[1] is parse_dart_type("List<Todo?>")
+    assert parsed.non_null is parse_dart_type("Map<String, List<Todo?>>")
+
+    assert parse_field_type("Map<String, List<Todo>>") == ("Map", "String", "List<Todo>")
+    for malformed in ("List<String", "Map<String,>", "List<>", "Todo>", "Todo??"):
+        with pytest.raises(ValueError):
+            parse_dart_type(malformed)
+
+
+def test_nested_generics_validate_and_map_to_dto(tmp_path):
+    lib = tmp_path / "lib"
+    _write_domain(lib)
+
+    ok, err, norm = validate_field_type("map<string, list<Author?>>?", lib)
+    assert ok and err is None and norm == "Map<String, List<Author?>>?"
+    ok, err, _ = validate_field_type("List<List<Missing>>", lib)
+    assert not ok and "Model 'Missing' not found" in err
+    ok, err, _ = validate_field_type("List<String", lib)
+    assert not ok and "Unbalanced" in err
+
+    assert map_field_type_to_dto("Map<String, List<Author>>", {"Status"}) == "Map<String, List<AuthorDto>>"
+    assert map_field_type_to_dto("List<Set<Status?>>?", {"Status"}) == "List<Set<String?>>?"
+    assert map_field_type_to_dto("Map<String, Object>?") == "Map<String, Object>?"
+    assert map_field_type_to_dto("Option<Author>") == "AuthorDto?"
+
+
+def test_mapper_converts_nested_collections(tmp_path):
+    lib = tmp_path / "lib"
+    _write_domain(lib)
+    (lib / "domain" / "post").mkdir()
+    fields = [
+        {"name": "id", "type": "UniqueId"},
+        {"name": "groups", "type": "Map<String, List<Author>>"},
+        {"name": "matrix", "type": "List<List<Status>>?"},
+        {"name": "tags", "type": "Set<Status>"},
+    ]
+    create_domain_entity_layers(lib / "domain" / "post", "post", "Post", fields, "my_app", "domain")
+
+    entity = (lib / "domain" / "post" / "model" / "post.dart").read_text()
+    assert "import 'package:my_app/domain/author/model/author.dart';" in entity
+    dto = (lib / "domain" / "post" / "infrastructure" / "post_dto.dart").read_text()
+    assert "required Map<String, List<AuthorDto>> groups" in dto
+    mapper = (lib / "domain" / "post" / "infrastructure" / "post_mapper.dart").read_text()
+    assert "groups: dto.groups.map((k, v) => MapEntry(k, _authorMapper.toDomainList(v)))" in mapper
+    assert (
+        "matrix: dto.matrix != null ? dto.matrix!.map((e) => e.map((e2) => Status.values.byName(e2)).toList()).toList() : null"
+        in mapper
+    )
+    assert "tags: entity.tags.map((e) => e.name).toSet()" in mapper
+
+
+def test_sample_values_follow_the_parsed_type():
+    enums = {"Status": {"values": ["draft", "published"]}}
+    assert _sample_value_for_type("tags", "List<Status>?", 1, known_enums=enums) == ["draft"]
+    assert _sample_value_for_type("groups", "Map<String, List<Status>>", 1, known_enums=enums) == {}
+    assert _sample_value_for_type("status", "Status?", 1, known_enums=enums) == "draft"
+    assert _sample_value_for_type("count", "int", 3) == 3
@@ -1,5 +1,6 @@
 """Tests for mock vs remote data source helpers."""
 
+import gzip
 import json
 from pathlib import Path
 
@@ -8,9 +9,14 @@ import pytest
 from generators.helpers.data_source import (
     build_entities_map,
     generate_mock_json,
+    iter_mock_items,
+    local_index_columns,
     read_preserved_remote_keys,
+    read_preserved_sources,
     regenerate_data_source_config,
     scan_domain_entity_keys,
+    update_data_source_config,
+    write_mock_items,
 )
 
 
@@ -65,6 +71,31 @@ def test_generate_mock_json(tmp_path):
     assert data["items"][0]["done"] is False
 
 
+def test_mock_formats_stream_items(tmp_path):
+    fields = [{"name": "id", "type": "string"}, {"name": "score", "type": "int"}]
+    items = list(iter_mock_items(fields, 4))
+
+    # The indented format is exactly what json.dumps(indent=2) produced before streaming
+    write_mock_items(tmp_path / "a.json", iter(items))
+    assert (tmp_path / "a.json").read_text() == json.dumps({"items": items}, indent=2) + "\n"
+    write_mock_items(tmp_path / "empty.json", iter([]))
+    assert (tmp_path / "empty.json").read_text() == json.dumps({"items": []}, indent=2) + "\n"
+    write_mock_items(tmp_path / "b.json", iter(items), "compact")
+    assert (tmp_path / "b.json").read_text().count("\n") == 1
+    assert json.loads((tmp_path / "b.json").read_text()) == {"items": items}
+
+    out = generate_mock_json(tmp_path, "todo", fields, item_count=1000, mock_format="ndjson", compress=True)
+    assert out.name == "todo.ndjson.gz"
+    lines = gzip.decompress(out.read_bytes()).decode().splitlines()
+    assert len(lines) == 1000 and json.loads(lines[-1]) == {"id": "1000", "score": 1000}
+    # Same input, same bytes (no gzip timestamp)
+    assert generate_mock_json(tmp_path, "todo", fields, item_count=1000, mock_format="ndjson", compress=True).read_bytes() == out.read_bytes()
+
+    # Switching format removes the previous seed file
+    generate_mock_json(tmp_path, "todo", fields)
+    assert sorted(p.name for p in out.parent.iterdir()) == ["todo.json"]
+
+
 def test_regenerate_data_source_config(tmp_path):
     lib = tmp_path / "lib"
     entity = lib / "domain" / "todo" / "model"
@@ -87,3 +118,115 @@ def test_regenerate_data_source_config(tmp_path):
     regenerate_data_source_config("my_app", lib, domain_folder="domain", has_login=False)
     updated = config_path.read_text()
     assert "'todo': DataSource.remote" in updated
+
+
+def test_build_entities_map_local_entities():
+    entities = build_entities_map(
+        ["cart", "note", "todo"],
+        has_login=False,
+        preserved_remote=set(),
+        preserved_local={"cart"},
+        local_keys={"cart", "note", "todo"},
+        known_keys={"cart", "note"},
+    )
+    # New DAO-backed entity starts local; an existing mock entry is kept
+    assert entities == {"cart": "local", "note": "mock", "todo": "local"}
+
+
+def test_local_index_columns():
+    fields = [
+        {"name": "id", "type": "string"},
+        {"name": "done", "type": "bool"},
+        {"name": "tags", "type": "List<String>"},
+    ]
+    columns = local_index_columns(fields, ["id", "done"])
+    assert columns == [{"name": "done", "pascal": "Done", "sql_type": "INTEGER", "dart_type": "bool"}]
+
+    with pytest.raises(ValueError):
+        local_index_columns(fields, ["tags"])
+    with pytest.raises(ValueError):
+        local_index_columns(fields, ["missing"])
+
+
+def test_regenerate_data_source_config_local(tmp_path):
+    lib = tmp_path / "lib"
+    for key in ("todo", "note"):
+        (lib / "domain" / key / "model").mkdir(parents=True)
+        (lib / "domain" / key / "model" / f"i_{key}_repository.dart").write_text("//")
+    (lib / "domain" / "todo" / "infrastructure").mkdir()
+    (lib / "domain" / "todo" / "infrastructure" / "todo_dao.dart").write_text("//")
+
+    regenerate_data_source_config("my_app", lib, domain_folder="domain", has_login=False)
+    config_path = lib / "apis" / "common" / "data_source_config.dart"
+    config = config_path.read_text()
+    assert "  local,\n" in config
+    assert "'todo': DataSource.local" in config
+    assert "'note': DataSource.mock" in config
+
+    # A manual switch back to mock survives regeneration
+    config_path.write_text(config.replace("'todo': DataSource.local", "'todo': DataSource.mock"))
+    regenerate_data_source_config("my_app", lib, domain_folder="domain", has_login=False)
+    assert read_preserved_sources(config_path)["todo"] == "mock"
+
+
+def test_update_data_source_config_in_place(tmp_path):
+    lib = tmp_path / "lib"
+
+    def add(key, dao=False):
+        (lib / "domain" / key / "model").mkdir(parents=True)
+        (lib / "domain" / key / "model" / f"i_{key}_repository.dart").write_text("//")
+        if dao:
+            (lib / "domain" / key / "infrastructure").mkdir()
+            (lib / "domain" / key / "infrastructure" / f"{key}_dao.dart").write_text("//")
+
+    add("note")
+    add("todo")
+    regenerate_data_source_config("my_app", lib, domain_folder="domain", has_login=True)
+    config_path = lib / "apis" / "common" / "data_source_config.dart"
+    config_path.write_text(config_path.read_text().replace("'todo': DataSource.mock", "'todo': DataSource.remote"))
+
+    add("cart", dao=True)
+    add("zebra")
+    assert update_data_source_config("my_app", lib, "cart", has_login=True)
+    assert update_data_source_config("my_app", lib, "zebra", has_login=True)
+    incremental = config_path.read_text()
+    assert list(read_preserved_sources(config_path).items()) == [
+        ("auth", "mock"), ("cart", "local"), ("note", "mock"), ("todo", "remote"), ("zebra", "mock"),
+    ]
+    regenerate_data_source_config("my_app", lib, domain_folder="domain", has_login=True)
+    assert config_path.read_text() == incremental
+
+    (lib / "domain" / "note" / "model" / "i_note_repository.dart").unlink()
+    assert update_data_source_config("my_app", lib, "note", has_login=True)
+    assert "'note'" not in config_path.read_text()
+
+    # Dropping login changes the structure: full regeneration
+    assert not update_data_source_config("my_app", lib, "zebra", has_login=False)
+    assert "auth" not in read_preserved_sources(config_path)
+
+
+def test_update_data_source_config_regenerates_an_enum_without_local(tmp_path):
+    lib = tmp_path / "lib"
+    for key in ("note", "todo"):
+        (lib / "domain" / key / "model").mkdir(parents=True)
+        (lib / "domain" / key / "model" / f"i_{key}_repository.dart").write_text("//")
+    regenerate_data_source_config("my_app", lib, domain_folder="domain", has_login=False)
+    config_path = lib / "apis" / "common" / "data_source_config.dart"
+    # Projects created before DataSource.local: only mock and remote
+    old_style = config_path.read_text().replace("  remote,\n  local,\n", "  remote,\n")
+    assert "local" not in old_style.split("abstract class")[0].split("enum DataSource")[1]
+    config_path.write_text(old_style)
+
+    # New entity with a DAO: DataSource.local is not declared, so the whole file is rendered again
+    (lib / "domain" / "cart" / "model").mkdir(parents=True)
+    (lib / "domain" / "cart" / "model" / "i_cart_repository.dart").write_text("//")
+    (lib / "domain" / "cart" / "infrastructure").mkdir()
+    (lib / "domain" / "cart" / "infrastructure" / "cart_dao.dart").write_text("//")
+    assert not update_data_source_config("my_app", lib, "cart")
+    config = config_path.read_text()
+    assert "  local,\n" in config and "'cart': DataSource.local" in config
+
+    # Once the enum is current, entities go in place again
+    (lib / "domain" / "zebra" / "model").mkdir(parents=True)
+    (lib / "domain" / "zebra" / "model" / "i_zebra_repository.dart").write_text("//")
+    assert update_data_source_config("my_app", lib, "zebra")
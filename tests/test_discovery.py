@@ -0,0 +1,60 @@
+"""Tests for the single-pass domain discovery and `flutterator --profile`."""
+
+from click.testing import CliRunner
+
+from flutterator import cli
+from generators.helpers.discovery import DomainScan
+from generators.helpers.profiling import FsProfile
+
+
+def _write_domain(lib, entities=5):
+    for i in range(entities):
+        model = lib / "domain" / f"item{i}" / "model"
+        model.mkdir(parents=True)
+        (model / f"item{i}.dart").write_text(f"@freezed\nabstract class Item{i} with _$Item{i} {{}}\n")
+        (model / f"item{i}_failure.dart").write_text("abstract class Failure with _$Failure {}\n")
+        (model / "value_objects.dart").write_text("// value objects\n")
+        (model / f"i_item{i}_repository.dart").write_text("abstract class IRepository {}\n")
+        (lib / "domain" / f"item{i}" / "infrastructure").mkdir()
+    (lib / "domain" / "item0" / "infrastructure" / "item0_dao.dart").write_text("class Item0Dao {}\n")
+    (lib / "domain" / "enums").mkdir()
+    (lib / "domain" / "enums" / "status.dart").write_text("enum Status { draft }\n")
+
+
+def test_domain_scan_lists_each_directory_once_without_stat(tmp_path):
+    lib = tmp_path / "lib"
+    _write_domain(lib)
+
+    with FsProfile() as profile:
+        scan = DomainScan(lib, "domain")
+        assert scan.models["item3"] == {"class_name": "Item3", "folder": "item3"}
+        assert len(scan.models) == 5
+        assert list(scan.enums_info) == ["Status"]
+        assert scan.repository_keys() == [f"item{i}" for i in range(5)]
+        assert scan.local_keys() == {"item0"}
+        assert scan.has_file("item2", "model", "item2_failure.dart")
+
+    assert profile.stat_calls == 0
+    # root + enums/ + each folder's model/ and infrastructure/ (enums included)
+    assert profile.listing_calls == 2 + 2 * 6
+    # The manifest probe, then entity candidates only (value objects, failures and
+    # interfaces are skipped by name) and the enum file
+    assert profile.counts["open"] == 1 + 5 + 1
+
+
+def test_missing_domain_folder_is_empty(tmp_path):
+    scan = DomainScan(tmp_path / "lib", "domain")
+    assert scan.models == {} and scan.enums_info == {} and scan.repository_keys() == []
+    assert scan.model_class_name("todo") is None
+
+
+def test_profile_option_prints_filesystem_counts(tmp_path):
+    lib = tmp_path / "lib"
+    _write_domain(lib, entities=2)
+    (tmp_path / "pubspec.yaml").write_text("name: my_app\ndependencies:\n  flutter:\n    sdk: flutter\n")
+
+    result = CliRunner().invoke(cli, ["--profile", "list", "--project-path", str(tmp_path)])
+    assert result.exit_code == 0, result.output
+    assert "Item1" in result.output
+    assert "stat / lstat calls" in result.output
+    assert "scandir / listdir calls" in result.output
@@ -2,13 +2,14 @@
 End-to-End tests that require Flutter SDK installed.
 
 These tests verify that generated Dart code actually compiles.
-They are automatically skipped if Flutter SDK is not available.
+They are marked ``e2e`` and only run with ``--run-e2e``; they are also
+skipped if Flutter SDK is not available.
 
 To run only E2E tests:
-    pytest tests/test_e2e_flutter.py -v
+    pytest tests/test_e2e_flutter.py -v --run-e2e
 
 To run all tests including E2E:
-    pytest tests/ -v
+    pytest tests/ -v --run-e2e
 """
 
 import pytest
@@ -18,6 +19,8 @@ from pathlib import Path
 import os
 
 
+pytestmark = pytest.mark.e2e
+
 # Check if Flutter is available
 FLUTTER_AVAILABLE = shutil.which("flutter") is not None
 
@@ -0,0 +1,58 @@
+"""Tests for error_localizer.dart generation and in-place updates."""
+
+from generators.helpers.domain import create_domain_entity_layers
+from generators.helpers.manifest import manifest_at
+from generators.templates._core.core_generator import generate_error_localizer, update_error_localizer
+
+FIELDS = [{"name": "id", "type": "UniqueId"}]
+
+
+def _project(tmp_path, entities):
+    (tmp_path / "pubspec.yaml").write_text("name: my_app\ndependencies:\n  flutter:\n    sdk: flutter\n")
+    lib = tmp_path / "lib"
+    for name in entities:
+        _add_entity(lib, name)
+    return lib
+
+
+def _add_entity(lib, name):
+    (lib / "domain" / name).mkdir(parents=True)
+    create_domain_entity_layers(lib / "domain" / name, name, name.title(), FIELDS, "my_app", "domain")
+
+
+def test_update_matches_a_full_render(tmp_path):
+    lib = _project(tmp_path, ["note", "todo"])
+    generate_error_localizer("my_app", lib, has_login=True)
+    localizer = lib / "core" / "errors" / "error_localizer.dart"
+
+    for name in ("item", "zebra"):  # before and after the existing entities
+        _add_entity(lib, name)
+        assert update_error_localizer("my_app", lib, name, name.title(), has_login=True)
+    incremental = localizer.read_text()
+    assert manifest_at(tmp_path).file_status("lib/core/errors/error_localizer.dart") == "unchanged"
+
+    generate_error_localizer("my_app", lib, has_login=True)
+    assert localizer.read_text() == incremental
+    assert incremental.index("localizeAuthFailure") < incremental.index("localizeItemFailure") < incremental.index("localizeZebraFailure")
+
+
+def test_update_keeps_hand_edits_and_removes_entities(tmp_path):
+    lib = _project(tmp_path, ["note", "todo"])
+    generate_error_localizer("my_app", lib)
+    localizer = lib / "core" / "errors" / "error_localizer.dart"
+    localizer.write_text(localizer.read_text().replace("'Note not found'", "'No such note'"))
+
+    _add_entity(lib, "item")
+    assert update_error_localizer("my_app", lib, "item", "Item")
+    content = localizer.read_text()
+    assert "'No such note'" in content and "localizeItemFailure" in content
+    assert manifest_at(tmp_path).file_status("lib/core/errors/error_localizer.dart") == "modified"
+
+    (lib / "domain" / "todo" / "model" / "todo_failure.dart").unlink()
+    assert update_error_localizer("my_app", lib, "todo", "Todo")
+    content = localizer.read_text()
+    assert "todo_failure" not in content and "'No such note'" in content
+
+    # --rebuild: full scan, hand edits are backed up and replaced
+    assert not update_error_localizer("my_app", lib, "item", "Item", rebuild=True)
+    assert "'Note not found'" in localizer.read_text()
@@ -312,6 +312,35 @@ class TestComponentGeneration:
         assert "hide Title" in widget_content
         assert "value_objects.dart" not in widget_content
 
+    def test_create_component_layers_form_partial_rebuilds(self, sample_project_structure):
+        """Test form widget rebuilds per field and typed fields are debounced"""
+        project_dir = sample_project_structure
+        lib_path = project_dir / "lib"
+        component_dir = lib_path / "todo_form"
+        component_dir.mkdir(parents=True, exist_ok=True)
+
+        field_list = [
+            {"name": "title", "type": "string"},
+            {"name": "done", "type": "bool"}
+        ]
+
+        create_component_form_layers(component_dir, "todo_form", field_list, "test_project", "", lib_path=lib_path)
+
+        widget_content = (component_dir / "presentation" / "todo_form_component.dart").read_text()
+        assert "BlocBuilder<" not in widget_content
+        assert "selector: (TodoFormFormState state) => state.done.getOrCrash()" in widget_content
+        assert "state.isSubmitting" in widget_content
+
+        bloc_content = (component_dir / "application" / "todo_form_form_bloc.dart").read_text()
+        assert "on<TitleChanged>(_unlessFlushed('title', _onTitleChanged), transformer: _debounce());" in bloc_content
+        assert "on<DoneChanged>(_onDoneChanged);" in bloc_content
+        assert "import 'package:rxdart/rxdart.dart';" in bloc_content
+        # Submit applies pending debounced changes instead of sleeping for the debounce
+        assert "Future<void>.delayed(validationDebounce)" not in bloc_content
+        assert "_pendingChanges['title'] = event;" in bloc_content
+        assert "_onTitleChanged(pendingTitle, emit);" in bloc_content
+        assert "_pendingChanges['done']" not in bloc_content
+
 
 class TestCLICommands:
     """Test CLI command execution"""
@@ -1001,6 +1030,110 @@ AutoRoute(page: SettingsPage, path: '/settings')
             assert result.exit_code != 0
             assert "Not a Flutter project" in result.output
 
+    def test_add_page_deferred_and_list(self, sample_project_structure):
+        """Test add-page --deferred writes a deferred route that list still recognizes"""
+        from flutterator import cli
+        runner = click.testing.CliRunner()
+        
+        project_dir = sample_project_structure
+        
+        with runner.isolated_filesystem():
+            import shutil
+            shutil.copytree(project_dir, "test_project")
+            
+            result = runner.invoke(cli, [
+                "add-page",
+                "--name", "reports",
+                "--project-path", "test_project",
+                "--deferred",
+                "--no-build"
+            ])
+            
+            assert result.exit_code == 0
+            router = Path("test_project/lib/router.dart").read_text()
+            assert "reports_page.dart' deferred as reports_page;" in router
+            assert "loadLibrary: reports_page.loadLibrary" in router
+            assert "path: '/reports'" in router
+            assert Path("test_project/lib/core/presentation/deferred_page.dart").exists()
+            
+            result = runner.invoke(cli, ["list", "--project-path", "test_project"])
+            
+            assert result.exit_code == 0
+            assert "ReportsPage" in result.output
+            assert "deferred" in result.output
+
+    def test_add_page_deferred_class_matches_page_file(self, sample_project_structure):
+        """Test the deferred route builds the class declared by the page file (underscored names)"""
+        from flutterator import cli
+        runner = click.testing.CliRunner()
+        
+        with runner.isolated_filesystem():
+            import shutil
+            shutil.copytree(sample_project_structure, "test_project")
+            
+            result = runner.invoke(cli, [
+                "add-page",
+                "--name", "user_profile",
+                "--project-path", "test_project",
+                "--deferred",
+                "--no-build"
+            ])
+            
+            assert result.exit_code == 0
+            page = next(Path("test_project/lib").rglob("user_profile_page.dart")).read_text()
+            assert "class User_profilePage extends StatelessWidget" in page
+            router = Path("test_project/lib/router.dart").read_text()
+            assert "=> user_profile_page.User_profilePage()," in router
+
+    def test_upgrade_storage_command(self, sample_project_structure):
+        """Test upgrade-storage regenerates storage with preloaded SharedPreferences"""
+        from flutterator import cli
+        runner = click.testing.CliRunner()
+        
+        project_dir = sample_project_structure
+        
+        with runner.isolated_filesystem():
+            import shutil
+            shutil.copytree(project_dir, "test_project")
+            storage_dir = Path("test_project/lib/storage")
+            storage_dir.mkdir(parents=True)
+            (storage_dir / "storage_repository.dart").write_text("// legacy")
+            
+            result = runner.invoke(cli, [
+                "upgrade-storage",
+                "--project-path", "test_project",
+                "--force",
+                "--no-build"
+            ])
+            
+            assert result.exit_code == 0
+            repository = (storage_dir / "storage_repository.dart").read_text()
+            assert "StorageRepository(this._prefs)" in repository
+            assert "SharedPreferences.getInstance()" not in repository
+            module = (storage_dir / "storage_injectable_module.dart").read_text()
+            assert "@preResolve" in module
+
+    def test_upgrade_storage_dry_run(self, sample_project_structure):
+        """Test upgrade-storage --dry-run writes nothing"""
+        from flutterator import cli
+        runner = click.testing.CliRunner()
+        
+        project_dir = sample_project_structure
+        
+        with runner.isolated_filesystem():
+            import shutil
+            shutil.copytree(project_dir, "test_project")
+            
+            result = runner.invoke(cli, [
+                "upgrade-storage",
+                "--project-path", "test_project",
+                "--dry-run"
+            ])
+            
+            assert result.exit_code == 0
+            assert "DRY-RUN" in result.output
+            assert not Path("test_project/lib/storage/storage_injectable_module.dart").exists()
+
 
 class TestFeatureModes:
     """Test the three modes of add-feature command"""
@@ -1095,6 +1228,163 @@ class TestFeatureModes:
         assert not (domain_dir / "infrastructure" / "address_remote_service.dart").exists()
         assert not (domain_dir / "infrastructure" / "address_repository.dart").exists()
 
+    def test_create_domain_entity_bulk(self, sample_project_structure):
+        """--bulk adds chunked createMany/updateMany/deleteMany through every layer."""
+        project_dir = sample_project_structure
+        lib_path = project_dir / "lib"
+        domain_dir = lib_path / "domain" / "reading"
+        domain_dir.mkdir(parents=True, exist_ok=True)
+
+        field_list = [
+            {"name": "id", "type": "string"},
+            {"name": "value", "type": "double"},
+        ]
+
+        create_domain_entity_layers(
+            domain_dir, "reading", "Reading", field_list, "test_project", "domain", bulk=True, batch_size=25
+        )
+
+        infra = domain_dir / "infrastructure"
+        i_repo = (domain_dir / "model" / "i_reading_repository.dart").read_text()
+        assert "createMany(List<Reading> items);" in i_repo
+        assert "deleteMany(List<String> ids);" in i_repo
+        assert "updateMany(List<ReadingDto> readingDtos);" in (infra / "i_reading_service.dart").read_text()
+        remote = (infra / "reading_remote_service.dart").read_text()
+        assert "@POST('/readings/batch')" in remote
+        assert "@POST('/readings/batch-delete')" in remote
+        mock = (infra / "mock_reading_service.dart").read_text()
+        assert "items.addAll(readingDtos);" in mock
+        repository = (infra / "reading_repository.dart").read_text()
+        assert "static const int batchSize = 25;" in repository
+        assert "_chunked(_mapper.toDtoList(items))" in repository
+
+        from generators.helpers.component import get_repository_info
+        methods = get_repository_info(lib_path, "domain", "reading")["methods"]
+        assert {"createMany", "updateMany", "deleteMany"} <= methods
+
+    def test_create_domain_entity_without_bulk(self, sample_project_structure):
+        """Bulk methods are opt-in."""
+        project_dir = sample_project_structure
+        lib_path = project_dir / "lib"
+        domain_dir = lib_path / "domain" / "note"
+        domain_dir.mkdir(parents=True, exist_ok=True)
+
+        create_domain_entity_layers(
+            domain_dir, "note", "Note", [{"name": "id", "type": "string"}], "test_project", "domain"
+        )
+
+        assert "Many" not in (domain_dir / "model" / "i_note_repository.dart").read_text()
+        assert "Many" not in (domain_dir / "infrastructure" / "note_repository.dart").read_text()
+
+    def test_create_domain_entity_local(self, sample_project_structure):
+        """--local adds a SQLite DAO with indexed columns and a local-first service."""
+        project_dir = sample_project_structure
+        lib_path = project_dir / "lib"
+        domain_dir = lib_path / "domain" / "todo"
+        domain_dir.mkdir(parents=True, exist_ok=True)
+
+        field_list = [
+            {"name": "id", "type": "string"},
+            {"name": "title", "type": "string"},
+            {"name": "done", "type": "bool"},
+        ]
+
+        create_domain_entity_layers(
+            domain_dir, "todo", "Todo", field_list, "test_project", "domain", local=True, indexed_fields=["done"]
+        )
+
+        infra = domain_dir / "infrastructure"
+        assert (lib_path / "core" / "infrastructure" / "local_database.dart").exists()
+        dao = (infra / "todo_dao.dart").read_text()
+        assert "CREATE INDEX IF NOT EXISTS idx_${table}_done ON $table (done)" in dao
+        assert "Future<List<TodoDto>> findByDone(bool value)" in dao
+        assert "class LocalTodoService implements ITodoService" in (infra / "local_todo_service.dart").read_text()
+        module = (infra / "todo_service_module.dart").read_text()
+        assert "case DataSource.local:" in module
+        assert "LocalTodoService local" in module
+
+    def test_create_domain_entity_indexed_fields(self, sample_project_structure):
+        """@indexed fields get findBy<Field> in every layer, with a hash index in the mock."""
+        project_dir = sample_project_structure
+        lib_path = project_dir / "lib"
+        enum_dir = lib_path / "domain" / "enums"
+        enum_dir.mkdir(parents=True, exist_ok=True)
+        (enum_dir / "task_status.dart").write_text("enum TaskStatus { open, done }\n")
+        domain_dir = lib_path / "domain" / "task"
+        domain_dir.mkdir(parents=True, exist_ok=True)
+
+        field_list = [
+            {"name": "id", "type": "string"},
+            {"name": "title", "type": "String", "indexed": True},
+            {"name": "status", "type": "TaskStatus", "indexed": True},
+        ]
+
+        create_domain_entity_layers(domain_dir, "task", "Task", field_list, "test_project", "domain")
+
+        infra = domain_dir / "infrastructure"
+        i_repo = (domain_dir / "model" / "i_task_repository.dart").read_text()
+        assert "Future<Either<TaskFailure, List<Task>>> findByStatus(TaskStatus status);" in i_repo
+        assert "import 'package:test_project/domain/enums/task_status.dart';" in i_repo
+        assert "Future<List<TaskDto>> findByStatus(String status);" in (infra / "i_task_service.dart").read_text()
+        remote = (infra / "task_remote_service.dart").read_text()
+        assert "findByTitle(@Query('title') String title);" in remote
+        mock = (infra / "mock_task_service.dart").read_text()
+        assert "_lookup('status', status, (TaskDto e) => e.status)" in mock
+        assert mock.count("_indexes.clear();") == 3
+        repository = (infra / "task_repository.dart").read_text()
+        assert "_service.findByStatus(status.name)" in repository
+        assert "import 'package:test_project/domain/enums/task_status.dart';" in repository
+
+    def test_create_domain_entity_reactive(self, sample_project_structure):
+        """--reactive adds watchAll() and list components subscribe to it."""
+        from generators.helpers import create_component_list_layers
+
+        project_dir = sample_project_structure
+        lib_path = project_dir / "lib"
+        domain_dir = lib_path / "domain" / "todo"
+        domain_dir.mkdir(parents=True, exist_ok=True)
+
+        field_list = [{"name": "id", "type": "string"}, {"name": "title", "type": "string"}]
+        create_domain_entity_layers(domain_dir, "todo", "Todo", field_list, "test_project", "domain", reactive=True)
+
+        infra = domain_dir / "infrastructure"
+        assert "Stream<Either<TodoFailure, List<Todo>>> watchAll();" in (domain_dir / "model" / "i_todo_repository.dart").read_text()
+        assert "abstract class ITodoWatchableService implements ITodoService" in (infra / "i_todo_service.dart").read_text()
+        mock = (infra / "mock_todo_service.dart").read_text()
+        assert "class MockTodoService implements ITodoWatchableService" in mock
+        assert "StreamController<List<TodoDto>>.broadcast()" in mock
+        assert "class PollingTodoService implements ITodoWatchableService" in (infra / "polling_todo_service.dart").read_text()
+        assert "return PollingTodoService(remote);" in (infra / "todo_service_module.dart").read_text()
+        assert "_service.watchAll()" in (infra / "todo_repository.dart").read_text()
+
+        component_dir = lib_path / "features" / "components" / "todo_list"
+        component_dir.mkdir(parents=True)
+        create_component_list_layers(component_dir, "todo_list", "test_project", None, "todo", "domain", lib_path=lib_path)
+        bloc = (component_dir / "application" / "todo_list_bloc.dart").read_text()
+        assert "await emit.forEach<Either<TodoFailure, List<Todo>>>(" in bloc
+        assert "_repository.watchAll()" in bloc
+
+    def test_create_domain_entity_not_reactive_by_default(self, sample_project_structure):
+        """Without --reactive the list bloc keeps loading with getAll()."""
+        project_dir = sample_project_structure
+        domain_dir = project_dir / "lib" / "domain" / "note"
+        domain_dir.mkdir(parents=True, exist_ok=True)
+
+        create_domain_entity_layers(domain_dir, "note", "Note", [{"name": "id", "type": "string"}], "test_project", "domain")
+
+        infra = domain_dir / "infrastructure"
+        assert "watchAll" not in (domain_dir / "model" / "i_note_repository.dart").read_text()
+        assert not (infra / "polling_note_service.dart").exists()
+        assert "dart:async" not in (infra / "mock_note_service.dart").read_text()
+
+    def test_indexed_field_rejects_non_scalar_type(self, sample_project_structure):
+        """Only scalar and enum fields can be @indexed."""
+        from generators.helpers.domain import indexed_query_fields
+
+        with pytest.raises(ValueError, match="cannot be @indexed"):
+            indexed_query_fields([{"name": "due", "type": "DateTime", "indexed": True}])
+        assert indexed_query_fields([{"name": "count", "type": "int"}]) == []
+
     def test_add_domain_no_repo_cli(self, sample_project_structure):
         """add-domain --no-repo skips repository and service files."""
         from flutterator import cli
@@ -1232,11 +1522,20 @@ class TestFeatureModes:
             assert "_repository.update(" in bloc_content
             assert "_repository.delete(" in bloc_content
             
-            # Check that state has List<Model> items and reload flag on Loaded
+            # Check that Loaded carries an id-indexed map, revision and reload flag
             state_content = (component_dir / "application" / "todo_list_state.dart").read_text()
-            assert "List<Todo>" in state_content or "List<todo>" in state_content
-            assert "loaded(List<" in state_content
+            assert "Map<String, Todo> itemsById" in state_content
+            assert "@Default(0) int revision" in state_content
             assert "isReloading" in state_content
+            assert "TodoFailure? mutationFailure" in state_content
+
+            # Mutations are applied optimistically and rolled back on failure
+            assert "_itemsById[id] = event.item;" in bloc_content
+            assert "_itemsById.remove(event.id)" in bloc_content
+            # Every emitted state gets its own copy, never the map mutated in place
+            assert "Map<String, Todo>.unmodifiable(_itemsById)" in bloc_content
+            assert "State.loaded(\n      _itemsById," not in bloc_content
+            assert "mutationFailure: failure" in bloc_content
             
             # Check that event has loadRequested, createRequested, updateRequested, deleteRequested
             event_content = (component_dir / "application" / "todo_list_event.dart").read_text()
@@ -1249,6 +1548,7 @@ class TestFeatureModes:
             widget_content = (component_dir / "presentation" / "todo_list_component.dart").read_text()
             assert "ErrorLocalizer.localizeTodoFailure" in widget_content
             assert "localizeModelFailure" not in widget_content
+            assert "ValueKey<String>(id)" in widget_content
             assert "LoadingWidget" in widget_content
             assert "UnknownStateWidget" in widget_content
 
@@ -0,0 +1,41 @@
+"""Tests for the generated main.dart bootstrap and eager/lazy DI registrations."""
+
+from generators.helpers.config import FlutteratorConfig, apply_cli_overrides
+from generators.templates.lib.lib_generator import generate_main
+from generators.templates.storage.storage_generator import generate_storage_repository
+
+
+def test_main_sequential_bootstrap_by_default(tmp_path):
+    lib = tmp_path / "lib"
+    generate_main("my_app", lib)
+
+    main = (lib / "main.dart").read_text()
+    assert "await configureDependencies(Environment.dev);" in main
+    assert "Future.wait" not in main
+    assert "dart:developer" not in main
+
+
+def test_main_fast_startup_parallel_and_traced(tmp_path):
+    lib = tmp_path / "lib"
+    generate_main("my_app", lib, "#112233", None, fast_startup=True)
+
+    main = (lib / "main.dart").read_text()
+    assert main.startswith("import 'dart:developer';")
+    assert "await Future.wait(<Future<void>>[" in main
+    assert "_timedAsync('configureDependencies'" in main
+    assert "Timeline.startSync('startup:$phase')" in main
+    # Environment must be set before DI so Dio sees the right base URL
+    assert main.index("initEnvironment();") < main.index("Future.wait")
+    assert "Color(0xFF112233)" in main
+
+
+def test_storage_repository_lazy_with_fast_startup(tmp_path):
+    lib = tmp_path / "lib"
+    generate_storage_repository("my_app", lib)
+    assert "@Singleton()" in (lib / "storage" / "storage_repository.dart").read_text()
+
+    cfg = apply_cli_overrides(FlutteratorConfig.from_dict({"startup": {"fast_startup": False}}, "test"), fast_startup=True)
+    generate_storage_repository("my_app", lib, config=cfg)
+    repository = (lib / "storage" / "storage_repository.dart").read_text()
+    assert "@LazySingleton()" in repository
+    assert "@Singleton()" not in repository
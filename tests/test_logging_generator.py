@@ -0,0 +1,31 @@
+"""Tests for the generated logging/ layer."""
+
+from generators.helpers.config import FlutteratorConfig, apply_cli_overrides
+from generators.templates.logging.logging_generator import generate_files
+
+
+def test_logger_compile_time_levels(tmp_path):
+    lib = tmp_path / "lib"
+    cfg = apply_cli_overrides(FlutteratorConfig(), release_log_level="error")
+    generate_files("my_app", lib, config=cfg)
+
+    logger = (lib / "logging" / "logger.dart").read_text()
+    assert "const String _logLevelDefine = String.fromEnvironment('LOG_LEVEL');" in logger
+    assert "static const LoggerLevel minLevel =" in logger
+    assert "_logLevelDefine == 'info' ? LoggerLevel.info :" in logger
+    assert "kReleaseMode ? LoggerLevel.error : LoggerLevel.verbose;" in logger
+    assert "static const int _minSeverity =" in logger
+    assert "_logLevelDefine == 'info' ? 2 :" in logger
+    assert "kReleaseMode ? 4 : 0;" in logger
+    assert "_parseLevel" not in logger
+    assert "bool isEnabled(LoggerLevel level)" in logger
+    assert "void logVerboseLazy(String Function() message)" in logger
+
+
+def test_logger_invalid_level_falls_back_to_default(tmp_path):
+    lib = tmp_path / "lib"
+    cfg = FlutteratorConfig.from_dict({"logging": {"release_min_level": "loud"}}, "test")
+    generate_files("my_app", lib, config=cfg)
+
+    logger = (lib / "logging" / "logger.dart").read_text()
+    assert "kReleaseMode ? LoggerLevel.warning : LoggerLevel.verbose;" in logger
@@ -0,0 +1,88 @@
+"""Tests for the generated-file manifest (.flutterator/manifest.json)."""
+
+import json
+
+from click.testing import CliRunner
+
+from flutterator import cli
+from generators.helpers.discovery import DomainScan
+from generators.helpers.domain import create_domain_entity_layers
+from generators.helpers.manifest import flush_manifests, manifest_at
+from generators.helpers.profiling import FsProfile
+from generators.templates.copier import generate_file
+
+TEMPLATE = "feature/feature_entity_template.jinja"
+
+
+def _project(tmp_path):
+    (tmp_path / "pubspec.yaml").write_text("name: my_app\ndependencies:\n  flutter:\n    sdk: flutter\n")
+    lib = tmp_path / "lib"
+    lib.mkdir()
+    return lib
+
+
+def test_generate_file_records_skips_and_backs_up(tmp_path):
+    lib = _project(tmp_path)
+    args = {"feature_name": "Todo", "fields": []}
+    generate_file("my_app", lib, TEMPLATE, "domain/todo/model/todo.dart", args)
+    flush_manifests()
+
+    entry = json.loads((tmp_path / ".flutterator" / "manifest.json").read_text())["files"]["lib/domain/todo/model/todo.dart"]
+    assert entry["template"] == TEMPLATE and entry["entity_class"] == "Todo"
+
+    # Same template and inputs, file untouched: nothing is rendered or written
+    manifest = manifest_at(tmp_path)
+    output = lib / "domain" / "todo" / "model" / "todo.dart"
+    mtime = output.stat().st_mtime_ns
+    generate_file("my_app", lib, TEMPLATE, "domain/todo/model/todo.dart", args)
+    assert manifest.skipped == 1 and output.stat().st_mtime_ns == mtime
+
+    # Hand edits are detected and backed up before the file is regenerated
+    output.write_text(output.read_text() + "// my change\n")
+    assert manifest.file_status("lib/domain/todo/model/todo.dart") == "modified"
+    generate_file("my_app", lib, TEMPLATE, "domain/todo/model/todo.dart", {"feature_name": "Todo", "fields": ["x"]})
+    assert manifest.backed_up == ["lib/domain/todo/model/todo.dart"]
+    backup = tmp_path / ".flutterator" / "backups" / manifest.session / "lib/domain/todo/model/todo.dart"
+    assert backup.read_text().endswith("// my change\n")
+    assert "// my change" not in output.read_text()
+
+
+def test_outside_a_project_nothing_is_recorded(tmp_path):
+    generate_file("my_app", tmp_path / "lib", TEMPLATE, "todo.dart", {"feature_name": "Todo"})
+    assert (tmp_path / "lib" / "todo.dart").exists()
+    assert not (tmp_path / ".flutterator").exists()
+
+
+def test_domain_scan_reads_class_names_from_the_manifest(tmp_path):
+    lib = _project(tmp_path)
+    for name in ("todo", "note"):
+        (lib / "domain" / name).mkdir(parents=True)
+        create_domain_entity_layers(lib / "domain" / name, name, name.title(), [{"name": "id", "type": "UniqueId"}], "my_app", "domain")
+
+    with FsProfile() as profile:
+        models = DomainScan(lib, "domain").models
+    assert models == {"note": {"class_name": "Note", "folder": "note"}, "todo": {"class_name": "Todo", "folder": "todo"}}
+    assert profile.counts["open"] == 0
+
+
+def test_domain_scan_reads_hand_edited_models(tmp_path):
+    lib = _project(tmp_path)
+    (lib / "domain" / "todo").mkdir(parents=True)
+    create_domain_entity_layers(lib / "domain" / "todo", "todo", "Todo", [{"name": "id", "type": "UniqueId"}], "my_app", "domain")
+    flush_manifests()
+
+    model = lib / "domain" / "todo" / "model" / "todo.dart"
+    model.write_text(model.read_text().replace("Todo", "Task"))
+    assert DomainScan(lib, "domain").models == {"todo": {"class_name": "Task", "folder": "todo"}}
+
+
+def test_manifest_command_lists_modified_files(tmp_path):
+    lib = _project(tmp_path)
+    generate_file("my_app", lib, TEMPLATE, "domain/todo/model/todo.dart", {"feature_name": "Todo"})
+    generate_file("my_app", lib, TEMPLATE, "domain/note/model/note.dart", {"feature_name": "Note"})
+    (lib / "domain" / "note" / "model" / "note.dart").write_text("// rewritten\n")
+
+    result = CliRunner().invoke(cli, ["manifest", "--project-path", str(tmp_path), "--modified"])
+    assert result.exit_code == 0, result.output
+    assert "domain/note" in result.output and "domain/todo" not in result.output
+    assert "1 unchanged, 1 modified, 0 missing" in result.output
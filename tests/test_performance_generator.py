@@ -0,0 +1,96 @@
+"""Tests for the generated core/performance/ instrumentation and its wiring."""
+
+from generators.helpers.config import FlutteratorConfig, apply_cli_overrides
+from generators.helpers.instrumentation import ALREADY_WIRED, MANUAL, WIRED, wire_instrumentation
+from generators.templates.apis.apis_generator import generate_files as generate_apis_files
+from generators.templates.lib.lib_generator import generate_files as generate_lib_files
+from generators.templates.performance.performance_generator import PERFORMANCE_FILES, generate_files
+
+
+def _generate_project(lib, config):
+    generate_lib_files("my_app", lib, False, config=config)
+    generate_apis_files("my_app", lib, has_login=False, config=config)
+
+
+def test_instrumentation_disabled_by_default(tmp_path):
+    lib = tmp_path / "lib"
+    _generate_project(lib, FlutteratorConfig())
+
+    assert "observers:" not in (lib / "router.dart").read_text()
+    assert "PerformanceMonitor" not in (lib / "main.dart").read_text()
+    assert "ApiLatencyInterceptor" not in (lib / "apis" / "core" / "api_injectable_module.dart").read_text()
+
+
+def test_performance_module_uses_config_thresholds(tmp_path):
+    lib = tmp_path / "lib"
+    cfg = FlutteratorConfig.from_dict(
+        {"performance": {"instrumentation": True, "jank_threshold_ms": 8, "report_interval_seconds": 30}},
+        "test",
+    )
+    generate_files("my_app", lib, config=cfg)
+
+    assert all((lib / rel).exists() for rel in PERFORMANCE_FILES)
+    monitor = (lib / "core" / "performance" / "performance_monitor.dart").read_text()
+    assert "Duration(milliseconds: 8)" in monitor
+    assert "Duration(seconds: 30)" in monitor
+    assert "import 'package:my_app/logging/logger.dart';" in monitor
+    # Default report level survives the default release minimum (warning)
+    assert "static const LoggerLevel reportLevel = LoggerLevel.warning;" in monitor
+    assert "static const LoggerLevel jankReportLevel = LoggerLevel.warning;" in monitor
+    collector = (lib / "core" / "performance" / "frame_timing_collector.dart").read_text()
+    assert "SchedulerBinding.instance.addTimingsCallback(_onTimings)" in collector
+
+
+def test_performance_report_level_from_config(tmp_path):
+    lib = tmp_path / "lib"
+    cfg = FlutteratorConfig.from_dict({"performance": {"instrumentation": True, "report_level": "info"}}, "test")
+    generate_files("my_app", lib, config=cfg)
+
+    monitor = (lib / "core" / "performance" / "performance_monitor.dart").read_text()
+    assert "static const LoggerLevel reportLevel = LoggerLevel.info;" in monitor
+    assert "static const LoggerLevel jankReportLevel = LoggerLevel.warning;" in monitor
+    assert "_log(_summary(frames), level);" in monitor
+
+    cfg = FlutteratorConfig.from_dict({"performance": {"report_level": "error"}}, "test")
+    generate_files("my_app", lib, config=cfg)
+    monitor = (lib / "core" / "performance" / "performance_monitor.dart").read_text()
+    assert "static const LoggerLevel jankReportLevel = LoggerLevel.error;" in monitor
+
+
+def test_create_perf_wires_router_main_and_dio(tmp_path):
+    lib = tmp_path / "lib"
+    cfg = apply_cli_overrides(FlutteratorConfig(), perf=True, http_cache=True)
+    _generate_project(lib, cfg)
+
+    router = (lib / "router.dart").read_text()
+    assert "  observers: <NavigatorObserver>[getIt<PerformanceRouteObserver>()],\n  routes:" in router
+    main = (lib / "main.dart").read_text()
+    assert main.index("configureDependencies(Environment.dev)") < main.index("getIt<PerformanceMonitor>().start();")
+    assert main.index("getIt<PerformanceMonitor>().start();") < main.index("runApp(")
+    module = (lib / "apis" / "core" / "api_injectable_module.dart").read_text()
+    assert "HttpCacheInterceptor httpCacheInterceptor, ApiLatencyInterceptor apiLatencyInterceptor) {" in module
+    # First in the chain: measures the latency the caller sees, cache hits included
+    assert module.index("..add(apiLatencyInterceptor)") < module.index("ApiLogger()")
+
+
+def test_wire_instrumentation_matches_create_perf(tmp_path):
+    wired, created = tmp_path / "wired" / "lib", tmp_path / "created" / "lib"
+    _generate_project(wired, FlutteratorConfig(fast_startup=True))
+    _generate_project(created, FlutteratorConfig(fast_startup=True, perf_instrumentation=True))
+
+    statuses = wire_instrumentation(wired, "my_app")
+    assert set(statuses.values()) == {WIRED}
+    assert set(wire_instrumentation(wired, "my_app").values()) == {ALREADY_WIRED}
+    for rel in statuses:
+        # Same code; only the position of the added imports differs
+        assert sorted((wired / rel).read_text().splitlines()) == sorted((created / rel).read_text().splitlines())
+
+
+def test_wire_instrumentation_leaves_unrecognized_files(tmp_path):
+    lib = tmp_path / "lib"
+    lib.mkdir()
+    (lib / "router.dart").write_text("final GoRouter router = buildRouter();\n")
+
+    statuses = wire_instrumentation(lib, "my_app")
+    assert set(statuses.values()) == {MANUAL}
+    assert (lib / "router.dart").read_text() == "final GoRouter router = buildRouter();\n"
@@ -0,0 +1,78 @@
+"""Tests for the dependency / code-size audit and the `create --minimal` preset."""
+
+from generators.config.pubspec import FORM_DEPENDENCIES, main_dependencies_for, missing_dependencies
+from generators.helpers.config import FlutteratorConfig
+from generators.helpers.size_audit import attribute_size, audit_dependencies, scan_package_imports
+from generators.templates import generate_files
+
+PUBSPEC = """name: my_app
+dependencies:
+  flutter:
+    sdk: flutter
+  dio: ^5.4.0
+  json_annotation: ^4.8.1
+  font_awesome_flutter: ^10.6.0
+dev_dependencies:
+  build_runner: ^2.4.0
+"""
+
+
+def test_audit_dependencies_flags_unused_and_undeclared(tmp_path):
+    (tmp_path / "pubspec.yaml").write_text(PUBSPEC)
+    lib = tmp_path / "lib" / "apis"
+    lib.mkdir(parents=True)
+    (lib / "client.dart").write_text(
+        "import 'package:dio/dio.dart';\n"
+        "import 'package:go_router/go_router.dart';\n"
+        "import 'package:my_app/main.dart';\n"
+    )
+
+    audit = audit_dependencies(tmp_path, "my_app")
+    assert audit["used"] == {"dio": ["apis/client.dart"]}
+    assert list(audit["implicit"]) == ["json_annotation"]
+    assert audit["unused"] == ["font_awesome_flutter"]
+    assert audit["undeclared"] == ["go_router"]
+
+
+def test_attribute_size_splits_app_package_by_folder():
+    analysis = {
+        "n": "app-release.apk",
+        "children": [{
+            "n": "lib",
+            "children": [{
+                "n": "libapp.so (Dart AOT)",
+                "children": [
+                    {"n": "package:my_app", "children": [
+                        {"n": "core", "children": [{"n": "a.dart", "value": 300}, {"n": "b.dart", "value": 200}]},
+                        {"n": "main.dart", "value": 50},
+                    ]},
+                    {"n": "package:dio", "value": 4000},
+                    {"n": "dart:core", "children": [{"n": "list", "value": 900}]},
+                ],
+            }],
+        }],
+    }
+    assert attribute_size(analysis, "my_app") == {
+        "my_app/core": 500,
+        "my_app/main.dart": 50,
+        "package:dio": 4000,
+        "dart:core": 900,
+    }
+
+
+def test_minimal_preset_covers_generated_imports(tmp_path):
+    for login in (False, True):
+        lib = tmp_path / str(login) / "lib"
+        generate_files(lib, login, "my_app", config=FlutteratorConfig(perf_instrumentation=True))
+
+        imported = set(scan_package_imports(lib)) - {"my_app", "flutter"}
+        minimal = set(main_dependencies_for(login, minimal=True))
+        assert imported <= minimal
+        assert minimal < set(main_dependencies_for(login))
+    assert "another_flushbar" not in main_dependencies_for(False, minimal=True)
+    assert "font_awesome_flutter" not in main_dependencies_for(True, minimal=True)
+
+
+def test_missing_dependencies_reads_pubspec(tmp_path):
+    (tmp_path / "pubspec.yaml").write_text(PUBSPEC)
+    assert missing_dependencies(tmp_path, ["dio", *FORM_DEPENDENCIES]) == FORM_DEPENDENCIES
@@ -0,0 +1,86 @@
+"""Tests for the `create --skeleton-cache` project skeletons."""
+
+import os
+
+import pytest
+
+from generators.helpers.manifest import UNCHANGED, close_manifests, manifest_at
+from generators.helpers.skeleton import (
+    SKELETON_NAME,
+    find_skeleton,
+    materialize_skeleton,
+    name_variants,
+    skeleton_build,
+)
+from generators.templates.copier import generate_file
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("FLUTTERATOR_CACHE_DIR", str(tmp_path / "cache"))
+    return tmp_path / "cache" / "skeletons"
+
+
+def _fake_flutter_create(project):
+    """The files of `flutter create` that carry the project name."""
+    (project / "lib").mkdir(parents=True)
+    (project / "pubspec.yaml").write_text(f"name: {SKELETON_NAME}\ndescription: A new Flutter project.\n")
+    kotlin = project / "android/app/src/main/kotlin/com/example" / SKELETON_NAME
+    kotlin.mkdir(parents=True)
+    (kotlin / "MainActivity.kt").write_text(f"package com.example.{SKELETON_NAME}\n")
+    (project / "ios/Runner").mkdir(parents=True)
+    (project / "ios/Runner/Info.plist").write_text(
+        "<string>Flutterator Skeleton App</string>\n<string>com.example.flutteratorSkeletonApp</string>\n"
+    )
+    (project / "assets").mkdir()
+    (project / "assets/logo.png").write_bytes(b"\x89PNG\r\n\x1a\n" + SKELETON_NAME.encode() + b"\xff\xfe")
+    (project / ".dart_tool").mkdir()
+    (project / ".dart_tool/package_config.json").write_text("{}")
+
+
+def test_name_variants():
+    assert name_variants("my_cool_app") == {
+        "snake": "my_cool_app",
+        "camel": "myCoolApp",
+        "pascal": "MyCoolApp",
+        "title": "My Cool App",
+    }
+
+
+def test_skeleton_is_cached_and_renamed(tmp_path, cache_dir):
+    cwd = os.getcwd()
+    with skeleton_build("abc123") as staging:
+        assert os.getcwd() == str(staging)
+        _fake_flutter_create(staging / SKELETON_NAME)
+        generate_file(SKELETON_NAME, staging / SKELETON_NAME / "lib", "feature/feature_entity_template.jinja", "todo.dart", {"feature_name": "Todo"})
+    assert os.getcwd() == cwd
+
+    skeleton = find_skeleton("abc123")
+    assert skeleton == cache_dir / "abc123" / SKELETON_NAME
+    assert not (skeleton / ".dart_tool").exists()
+    assert [p.name for p in cache_dir.iterdir()] == ["abc123"]
+
+    project = tmp_path / "my_app"
+    assert materialize_skeleton(skeleton, project, "my_app") == 4
+    assert (project / "pubspec.yaml").read_text().startswith("name: my_app\n")
+    assert (project / "android/app/src/main/kotlin/com/example/my_app/MainActivity.kt").read_text() == "package com.example.my_app\n"
+    assert (project / "ios/Runner/Info.plist").read_text() == "<string>My App</string>\n<string>com.example.myApp</string>\n"
+    # Binary files are copied untouched
+    assert (project / "assets/logo.png").read_bytes() == (skeleton / "assets/logo.png").read_bytes()
+    assert "package:my_app/" in (project / "lib/todo.dart").read_text()
+
+    # The rewritten generated file is not reported as hand-edited
+    close_manifests()
+    manifest = manifest_at(project)
+    assert manifest.file_status("lib/todo.dart") == UNCHANGED
+    assert manifest.get("lib/todo.dart")["input_hash"] == ""
+
+
+def test_failed_build_is_not_cached(cache_dir):
+    cwd = os.getcwd()
+    with pytest.raises(RuntimeError):
+        with skeleton_build("broken"):
+            raise RuntimeError("flutter create failed")
+    assert os.getcwd() == cwd
+    assert find_skeleton("broken") is None
+    assert not any(p.name.startswith(".build-") for p in cache_dir.iterdir())
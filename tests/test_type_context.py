@@ -0,0 +1,48 @@
+"""Tests for the memoized TypeResolutionContext used by field validation."""
+
+from generators.helpers.profiling import FsProfile
+from generators.helpers.type_context import TypeResolutionContext
+from generators.helpers.utils import map_field_type_to_dto
+from generators.helpers.validation import validate_field_type
+
+
+def _write_domain(lib):
+    (lib / "domain" / "author" / "model").mkdir(parents=True)
+    (lib / "domain" / "author" / "model" / "author.dart").write_text(
+        "@freezed\nabstract class Author with _$Author {\n  const factory Author() = _Author;\n}\n"
+    )
+    (lib / "domain" / "enums").mkdir(parents=True)
+    (lib / "domain" / "enums" / "status.dart").write_text("enum Status { draft, published }\n")
+
+
+def test_context_scans_domain_once(tmp_path):
+    lib = tmp_path / "lib"
+    _write_domain(lib)
+    context = TypeResolutionContext(lib)
+    assert validate_field_type("Author", lib, context=context)[0]
+
+    with FsProfile() as profile:
+        for field_type in ["Author", "List<Author>", "Author?", "Status", "string"] * 20:
+            assert validate_field_type(field_type, lib, context=context)[0]
+    assert profile.listing_calls == 0 and profile.counts["open"] == 0
+
+    context.refresh()
+    with FsProfile() as profile:
+        assert context.model_class_name("author") == "Author"
+    assert profile.listing_calls > 0
+
+
+def test_context_lookups(tmp_path):
+    lib = tmp_path / "lib"
+    _write_domain(lib)
+    context = TypeResolutionContext(lib)
+
+    assert context.class_to_stem == {"Author": "author"}
+    assert context.model_info("Author")[0] == "author"
+    assert context.is_enum("Status")
+    assert context.is_domain_model("Author")
+    assert not context.is_domain_model("Status")
+    assert not context.is_domain_model("UniqueId")
+    assert map_field_type_to_dto("List<Status>?", context=context) == "List<String>?"
+    assert map_field_type_to_dto("List<Author>", context=context) == "List<AuthorDto>"
+    assert not validate_field_type("Missing", lib, context=context)[0]